@@ -0,0 +1,616 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Asyncio flavour of the Coriolis client.
+
+The managers exposed by `AsyncClient` are the ones exposed by
+`coriolisclient.client.Client`, with every method which talks to the API
+returning a coroutine. All requests go through a single `aiohttp` session,
+sharing one connection pool and the token of the given Keystone session.
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import ssl
+
+import aiohttp
+from keystoneauth1 import exceptions as keystoneauth_exceptions
+
+from coriolisclient import base
+from coriolisclient import bulk
+from coriolisclient import client
+from coriolisclient import polling
+from coriolisclient import ratelimit
+from coriolisclient import utils
+from coriolisclient.v1 import common
+from coriolisclient.v1 import diagnostics
+from coriolisclient.v1 import endpoint_destination_minion_pool_options
+from coriolisclient.v1 import endpoint_destination_options
+from coriolisclient.v1 import endpoint_instances
+from coriolisclient.v1 import endpoint_networks
+from coriolisclient.v1 import endpoint_source_minion_pool_options
+from coriolisclient.v1 import endpoint_source_options
+from coriolisclient.v1 import endpoint_storage
+from coriolisclient.v1 import endpoints
+from coriolisclient.v1 import migrations
+from coriolisclient.v1 import minion_pools
+from coriolisclient.v1 import providers
+from coriolisclient.v1 import regions
+from coriolisclient.v1 import replica_executions
+from coriolisclient.v1 import replica_schedules
+from coriolisclient.v1 import replicas
+from coriolisclient.v1 import services
+
+
+LOG = logging.getLogger(__name__)
+
+_DEFAULT_POOL_SIZE = 100
+# NOTE: tokens expiring within this many seconds get refreshed ahead of
+# time, from an executor, so as to never block the event loop on Keystone:
+_TOKEN_EXPIRY_WINDOW = 30
+
+
+class _AsyncResponse(object):
+    """Fully read response exposing the `requests.Response` bits we use."""
+
+    def __init__(self, status_code, headers, content):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', 'replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class _AsyncHTTPClient(object):
+    def __init__(self, session=None, pool_size=_DEFAULT_POOL_SIZE,
+                 timeout=None, **kwargs):
+        # NOTE: the synchronous adapter is only used for endpoint discovery
+        # so that both clients resolve the exact same Coriolis endpoint:
+        self._adapter = client._HTTPClient(session=session, **kwargs)
+        self._session = session
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._endpoint_url = None
+        self._http_session = None
+        self._auth_lock = None
+
+    async def _run_in_executor(self, func, *args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def _get_endpoint_url(self):
+        if self._endpoint_url is None:
+            endpoint_url = self._adapter.endpoint_override
+            if not endpoint_url:
+                endpoint_url = await self._run_in_executor(
+                    self._adapter.get_endpoint)
+            if not endpoint_url:
+                raise keystoneauth_exceptions.EndpointNotFound()
+            self._endpoint_url = endpoint_url.rstrip('/')
+        return self._endpoint_url
+
+    async def _get_auth_headers(self):
+        if self._session is None or self._session.auth is None:
+            return {}
+
+        auth_ref = getattr(self._session.auth, 'auth_ref', False)
+        if auth_ref is False or (
+                auth_ref is not None and
+                not auth_ref.will_expire_soon(_TOKEN_EXPIRY_WINDOW)):
+            # NOTE: the plugin either has no notion of expiry or already
+            # holds a valid token, so no request to Keystone will be made:
+            return self._session.get_auth_headers()
+
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            return await self._run_in_executor(
+                self._session.get_auth_headers)
+
+    def _get_http_session(self):
+        if self._http_session is None or self._http_session.closed:
+            verify = getattr(self._session, 'verify', True)
+            if isinstance(verify, str):
+                ssl_context = ssl.create_default_context(cafile=verify)
+            else:
+                ssl_context = bool(verify)
+            timeout = aiohttp.ClientTimeout(total=self._timeout)
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self._pool_size, ssl=ssl_context),
+                timeout=timeout)
+        return self._http_session
+
+    async def request(self, url, method, headers=None, **kwargs):
+        body = kwargs.pop('json', None)
+        endpoint_url = await self._get_endpoint_url()
+        full_url = '%s/%s' % (endpoint_url, url.lstrip('/'))
+
+        req_headers = {'Accept': 'application/json'}
+        req_headers.update(await self._get_auth_headers())
+        if headers:
+            req_headers.update(headers)
+        if body is not None:
+            req_headers['Content-Type'] = 'application/json'
+            kwargs['data'] = json.dumps(body)
+
+        http_session = self._get_http_session()
+        try:
+            async with http_session.request(
+                    method, full_url, headers=req_headers,
+                    **kwargs) as resp:
+                content = await resp.read()
+                response = _AsyncResponse(resp.status, resp.headers, content)
+        except asyncio.TimeoutError as ex:
+            raise keystoneauth_exceptions.ConnectTimeout(
+                "Request to %s timed out: %s" % (full_url, ex))
+        except aiohttp.ClientConnectionError as ex:
+            raise keystoneauth_exceptions.ConnectFailure(
+                "Unable to establish connection to %s: %s" % (full_url, ex))
+
+        if not response.ok:
+            raise keystoneauth_exceptions.from_response(
+                response, method, full_url)
+        return response
+
+    async def get(self, url, **kwargs):
+        return await self.request(url, 'GET', **kwargs)
+
+    async def post(self, url, **kwargs):
+        return await self.request(url, 'POST', **kwargs)
+
+    async def put(self, url, **kwargs):
+        return await self.request(url, 'PUT', **kwargs)
+
+    async def patch(self, url, **kwargs):
+        return await self.request(url, 'PATCH', **kwargs)
+
+    async def delete(self, url, **kwargs):
+        return await self.request(url, 'DELETE', **kwargs)
+
+    async def close(self):
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
+
+class AsyncManagerMixin(object):
+    """Turns the request helpers of `base.BaseManager` into coroutines.
+
+    Manager methods which simply return the result of one of the helpers
+    thus return coroutines as well, the others are overridden below.
+    Resources are always built as loaded since lazy loading cannot be
+    awaited from within attribute access, and reading details missing from
+    listed resources raises `exceptions.LazyLoadingNotSupported`.
+    """
+
+    lazy_loading = False
+
+    async def get_many(self, items, max_workers=bulk.DEFAULT_MAX_WORKERS):
+        self._check_get_many()
+        return await bulk.run_bulk_async(
+            self._get_bulk_item, items, max_workers=max_workers)
+
+    @base.wrap_unauthorized_exception
+    async def _list(self, url, response_key=None, obj_class=None, json=None,
+                    values_key='values'):
+        if json:
+            resp = await self.client.post(url, json=json)
+        else:
+            resp = await self.client.get(url)
+
+        return self._list_from_body(
+            resp.json(), response_key=response_key, obj_class=obj_class,
+            values_key=values_key)
+
+    async def _list_iter(self, url, response_key=None, obj_class=None):
+        # NOTE: the asyncio transport reads bodies whole, so this only
+        # provides the same interface as the streaming synchronous version:
+        for res in await self._list(
+                url, response_key=response_key, obj_class=obj_class):
+            yield res
+
+    @base.wrap_unauthorized_exception
+    async def _get(self, url, response_key=None):
+        body = await self._get_json(url)
+        data = body[response_key] if response_key is not None else body
+        return self.resource_class(self, data, loaded=True)
+
+    @base.wrap_unauthorized_exception
+    async def _get_json(self, url):
+        return (await self.client.get(url)).json()
+
+    async def _get_infos_by_id(self, items, url, response_key):
+        infos = {}
+        for item in items:
+            if isinstance(item, (base.Resource, base.CompactResource)):
+                infos[base.getid(item)] = item._info
+        if len(infos) < len(items):
+            for info in (await self._get_json(url)).get(response_key, []):
+                infos.setdefault(info.get('id'), info)
+        return infos
+
+    @base.wrap_unauthorized_exception
+    async def _post(self, url, json, response_key=None, return_raw=False):
+        body = (await self.client.post(url, json=json)).json()
+        data = body[response_key] if response_key is not None else body
+        if return_raw:
+            return data
+        return self.resource_class(self, data, loaded=True)
+
+    @base.wrap_unauthorized_exception
+    async def _put(self, url, json=None, response_key=None):
+        resp = await self.client.put(url, json=json)
+        # PUT requests may not return a body
+        if resp.content:
+            body = resp.json()
+            if response_key is not None:
+                body = body[response_key]
+            return self.resource_class(self, body, loaded=True)
+
+    @base.wrap_unauthorized_exception
+    async def _patch(self, url, json=None, response_key=None):
+        body = (await self.client.patch(url, json=json)).json()
+        if response_key is not None:
+            body = body[response_key]
+        return self.resource_class(self, body, loaded=True)
+
+    @base.wrap_unauthorized_exception
+    async def _delete(self, url):
+        return await self.client.delete(url)
+
+
+class AsyncEndpointManager(AsyncManagerMixin, endpoints.EndpointManager):
+
+    async def validate_connection(self, endpoint):
+        resp = await self.client.post(
+            '/endpoints/%s/actions' % base.getid(endpoint),
+            json={'validate-connection': None})
+        validate_data = resp.json()["validate-connection"]
+        return validate_data.get("valid"), validate_data.get("message")
+
+    async def get_endpoint_id_for_name(self, endpoint):
+        if utils.validate_uuid_string(endpoint):
+            return endpoint
+        return self._match_endpoint_id_for_name(await self.list(), endpoint)
+
+
+class AsyncEndpointInstanceManager(
+        AsyncManagerMixin, endpoint_instances.EndpointInstanceManager):
+
+    async def list_iter(
+            self, endpoint, env=None, marker=None,
+            limit=endpoint_instances.DEFAULT_PAGE_SIZE, name=None):
+        if not limit or limit < 1:
+            raise ValueError("'limit' must be a positive page size")
+
+        next_page = asyncio.ensure_future(
+            self.list(endpoint, env, marker, limit, name))
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                if len(page) >= limit:
+                    next_page = asyncio.ensure_future(self.list(
+                        endpoint, env, page[-1].id, limit, name))
+                for instance in page:
+                    yield instance
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+
+class AsyncEndpointNetworkManager(
+        AsyncManagerMixin, endpoint_networks.EndpointNetworkManager):
+    pass
+
+
+class AsyncEndpointDestinationOptionsManager(
+        AsyncManagerMixin,
+        endpoint_destination_options.EndpointDestinationOptionsManager):
+    pass
+
+
+class AsyncEndpointSourceMinionPoolOptionsManager(
+        AsyncManagerMixin,
+        endpoint_source_minion_pool_options.
+        EndpointSourceMinionPoolOptionsManager):
+    pass
+
+
+class AsyncEndpointDestinationMinionPoolOptionsManager(
+        AsyncManagerMixin,
+        endpoint_destination_minion_pool_options.
+        EndpointDestinationMinionPoolOptionsManager):
+    pass
+
+
+class AsyncEndpointSourceOptionsManager(
+        AsyncManagerMixin,
+        endpoint_source_options.EndpointSourceOptionsManager):
+    pass
+
+
+class AsyncEndpointStorageManager(
+        AsyncManagerMixin, endpoint_storage.EndpointStorageManager):
+
+    async def get_default(self, endpoint, environment=None):
+        url = '/endpoints/%s/storage' % base.getid(endpoint)
+
+        if environment:
+            encoded_env = common.encode_base64_param(
+                environment, is_json=True)
+            url = '%s?env=%s' % (url, encoded_env)
+
+        storage = await self._get(url, 'storage')
+        return storage.to_dict().get('config_default')
+
+
+class AsyncMigrationManager(AsyncManagerMixin, migrations.MigrationManager):
+
+    async def wait_for(self, migration, timeout=None, cancel_event=None,
+                       min_interval=polling.DEFAULT_MIN_INTERVAL,
+                       max_interval=polling.DEFAULT_MAX_INTERVAL):
+        return await polling.wait_for_async(
+            functools.partial(self.get, migration),
+            self.get_waiter(timeout, min_interval, max_interval),
+            cancel_event=cancel_event)
+
+    async def watch(self, migrations, timeout=None, cancel_event=None,
+                    min_interval=polling.DEFAULT_MIN_INTERVAL,
+                    max_interval=polling.DEFAULT_MAX_INTERVAL):
+        async for change in polling.watch_async(
+                self.list, [base.getid(r) for r in migrations],
+                self.get_waiter(timeout, min_interval, max_interval),
+                cancel_event=cancel_event):
+            yield change
+
+    async def cancel(self, migration, force=False):
+        return await self.client.post(
+            '/migrations/%s/actions' % base.getid(migration),
+            json={'cancel': {'force': force}})
+
+    async def deploy_many(self, replicas, clone_disks=True, force=False,
+                          skip_os_morphing=False, user_scripts=None,
+                          instance_osmorphing_minion_pool_mappings=None,
+                          max_running=None, timeout=None, cancel_event=None,
+                          min_interval=polling.DEFAULT_MIN_INTERVAL,
+                          max_interval=polling.DEFAULT_MAX_INTERVAL):
+        replicas = list(replicas)
+        scheduler = self._get_scheduler(
+            await self._get_infos_by_id(replicas, '/replicas', 'replicas'),
+            await self._get_json('/minion_pools'), clone_disks, force,
+            skip_os_morphing, user_scripts,
+            instance_osmorphing_minion_pool_mappings, max_running,
+            self.get_waiter(timeout, min_interval, max_interval))
+        async for _, result in scheduler.run_async(
+                replicas, cancel_event=cancel_event):
+            yield result
+
+
+class AsyncMinionPoolManager(
+        AsyncManagerMixin, minion_pools.MinionPoolManager):
+
+    async def wait_for(self, minion_pool, timeout=None, cancel_event=None,
+                       min_interval=polling.DEFAULT_MIN_INTERVAL,
+                       max_interval=polling.DEFAULT_MAX_INTERVAL):
+        return await polling.wait_for_async(
+            functools.partial(self.get, minion_pool),
+            self.get_waiter(timeout, min_interval, max_interval),
+            cancel_event=cancel_event)
+
+    async def watch(self, minion_pools, timeout=None, cancel_event=None,
+                    min_interval=polling.DEFAULT_MIN_INTERVAL,
+                    max_interval=polling.DEFAULT_MAX_INTERVAL):
+        async for change in polling.watch_async(
+                self.list, [base.getid(r) for r in minion_pools],
+                self.get_waiter(timeout, min_interval, max_interval),
+                cancel_event=cancel_event):
+            yield change
+
+
+class AsyncProvidersManager(AsyncManagerMixin, providers.ProvidersManager):
+    pass
+
+
+class AsyncReplicaManager(AsyncManagerMixin, replicas.ReplicaManager):
+
+    async def delete_disks(self, replica):
+        response = await self.client.post(
+            '/replicas/%s/actions' % base.getid(replica),
+            json={'delete-disks': None})
+
+        return replica_executions.ReplicaExecution(
+            self, response.json().get("execution"), loaded=True)
+
+    async def update(self, replica, updated_values):
+        data = {
+            "replica": updated_values
+        }
+        response = await self.client.put(
+            '/replicas/%s' % base.getid(replica), json=data)
+
+        return replica_executions.ReplicaExecution(
+            self, response.json().get("execution"), loaded=True)
+
+    async def create_many(self, replicas,
+                          max_workers=bulk.DEFAULT_MAX_WORKERS,
+                          requests_per_second=None):
+        endpoint_ids = await self._resolve_endpoint_names(replicas)
+        bucket = None
+        if requests_per_second:
+            bucket = ratelimit.TokenBucket(requests_per_second)
+
+        async def _create(kwargs):
+            kwargs = self._get_create_kwargs(kwargs, endpoint_ids)
+            if bucket is not None:
+                await asyncio.sleep(bucket.reserve())
+            return await self.create(**kwargs)
+
+        return await bulk.run_bulk_async(
+            _create, replicas, max_workers=max_workers)
+
+    async def _resolve_endpoint_names(self, replicas):
+        endpoint_ids = {}
+        for endpoint in self._get_endpoint_names(replicas):
+            try:
+                endpoint_ids[endpoint] = (
+                    await self._endpoint_manager.get_endpoint_id_for_name(
+                        endpoint))
+            except Exception as ex:
+                endpoint_ids[endpoint] = ex
+        return endpoint_ids
+
+
+class AsyncReplicaScheduleManager(
+        AsyncManagerMixin, replica_schedules.ReplicaScheduleManager):
+    pass
+
+
+class AsyncReplicaExecutionManager(
+        AsyncManagerMixin, replica_executions.ReplicaExecutionManager):
+
+    async def wait_for(self, replica, execution, timeout=None,
+                       cancel_event=None,
+                       min_interval=polling.DEFAULT_MIN_INTERVAL,
+                       max_interval=polling.DEFAULT_MAX_INTERVAL):
+        return await polling.wait_for_async(
+            functools.partial(self.get, replica, execution),
+            self.get_waiter(timeout, min_interval, max_interval),
+            cancel_event=cancel_event)
+
+    async def list_all(self):
+        return self._list_all_from_body(
+            await self._get_json('/replicas/detail'))
+
+    async def watch(self, executions, timeout=None, cancel_event=None,
+                    min_interval=polling.DEFAULT_MIN_INTERVAL,
+                    max_interval=polling.DEFAULT_MAX_INTERVAL):
+        async for change in polling.watch_async(
+                self.list_all, [base.getid(r) for r in executions],
+                self.get_waiter(timeout, min_interval, max_interval),
+                cancel_event=cancel_event):
+            yield change
+
+    async def cancel(self, replica, execution, force=False):
+        return await self.client.post(
+            '/replicas/%(replica_id)s/executions/%(execution_id)s/actions' %
+            {"replica_id": base.getid(replica),
+             "execution_id": base.getid(execution)},
+            json={'cancel': {'force': force}})
+
+    async def execute_many(self, replicas, max_running=None,
+                           max_per_origin_endpoint=None,
+                           max_per_destination_endpoint=None,
+                           max_per_minion_pool=None, shutdown_instances=False,
+                           timeout=None, cancel_event=None,
+                           min_interval=polling.DEFAULT_MIN_INTERVAL,
+                           max_interval=polling.DEFAULT_MAX_INTERVAL):
+        replicas = list(replicas)
+        scheduler = self._get_scheduler(
+            await self._get_infos_by_id(replicas, '/replicas', 'replicas'),
+            max_running, max_per_origin_endpoint,
+            max_per_destination_endpoint, max_per_minion_pool,
+            shutdown_instances,
+            self.get_waiter(timeout, min_interval, max_interval))
+        async for _, result in scheduler.run_async(
+                replicas, cancel_event=cancel_event):
+            yield result
+
+
+class AsyncRegionManager(AsyncManagerMixin, regions.RegionManager):
+
+    async def get_region_by_name_or_id(
+            self, region_name_or_id, regions_cache=None,
+            raise_on_not_found=True):
+        if not regions_cache:
+            regions_cache = await self.list()
+        return self._match_region_by_name_or_id(
+            regions_cache, region_name_or_id,
+            raise_on_not_found=raise_on_not_found)
+
+
+class AsyncServiceManager(AsyncManagerMixin, services.ServiceManager):
+
+    async def find_service_by_host_and_topic(self, host, topic):
+        return self._match_service_by_host_and_topic(
+            await self.list(), host, topic)
+
+
+class AsyncDiagnosticsManager(
+        AsyncManagerMixin, diagnostics.DiagnosticsManager):
+    pass
+
+
+class AsyncClient(object):
+    """Coriolis client whose managers' API calls are coroutines.
+
+    Must be closed after use, either through `close()` or by using it as
+    an asynchronous context manager:
+
+        async with AsyncClient(session=sess) as coriolis:
+            replicas = await coriolis.replicas.list()
+
+    :param pool_size: maximum number of simultaneously open connections
+    :param timeout: total timeout in seconds for each request
+    """
+
+    def __init__(self, session=None, *args, **kwargs):
+        httpclient = _AsyncHTTPClient(session=session, *args, **kwargs)
+        self._httpclient = httpclient
+
+        self.endpoints = AsyncEndpointManager(httpclient)
+        self.endpoint_instances = AsyncEndpointInstanceManager(httpclient)
+        self.endpoint_networks = AsyncEndpointNetworkManager(httpclient)
+        self.endpoint_destination_options = (
+            AsyncEndpointDestinationOptionsManager(httpclient))
+        self.endpoint_source_minion_pool_options = (
+            AsyncEndpointSourceMinionPoolOptionsManager(httpclient))
+        self.endpoint_destination_minion_pool_options = (
+            AsyncEndpointDestinationMinionPoolOptionsManager(httpclient))
+        self.endpoint_source_options = AsyncEndpointSourceOptionsManager(
+            httpclient)
+        self.endpoint_storage = AsyncEndpointStorageManager(httpclient)
+        self.migrations = AsyncMigrationManager(httpclient)
+        self.minion_pools = AsyncMinionPoolManager(httpclient)
+        self.providers = AsyncProvidersManager(httpclient)
+        self.replicas = AsyncReplicaManager(
+            httpclient, endpoint_manager=self.endpoints)
+        self.replica_schedules = AsyncReplicaScheduleManager(httpclient)
+        self.replica_executions = AsyncReplicaExecutionManager(httpclient)
+        self.regions = AsyncRegionManager(httpclient)
+        self.services = AsyncServiceManager(httpclient)
+        self.diagnostics = AsyncDiagnosticsManager(httpclient)
+
+    async def close(self):
+        await self._httpclient.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -17,20 +17,60 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import collections
 import copy
+import inspect
 import logging
+import threading
 import traceback
+import types
 
 import six
 
 from keystoneauth1 import exceptions as keystoneauth_exceptions
-from oslo_utils import strutils
 
+from coriolisclient import bulk
+from coriolisclient import cache
 from coriolisclient import exceptions
+from coriolisclient import streaming
 
 
 LOG = logging.getLogger(__name__)
 
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_LAZY_LOADS = collections.Counter()
+_LAZY_LOADS_LOCK = threading.Lock()
+
+
+def _to_slug(name):
+    # NOTE: strutils compiles many regexes when imported, so it only gets
+    # imported when a human ID is actually needed:
+    from oslo_utils import strutils
+    return strutils.to_slug(name)
+
+
+def get_lazy_load_counts():
+    """Returns the number of lazy loads issued so far, per resource type.
+
+    Each lazy load is a GET request implicitly issued when accessing an
+    attribute missing from a resource which was not fully loaded.
+    """
+    with _LAZY_LOADS_LOCK:
+        return dict(_LAZY_LOADS)
+
+
+def reset_lazy_load_counts():
+    with _LAZY_LOADS_LOCK:
+        _LAZY_LOADS.clear()
+
+
+def _count_lazy_load(resource):
+    name = type(resource).__name__
+    with _LAZY_LOADS_LOCK:
+        _LAZY_LOADS[name] += 1
+    LOG.debug("Lazy loading %s '%s'", name, resource._info.get('id'))
+
 
 def getid(obj, possible_fields=["uuid", "id"]):
     """Return id if argument is a Resource.
@@ -40,26 +80,53 @@ def getid(obj, possible_fields=["uuid", "id"]):
     if not possible_fields:
         possible_fields = ["id"]
 
+    if isinstance(obj, (Resource, CompactResource)):
+        # NOTE: never go through `__getattr__`, as probing for a missing
+        # field would lazy load the whole resource:
+        for key in possible_fields:
+            if key in obj._info:
+                return obj._info[key]
+        return obj
+
     for key in possible_fields:
         if hasattr(obj, key):
             return getattr(obj, key)
     return obj
 
 
+def _raise_auth_error(ex):
+    LOG.exception(traceback.format_exc())
+    raise exceptions.HTTPAuthError(
+        "Failed to authorize Keystone session. Please recheck "
+        "credentials. The error message received from Keystone was: "
+        "%s" % str(ex))
+
+
 def wrap_unauthorized_exception(func):
+    if inspect.iscoroutinefunction(func):
+        async def async_wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except keystoneauth_exceptions.http.Unauthorized as ex:
+                _raise_auth_error(ex)
+
+        return async_wrapper
+
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
         except keystoneauth_exceptions.http.Unauthorized as ex:
-            LOG.exception(traceback.format_exc())
-            raise exceptions.HTTPAuthError(
-                "Failed to authorize Keystone session. Please recheck "
-                "credentials. The error message received from Keystone was: "
-                "%s" % str(ex))
+            _raise_auth_error(ex)
 
     return wrapper
 
 
+def _check_lazy_loading(resource, key):
+    if not getattr(resource.manager, 'lazy_loading', True):
+        raise exceptions.LazyLoadingNotSupported(
+            resource.__class__.__name__, key)
+
+
 class Resource(object):
     """Base class for OpenStack resources (tenant, user, etc.).
 
@@ -68,6 +135,8 @@ class Resource(object):
 
     HUMAN_ID = False
     NAME_ATTR = 'name'
+    # NOTE: whether the full representation was already fetched:
+    _fetched = False
 
     def __init__(self, manager, info, loaded=False):
         """Populate and bind to a manager.
@@ -94,20 +163,27 @@ class Resource(object):
         if self.HUMAN_ID:
             name = getattr(self, self.NAME_ATTR, None)
             if name is not None:
-                return strutils.to_slug(name)
+                return _to_slug(name)
         return None
 
     def _add_details(self, info):
         for (k, v) in six.iteritems(info):
+            # NOTE: always keep the detail, as properties shadowing it (e.g.
+            # `tasks`) read it from `_info`:
+            self._info[k] = v
             try:
                 setattr(self, k, v)
-                self._info[k] = v
             except AttributeError:
                 # In this case we already defined the attribute on the class
                 pass
 
     def __getattr__(self, k):
         if k not in self.__dict__:
+            # NOTE: private and special names are never part of the API
+            # data, and probing them (e.g. `copy` looking up
+            # '__deepcopy__') must not lazy load the resource:
+            if k.startswith('_'):
+                raise AttributeError(k)
             # NOTE(bcwaldon): disallow lazy-loading if already loaded once
             if not self.is_loaded():
                 self.get()
@@ -125,13 +201,35 @@ class Resource(object):
         """
         # set_loaded() first ... so if we have to bail, we know we tried.
         self.set_loaded(True)
+        self._fetched = True
         if not hasattr(self.manager, 'get'):
             return
 
-        new = self.manager.get(self.id)
+        _count_lazy_load(self)
+        new = self._fetch()
         if new:
             self._add_details(new._info)
 
+    def _fetch(self):
+        """Returns the full representation of this resource."""
+        return self.manager.get(self.id)
+
+    def _get_detail(self, key):
+        """Returns a detail which may be missing from partial listings.
+
+        The resource is fetched at most once, so details which are missing
+        from its full representation as well do not trigger further
+        requests.
+        """
+        if self._info.get(key) is None and not self._fetched:
+            _check_lazy_loading(self, key)
+            self.get()
+        return self._info.get(key)
+
+    def _nested_resource(self, resource_class, info):
+        """Builds a resource out of one of the details of this resource."""
+        return resource_class(None, info, loaded=True)
+
     def __eq__(self, other):
         if not isinstance(other, Resource):
             return NotImplemented
@@ -150,12 +248,156 @@ class Resource(object):
         return copy.deepcopy(self._info)
 
 
+class CompactResource(object):
+    """Memory-lean counterpart of `Resource`.
+
+    Attributes are read straight from `_info` instead of being copied into
+    the instance, which has no `__dict__` at all. `to_dict()` returns a
+    read-only view of `_info` instead of a deep copy.
+    Use `compact_resource_class()` to get the compact flavour of a given
+    `Resource` subclass.
+    """
+
+    __slots__ = ('manager', '_info', '_loaded', '_fetched')
+
+    HUMAN_ID = False
+    NAME_ATTR = 'name'
+    # NOTE: the `Resource` subclass this class is the compact flavour of:
+    _resource_class = None
+
+    def __init__(self, manager, info, loaded=False):
+        self.manager = manager
+        self._info = info
+        self._loaded = loaded
+        self._fetched = False
+
+    def __reduce__(self):
+        return (_rebuild_compact_resource,
+                (self._resource_class or type(self), self.manager,
+                 self._info, self._loaded))
+
+    def __repr__(self):
+        info = ", ".join(
+            "%s=%s" % (k, self._info[k])
+            for k in sorted(self._info) if k[0] != '_')
+        return "<%s %s>" % (self.__class__.__name__, info)
+
+    @property
+    def human_id(self):
+        """Human-readable ID which can be used for bash completion."""
+        if self.HUMAN_ID:
+            name = getattr(self, self.NAME_ATTR, None)
+            if name is not None:
+                return _to_slug(name)
+        return None
+
+    def __getattr__(self, k):
+        # NOTE: private and special names are never part of the API
+        # data, and '_info' itself is missing while unpickling:
+        if k.startswith('_'):
+            raise AttributeError(k)
+        try:
+            return self._info[k]
+        except KeyError:
+            pass
+        if not self._loaded:
+            self.get()
+            return self.__getattr__(k)
+        raise AttributeError(k)
+
+    def _add_details(self, info):
+        self._info.update(info)
+
+    def get(self):
+        """Support for lazy loading details."""
+        self._loaded = True
+        self._fetched = True
+        if not hasattr(self.manager, 'get'):
+            return
+
+        _count_lazy_load(self)
+        new = self._fetch()
+        if new:
+            self._add_details(new._info)
+
+    def _fetch(self):
+        return self.manager.get(self.id)
+
+    def _get_detail(self, key):
+        if self._info.get(key) is None and not self._fetched:
+            _check_lazy_loading(self, key)
+            self.get()
+        return self._info.get(key)
+
+    def _nested_resource(self, resource_class, info):
+        # NOTE: nested resources (e.g. tasks) are compact as well:
+        return compact_resource_class(resource_class)(None, info, loaded=True)
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactResource):
+            return NotImplemented
+        if not isinstance(other, self.__class__):
+            return False
+        return self._info == other._info
+
+    __hash__ = None
+
+    def is_loaded(self):
+        return self._loaded
+
+    def set_loaded(self, val):
+        self._loaded = val
+
+    def to_dict(self):
+        return types.MappingProxyType(self._info)
+
+
+_COMPACT_RESOURCE_CLASSES = {}
+_COMPACT_RESOURCE_CLASSES_LOCK = threading.Lock()
+_NON_COMPACT_ATTRS = ('__dict__', '__weakref__')
+
+
+def compact_resource_class(resource_class):
+    """Returns the `CompactResource` flavour of a `Resource` subclass.
+
+    The returned class holds all the properties and methods defined by
+    `resource_class` and its bases up to `Resource`.
+    """
+    if issubclass(resource_class, CompactResource):
+        return resource_class
+
+    with _COMPACT_RESOURCE_CLASSES_LOCK:
+        compact_class = _COMPACT_RESOURCE_CLASSES.get(resource_class)
+        if compact_class is None:
+            namespace = {}
+            for klass in reversed(resource_class.__mro__):
+                if not issubclass(klass, Resource) or klass is Resource:
+                    continue
+                namespace.update(
+                    (k, v) for (k, v) in vars(klass).items()
+                    if k not in _NON_COMPACT_ATTRS)
+            namespace['__slots__'] = ()
+            namespace['_resource_class'] = resource_class
+            compact_class = type(
+                resource_class.__name__, (CompactResource,), namespace)
+            _COMPACT_RESOURCE_CLASSES[resource_class] = compact_class
+        return compact_class
+
+
+def _rebuild_compact_resource(resource_class, manager, info, loaded):
+    return compact_resource_class(resource_class)(
+        manager, info, loaded=loaded)
+
+
 class BaseManager(object):
     """Basic manager type providing common operations.
     Managers interact with a particular type of API (servers, flavors, images,
     etc.) and provide CRUD operations for them.
     """
     resource_class = None
+    # NOTE: whether the resources may lazily fetch their missing details
+    # through the manager's get(), which must then return them directly:
+    lazy_loading = True
 
     def __init__(self, client):
         """Initializes BaseManager with `client`.
@@ -163,6 +405,47 @@ class BaseManager(object):
         """
         super(BaseManager, self).__init__()
         self.client = client
+        if (self.resource_class is not None and
+                getattr(client, 'compact_resources', False)):
+            self.resource_class = compact_resource_class(self.resource_class)
+
+    def get_many(self, items, max_workers=bulk.DEFAULT_MAX_WORKERS):
+        """Gets many objects concurrently.
+
+        :param items: objects or IDs to be passed to `get()`
+        :param max_workers: maximum number of simultaneous requests
+        :returns: list of `bulk.BulkResult` in the same order as `items`,
+            each holding either the fetched object or the raised error
+        :raises: TypeError if the manager cannot get objects one by one
+        """
+        self._check_get_many()
+        return bulk.run_bulk(
+            self._get_bulk_item, items, max_workers=max_workers)
+
+    def _check_get_many(self):
+        # NOTE: managers whose get() does not fetch an object by its ID
+        # set `_get_bulk_item` to None:
+        if getattr(self, 'get', None) is None or self._get_bulk_item is None:
+            raise TypeError(
+                "%s does not support get_many()" % self.__class__.__name__)
+
+    def _get_bulk_item(self, item):
+        return self.get(item)
+
+    def _get_infos_by_id(self, items, url, response_key):
+        """Maps the IDs of the given resources to their details.
+
+        Resources given by ID are all looked up with a single listing of
+        `url`, instead of getting each of them.
+        """
+        infos = {}
+        for item in items:
+            if isinstance(item, (Resource, CompactResource)):
+                infos[getid(item)] = item._info
+        if len(infos) < len(items):
+            for info in self._get_json(url).get(response_key, []):
+                infos.setdefault(info.get('id'), info)
+        return infos
 
     @wrap_unauthorized_exception
     def _list(self, url, response_key=None, obj_class=None, json=None,
@@ -180,8 +463,15 @@ class BaseManager(object):
         if json:
             body = self.client.post(url, json=json).json()
         else:
-            body = self.client.get(url).json()
+            body = self._get_json(url)
+
+        return self._list_from_body(
+            body, response_key=response_key, obj_class=obj_class,
+            values_key=values_key)
 
+    def _list_from_body(self, body, response_key=None, obj_class=None,
+                        values_key='values'):
+        """Builds the resources listed in an already decoded body."""
         if obj_class is None:
             obj_class = self.resource_class
 
@@ -195,6 +485,36 @@ class BaseManager(object):
 
         return [obj_class(self, res, loaded=True) for res in data if res]
 
+    def _list_iter(self, url, response_key=None, obj_class=None):
+        """Yields the objects of a collection as they are being received.
+
+        The response body is streamed and decoded one object at a time,
+        so memory use does not grow with the size of the collection.
+        :param url: a partial URL, e.g., '/servers'
+        :param response_key: the key of the list in the response body,
+            e.g., 'servers'. If response_key is None, the body itself
+            must be the list.
+        :param obj_class: class for constructing the returned objects
+            (self.resource_class will be used by default)
+        """
+        if obj_class is None:
+            obj_class = self.resource_class
+
+        try:
+            resp = self.client.get(url, stream=True)
+        except keystoneauth_exceptions.http.Unauthorized as ex:
+            _raise_auth_error(ex)
+
+        try:
+            chunks = resp.iter_content(chunk_size=_STREAM_CHUNK_SIZE)
+            for res in streaming.iter_json_array(
+                    chunks, key=response_key,
+                    encoding=resp.encoding or 'utf-8'):
+                if res:
+                    yield obj_class(self, res, loaded=True)
+        finally:
+            resp.close()
+
     @wrap_unauthorized_exception
     def _get(self, url, response_key=None):
         """Get an object from collection.
@@ -203,10 +523,38 @@ class BaseManager(object):
             e.g., 'server'. If response_key is None - all response body
             will be used.
         """
-        body = self.client.get(url).json()
+        body = self._get_json(url)
         data = body[response_key] if response_key is not None else body
         return self.resource_class(self, data, loaded=True)
 
+    def _get_json(self, url):
+        """GETs the given URL and returns its decoded body.
+
+        Goes through the client's response cache, if it has one. Cached
+        bodies are copied both ways, as resources write their lazily loaded
+        details into the body they were built from.
+        """
+        response_cache = getattr(self.client, 'response_cache', None)
+        if response_cache is None:
+            return self.client.get(url).json()
+
+        entry = response_cache.get(url)
+        headers = {}
+        if entry is not None:
+            if (not entry.has_validators and entry.is_fresh() and
+                    not cache.is_bypassed()):
+                return copy.deepcopy(entry.body)
+            headers = entry.get_validation_headers()
+
+        resp = self.client.get(url, headers=headers)
+        if entry is not None and resp.status_code == 304:
+            response_cache.touch(url)
+            return copy.deepcopy(entry.body)
+
+        body = resp.json()
+        response_cache.set(url, copy.deepcopy(body), resp.headers)
+        return body
+
     @wrap_unauthorized_exception
     def _post(self, url, json, response_key=None, return_raw=False):
         """Create an object.
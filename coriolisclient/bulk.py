@@ -0,0 +1,88 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers for issuing many API requests concurrently.
+"""
+
+import collections
+from concurrent import futures
+import logging
+
+
+LOG = logging.getLogger(__name__)
+
+# NOTE: matches the default connection pool size of `requests`, so that
+# no connection gets discarded after use:
+DEFAULT_MAX_WORKERS = 10
+
+BulkResult = collections.namedtuple('BulkResult', ['item', 'result', 'error'])
+BulkResult.__doc__ = """Outcome of a bulk operation on one item.
+
+Exactly one of `result` and `error` is set, `error` holding the exception
+raised while processing the item.
+"""
+
+
+def run_bulk(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """Calls `func` on each of the items over a bounded thread pool.
+
+    :param func: callable taking an item as its only argument
+    :param items: iterable of items to process
+    :param max_workers: maximum number of concurrent calls
+    :returns: list of `BulkResult`, in the same order as `items`
+    """
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be at least 1")
+
+    def _call(item):
+        try:
+            return BulkResult(item, func(item), None)
+        except Exception as ex:
+            LOG.debug("Bulk operation failed for '%s': %s", item, ex)
+            return BulkResult(item, None, ex)
+
+    items = list(items)
+    if not items:
+        return []
+
+    with futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(_call, items))
+
+
+async def run_bulk_async(func, items, max_workers=DEFAULT_MAX_WORKERS):
+    """Coroutine counterpart of `run_bulk()`.
+
+    :param func: coroutine function taking an item as its only argument,
+        at most `max_workers` calls being awaited at once
+    """
+    # NOTE: asyncio takes a while to import, and is only needed by the
+    # coroutines, which the synchronous callers never use:
+    import asyncio
+
+    if max_workers < 1:
+        raise ValueError("'max_workers' must be at least 1")
+    semaphore = asyncio.Semaphore(max_workers)
+
+    async def _call(item):
+        async with semaphore:
+            try:
+                return BulkResult(item, await func(item), None)
+            except Exception as ex:
+                LOG.debug("Bulk operation failed for '%s': %s", item, ex)
+                return BulkResult(item, None, ex)
+
+    return list(await asyncio.gather(*[_call(item) for item in items]))
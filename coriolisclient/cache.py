@@ -0,0 +1,219 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client-side cache of API responses.
+"""
+
+import collections
+import contextlib
+import threading
+import time
+
+
+DEFAULT_TTL = 10
+DEFAULT_MAX_ENTRIES = 256
+
+_local = threading.local()
+
+
+class CacheEntry(object):
+    def __init__(self, body, etag=None, last_modified=None, expires_at=0):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    @property
+    def has_validators(self):
+        return bool(self.etag or self.last_modified)
+
+    def is_fresh(self):
+        return time.monotonic() < self.expires_at
+
+    def get_validation_headers(self):
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+@contextlib.contextmanager
+def bypass():
+    """Makes the current thread's requests skip the unexpired responses.
+
+    Meant for polling, which would otherwise keep being served the same
+    response until it expires. Responses carrying validators are still
+    revalidated, and the new responses cached.
+    """
+    previous = is_bypassed()
+    _local.bypassed = True
+    try:
+        yield
+    finally:
+        _local.bypassed = previous
+
+
+def is_bypassed():
+    return getattr(_local, 'bypassed', False)
+
+
+def get_collection_prefix(url):
+    """Returns the top level collection of a relative URL.
+
+    For example, both '/replicas/detail' and '/replicas/<id>/executions'
+    belong to the '/replicas' collection.
+    """
+    return '/%s' % url.lstrip('/').split('?', 1)[0].split('/', 1)[0]
+
+
+class ResponseCache(object):
+    """LRU cache of decoded response bodies, keyed by relative URL.
+
+    Responses carrying an ETag or Last-Modified header are revalidated
+    through a conditional request on every access, the others are served
+    from the cache for `ttl` seconds. Cached bodies must not be modified,
+    callers having to copy them before building resources out of them.
+
+    :param ttl: seconds for which responses without validators are served
+        from the cache
+    :param max_entries: maximum number of cached responses, the least
+        recently used ones being evicted first
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, url):
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            return entry
+
+    def set(self, url, body, headers=None):
+        headers = headers or {}
+        entry = CacheEntry(
+            body, etag=headers.get('ETag'),
+            last_modified=headers.get('Last-Modified'),
+            expires_at=time.monotonic() + self._ttl)
+        with self._lock:
+            self._entries[url] = entry
+            self._entries.move_to_end(url)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def touch(self, url):
+        """Renews the TTL of a revalidated entry."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                entry.expires_at = time.monotonic() + self._ttl
+
+    def invalidate(self, url):
+        """Drops all entries of the collection the given URL belongs to."""
+        prefix = get_collection_prefix(url)
+        with self._lock:
+            for key in list(self._entries):
+                if get_collection_prefix(key) == prefix:
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def items(self):
+        with self._lock:
+            return list(self._entries.items())
+
+
+def build_lookup_tables(resources, key_funcs):
+    """Indexes resources by the keys returned by each of `key_funcs`.
+
+    :param resources: iterable of resources to index
+    :param key_funcs: dict of key functions by lookup table name
+    :returns: dict of lookup tables by name, each mapping keys to the list
+        of resources sharing that key
+    """
+    tables = {name: collections.defaultdict(list) for name in key_funcs}
+    for resource in resources:
+        for name, key_func in key_funcs.items():
+            tables[name][key_func(resource)].append(resource)
+    return {name: dict(table) for (name, table) in tables.items()}
+
+
+class ListingIndex(object):
+    """Lookup tables over a resource listing, shared between lookups.
+
+    The listing is fetched once and indexed into a dict per key function,
+    making each lookup a single hash lookup. It is fetched again after
+    `ttl` seconds, after `invalidate()` is called, or once on a lookup miss,
+    as the resource may have been created since.
+
+    :param list_func: callable returning the resources to index
+    :param key_funcs: dict of key functions by lookup table name
+    :param ttl: seconds for which the listing is reused
+    """
+
+    def __init__(self, list_func, key_funcs, ttl=DEFAULT_TTL):
+        self._list_func = list_func
+        self._key_funcs = key_funcs
+        self._ttl = ttl
+        self._tables = None
+        self._expires_at = 0
+        self._lock = threading.Lock()
+
+    def _get_tables(self, refresh=False):
+        """Returns the lookup tables, and whether they were just built."""
+        with self._lock:
+            if (refresh or self._tables is None or
+                    time.monotonic() >= self._expires_at):
+                self._tables = build_lookup_tables(
+                    self._list_func(), self._key_funcs)
+                self._expires_at = time.monotonic() + self._ttl
+                return self._tables, True
+            return self._tables, False
+
+    def get_tables(self, lookup_keys=()):
+        """Returns the lookup tables, listing the resources if needed.
+
+        :param lookup_keys: (table name, key) pairs about to be looked up;
+            if none of them is found in the already built tables, the
+            resources are listed again
+        """
+        tables, built = self._get_tables()
+        if lookup_keys and not built and not any(
+                key in tables[table_name]
+                for table_name, key in lookup_keys):
+            tables, _ = self._get_tables(refresh=True)
+        return tables
+
+    def lookup(self, table_name, key):
+        """Returns the list of resources indexed under the given key."""
+        tables = self.get_tables(lookup_keys=[(table_name, key)])
+        return list(tables[table_name].get(key, []))
+
+    def invalidate(self):
+        with self._lock:
+            self._tables = None
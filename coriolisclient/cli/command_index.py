@@ -0,0 +1,197 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk index of the CLI commands, sparing the entry point scan.
+
+Discovering the commands through stevedore reads the entry points of all
+the installed packages and imports the module of each command. The index
+maps the command names to their `module:attr` targets instead, so that
+only the module of the command being run gets imported.
+"""
+
+import hashlib
+import importlib
+from importlib import metadata as importlib_metadata
+import json
+import logging
+import os
+import sys
+
+from cliff import commandmanager
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "coriolis", "commands")
+# NOTE: to be bumped whenever the layout of the index files changes:
+_INDEX_FORMAT = 1
+
+
+def scan_entry_points(namespace):
+    """Returns the `module:attr` targets of a namespace's entry points.
+
+    :returns: dict of the targets, keyed by entry point name
+    """
+    entry_points = importlib_metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        entry_points = entry_points.select(group=namespace)
+    else:
+        entry_points = entry_points.get(namespace, [])
+    return {ep.name: ep.value for ep in entry_points}
+
+
+def get_index_key(namespace, stamp):
+    """Returns the key of the index of a namespace.
+
+    The key changes along with the stamp of the client, and whenever a
+    package gets installed or removed from any directory of `sys.path`, as
+    that updates the directory's modification time.
+    """
+    parts = [str(_INDEX_FORMAT), namespace, stamp]
+    for path in sys.path:
+        try:
+            mtime = os.stat(path or os.curdir).st_mtime
+        except OSError:
+            mtime = None
+        parts.append("%s:%s" % (path, mtime))
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+def _is_module_ignored(module_name, ignored_modules):
+    """Tells whether a module or any of its parent packages is ignored."""
+    parts = module_name.split('.')
+    return any(
+        '.'.join(parts[:i]) in ignored_modules
+        for i in range(1, len(parts) + 1))
+
+
+class CommandIndex(object):
+    """Stores the entry points of command namespaces as JSON files."""
+
+    def __init__(self, stamp, cache_dir=None):
+        self._stamp = stamp
+        self._cache_dir = cache_dir or DEFAULT_CACHE_DIR
+
+    def _get_path(self, namespace):
+        return os.path.join(
+            self._cache_dir, "%s-%s.json" % (
+                namespace, get_index_key(namespace, self._stamp)))
+
+    def _prune(self, namespace, path):
+        """Removes the stale index files of a namespace."""
+        prefix = "%s-" % namespace
+        try:
+            file_names = os.listdir(self._cache_dir)
+        except OSError:
+            return
+        for file_name in file_names:
+            stale_path = os.path.join(self._cache_dir, file_name)
+            if file_name.startswith(prefix) and stale_path != path:
+                try:
+                    os.remove(stale_path)
+                except OSError as ex:
+                    LOG.debug(
+                        "Failed to remove stale command index '%s': %s",
+                        stale_path, ex)
+
+    def _load(self, path):
+        try:
+            with open(path, 'r') as fin:
+                return json.load(fin)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as ex:
+            LOG.debug("Failed to load command index '%s': %s", path, ex)
+            return None
+
+    def _save(self, path, targets):
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            tmp_path = "%s.%d.tmp" % (path, os.getpid())
+            with open(tmp_path, 'w') as fout:
+                json.dump(targets, fout)
+            os.replace(tmp_path, path)
+        except OSError as ex:
+            LOG.debug("Failed to write command index '%s': %s", path, ex)
+
+    def get_targets(self, namespace):
+        """Returns the entry point targets of a namespace, by name.
+
+        The entry points are only scanned if not indexed yet, with the
+        result being indexed for the next invocations.
+        """
+        path = self._get_path(namespace)
+        targets = self._load(path)
+        if targets is None:
+            targets = scan_entry_points(namespace)
+            self._save(path, targets)
+            self._prune(namespace, path)
+        return targets
+
+
+class IndexedEntryPoint(object):
+    """Entry point of an indexed command, importing it on `load()` only."""
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    @property
+    def module_name(self):
+        return self.value.partition(':')[0]
+
+    def load(self):
+        module_name, _, attrs = self.value.partition(':')
+        target = importlib.import_module(module_name)
+        for attr in attrs.split('.') if attrs else []:
+            target = getattr(target, attr)
+        return target
+
+
+class IndexedCommandManager(commandmanager.CommandManager):
+    """Command manager looking the commands up in a `CommandIndex`.
+
+    :param stamp: version of the client, or any other string changing
+        when it gets upgraded, invalidating the previous index files
+    """
+
+    def __init__(self, namespace, stamp, cache_dir=None, **kwargs):
+        self._index = CommandIndex(stamp, cache_dir=cache_dir)
+        super(IndexedCommandManager, self).__init__(namespace, **kwargs)
+
+    def load_commands(self, namespace):
+        self.group_list.append(namespace)
+        # NOTE: only recent cliff releases support ignoring modules:
+        ignored_modules = getattr(self, 'ignored_modules', None) or ()
+        for name, value in sorted(self._index.get_targets(namespace).items()):
+            entry_point = IndexedEntryPoint(name, value)
+            if _is_module_ignored(entry_point.module_name, ignored_modules):
+                LOG.debug(
+                    "Skipping command '%s' of ignored module '%s'",
+                    name, entry_point.module_name)
+                continue
+            if self.convert_underscores:
+                name = name.replace('_', ' ')
+            self.commands[name] = entry_point
+
+    def get_command_names(self, group=None):
+        if group is None:
+            return list(self.commands.keys())
+        names = self._index.get_targets(group)
+        if self.convert_underscores:
+            return [name.replace('_', ' ') for name in names]
+        return list(names)
@@ -103,6 +103,10 @@ class ListEndpointInstance(lister.Lister):
         parser.add_argument(
             '--name',
             help='Filter results based on regular expression search')
+        parser.add_argument(
+            '--all', action='store_true', default=False,
+            help='List all instances by following the marker page by page. '
+                 'The page size can be set with --limit.')
 
         cli_utils.add_args_for_json_option_to_parser(parser, 'environment')
 
@@ -115,8 +119,16 @@ class ListEndpointInstance(lister.Lister):
         env = cli_utils.get_option_value_from_args(
             args, 'environment', error_on_no_value=False)
 
-        obj_list = ei.list(
-            endpoint_id, env, args.marker, args.limit, args.name)
+        if args.all:
+            page_kwargs = {}
+            if args.limit:
+                page_kwargs['limit'] = args.limit
+            obj_list = ei.list_iter(
+                endpoint_id, env, args.marker, name=args.name,
+                **page_kwargs)
+        else:
+            obj_list = ei.list(
+                endpoint_id, env, args.marker, args.limit, args.name)
         return EndpointInstanceFormatter().list_objects(obj_list)
 
 
@@ -11,6 +11,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from coriolisclient.cli import timings
+
 
 class EntityFormatter(object):
     """Base Mixin class providing functions that format entities for display.
@@ -31,13 +33,20 @@ class EntityFormatter(object):
         return columns, data
 
     def _get_generic_data(self, obj):
-        return self._get_formatted_data(obj)
+        return self._get_timed_formatted_data(obj)
+
+    def _get_timed_formatted_data(self, obj):
+        active_timings = timings.get_active()
+        if active_timings is None:
+            return self._get_formatted_data(obj)
+        with active_timings.accumulate("formatting"):
+            return self._get_formatted_data(obj)
 
     def _get_generic_columns(self):
         return self.columns
 
     def get_formatted_entity(self, obj):
-        return self.columns, self._get_formatted_data(obj)
+        return self.columns, self._get_timed_formatted_data(obj)
 
     def _get_percent_string(
             self, current_value, max_value, percent_format="{:.0f}%"):
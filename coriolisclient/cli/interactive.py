@@ -0,0 +1,73 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Interactive `coriolis shell` mode.
+
+All the commands run in the shell share the same client, along with its
+authenticated session, connection pool, lookup indexes and response cache.
+"""
+
+from cliff import command
+from cliff import interactive
+
+
+def get_cached_ids(coriolis):
+    """Returns the IDs of the objects found in the client's response cache.
+
+    Both the objects returned by show requests, e.g. `{"replica": {...}}`,
+    and by list requests, e.g. `{"replicas": [...]}`, are looked into.
+    """
+    response_cache = getattr(
+        getattr(coriolis, '_httpclient', None), 'response_cache', None)
+    if response_cache is None:
+        return []
+
+    ids = set()
+    for _, entry in response_cache.items():
+        if not isinstance(entry.body, dict):
+            continue
+        for value in entry.body.values():
+            objs = value if isinstance(value, list) else [value]
+            for obj in objs:
+                if isinstance(obj, dict) and obj.get('id'):
+                    ids.add(str(obj['id']))
+    return sorted(ids)
+
+
+class CoriolisInteractiveApp(interactive.InteractiveApp):
+    """Interactive mode completing IDs out of the already fetched objects."""
+
+    def completedefault(self, text, line, begidx, endidx):
+        commands = super(CoriolisInteractiveApp, self).completedefault(
+            text, line, begidx, endidx)
+        if commands:
+            return commands
+        return [
+            obj_id for obj_id in get_cached_ids(self.parent_app.client)
+            if obj_id.startswith(text)]
+
+
+class StartShell(command.Command):
+    """Start an interactive shell, authenticating only once.
+
+    The shell itself gets started by the application when given this
+    command, which is only registered for its help to be listed.
+    """
+
+    auth_required = False
+
+    def take_action(self, args):
+        self.app.stdout.write("Already running an interactive shell.\n")
@@ -17,6 +17,7 @@
 Command-line interface sub-commands related to migrations.
 """
 
+import functools
 import os
 
 from cliff import command
@@ -24,7 +25,9 @@ from cliff import lister
 from cliff import show
 
 from coriolisclient.cli import formatter
+from coriolisclient.cli import progress
 from coriolisclient.cli import utils as cli_utils
+from coriolisclient import polling
 
 
 class MigrationFormatter(formatter.EntityFormatter):
@@ -49,9 +52,25 @@ class MigrationFormatter(formatter.EntityFormatter):
         return data
 
 
+class MigrationDeployBulkResultFormatter(formatter.EntityFormatter):
+
+    columns = ("Replica",
+               "Migration",
+               "Status",
+               "Error",
+               )
+
+    def _get_formatted_data(self, obj):
+        return (obj["replica"],
+                obj["id"],
+                obj["status"],
+                obj["error"],
+                )
+
+
 class MigrationDetailFormatter(formatter.EntityFormatter):
 
-    def __init__(self, show_instances_data=False):
+    def __init__(self, show_instances_data=False, include_tasks=True):
         self.columns = [
             "id",
             "status",
@@ -78,6 +97,8 @@ class MigrationDetailFormatter(formatter.EntityFormatter):
             "transfer_result"
         ]
 
+        if not include_tasks:
+            self.columns.remove("tasks")
         if show_instances_data:
             self.columns.append("instances_data")
 
@@ -142,10 +163,11 @@ class MigrationDetailFormatter(formatter.EntityFormatter):
                 cli_utils.format_mapping(backend_mappings),
                 default_storage,
                 cli_utils.format_json_for_object_property(obj, 'user_scripts'),
-                self._format_tasks(obj),
-                cli_utils.format_json_for_object_property(
-                    obj, 'transfer_result')
                 ]
+        if "tasks" in self.columns:
+            data.append(self._format_tasks(obj))
+        data.append(cli_utils.format_json_for_object_property(
+            obj, 'transfer_result'))
 
         if "instances_data" in self.columns:
             data.append(obj.info)
@@ -317,6 +339,81 @@ class CreateMigrationFromReplica(show.ShowOne):
         return MigrationDetailFormatter().get_formatted_entity(migration)
 
 
+class DeployMigrationBulk(lister.Lister):
+    """Start migrations from many existing replicas"""
+
+    def get_parser(self, prog_name):
+        parser = super(DeployMigrationBulk, self).get_parser(prog_name)
+        parser.add_argument('replicas', nargs='+',
+                            help='The IDs of the replicas to migrate')
+        parser.add_argument('--force',
+                            help='Force the migrations in case of replicas '
+                            'with failed executions', action='store_true',
+                            default=False)
+        parser.add_argument('--dont-clone-disks',
+                            help='Retain the replica disks by cloning them',
+                            action='store_false', dest="clone_disks",
+                            default=True)
+        parser.add_argument('--skip-os-morphing',
+                            help='Skip the OS morphing process',
+                            action='store_true',
+                            default=False)
+        parser.add_argument('--max-running', type=int,
+                            help='Maximum number of migrations running at '
+                            'once. Migrations are always limited by the '
+                            'maximum minions of their OSMorphing minion '
+                            'pools.')
+        parser.add_argument('--timeout', type=float,
+                            help='Seconds after which to stop waiting for '
+                            'the migrations to finish')
+        parser.add_argument('--result-file',
+                            help='Path of a JSON file to write the outcome '
+                            'of each replica to')
+        cli_utils.add_minion_pool_args_to_parser(
+            parser, include_origin_pool_arg=False,
+            include_destination_pool_arg=False,
+            include_osmorphing_pool_mappings_arg=True)
+        return parser
+
+    def take_action(self, args):
+        m = self.app.client_manager.coriolis.migrations
+        instance_osmorphing_minion_pool_mappings = None
+        if args.instance_osmorphing_minion_pool_mappings:
+            instance_osmorphing_minion_pool_mappings = {
+                mp['instance_id']: mp['pool_id']
+                for mp in args.instance_osmorphing_minion_pool_mappings}
+
+        results = m.deploy_many(
+            args.replicas, clone_disks=args.clone_disks, force=args.force,
+            skip_os_morphing=args.skip_os_morphing,
+            instance_osmorphing_minion_pool_mappings=(
+                instance_osmorphing_minion_pool_mappings),
+            max_running=args.max_running, timeout=args.timeout)
+
+        # NOTE: outcomes are written out as soon as each migration finishes,
+        # the table only being shown once all of them did:
+        records = []
+        for result in results:
+            record = {"replica": result.item, "id": None, "status": None,
+                      "error": None}
+            if result.error is not None:
+                record["error"] = str(result.error) or repr(result.error)
+                line = "Replica %(replica)s: failed: %(error)s" % record
+            else:
+                record["id"] = result.result.id
+                record["status"] = polling.get_migration_status(
+                    result.result)
+                line = ("Replica %(replica)s: migration %(id)s finished "
+                        "with status %(status)s" % record)
+            records.append(record)
+            self.app.stderr.write(line + os.linesep)
+            self.app.stderr.flush()
+
+        if args.result_file:
+            cli_utils.write_bulk_result_file(args.result_file, records)
+        return MigrationDeployBulkResultFormatter().list_objects(records)
+
+
 class ShowMigration(show.ShowOne):
     """Show a migration"""
 
@@ -327,12 +424,24 @@ class ShowMigration(show.ShowOne):
                             help='Includes the instances data used for tasks '
                             'execution, this is useful for troubleshooting',
                             default=False)
+        parser.add_argument('--follow', action='store_true', default=False,
+                            help='Keep polling the migration and only show '
+                            'its new task status changes and progress '
+                            'updates, until it finishes')
         return parser
 
     def take_action(self, args):
-        migration = self.app.client_manager.coriolis.migrations.get(args.id)
+        migrations = self.app.client_manager.coriolis.migrations
+        if args.follow:
+            migration = progress.follow(
+                functools.partial(migrations.get, args.id),
+                migrations.get_waiter(), self.app.stdout)
+        else:
+            migration = migrations.get(args.id)
+        # NOTE: the tasks were already shown while following:
         return MigrationDetailFormatter(
-            args.show_instances_data).get_formatted_entity(migration)
+            args.show_instances_data,
+            include_tasks=not args.follow).get_formatted_entity(migration)
 
 
 class CancelMigration(command.Command):
@@ -0,0 +1,94 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Incremental display of the tasks progress of migrations and executions.
+"""
+
+import os
+
+from coriolisclient.cli import formatter
+from coriolisclient import polling
+
+
+class ProgressTail(formatter.EntityFormatter):
+    """Formats only the task changes not shown yet.
+
+    Keeps the last status of each task and a high-water mark on the index
+    of its progress updates, so that each poll only formats what is new.
+    The progress update at the mark is shown again if its step changed,
+    as ongoing updates get their step bumped in place.
+    """
+
+    def __init__(self):
+        self._task_statuses = {}
+        # NOTE: maps task IDs to the (index, current_step) of the last
+        # progress update shown:
+        self._high_water_marks = {}
+
+    def _get_new_progress_updates(self, task):
+        mark = self._high_water_marks.get(task.get('id'))
+        new_updates = []
+        for update in task.get('progress_updates') or []:
+            index = update.get('index', 0)
+            if (mark is None or index > mark[0] or (
+                    index == mark[0] and
+                    update.get('current_step') != mark[1])):
+                new_updates.append(update)
+        new_updates.sort(
+            key=lambda p: (p.get('index', 0), p.get('created_at') or ''))
+        if new_updates:
+            last = new_updates[-1]
+            self._high_water_marks[task.get('id')] = (
+                last.get('index', 0), last.get('current_step'))
+        return new_updates
+
+    def get_new_lines(self, obj):
+        lines = []
+        for task in obj._info.get('tasks') or []:
+            task_id = task.get('id')
+            status = task.get('status')
+            if status != self._task_statuses.get(task_id):
+                self._task_statuses[task_id] = status
+                lines.append("Task %s (%s, instance %s): %s" % (
+                    task_id, task.get('task_type'), task.get('instance'),
+                    status))
+                if task.get('exception_details'):
+                    lines.append("  %s" % task['exception_details'])
+            lines.extend(
+                "  %s" % self._format_progress_update(update)
+                for update in self._get_new_progress_updates(task))
+        return lines
+
+
+def follow(get_func, waiter, stdout):
+    """Writes the progress of a migration or execution until it finishes.
+
+    :param get_func: callable returning the current state of the resource
+    :param waiter: `polling.Waiter` deciding the polling intervals
+    :param stdout: stream to write the progress to
+    :returns: the resource in its final status
+    """
+    tail = ProgressTail()
+
+    def _get_and_show():
+        obj = get_func()
+        lines = tail.get_new_lines(obj)
+        if lines:
+            stdout.write(os.linesep.join(lines) + os.linesep)
+            stdout.flush()
+        return obj
+
+    return polling.wait_for(_get_and_show, waiter)
@@ -15,6 +15,7 @@
 """
 Command-line interface sub-commands related to replicas.
 """
+import functools
 import os
 
 from cliff import command
@@ -22,6 +23,7 @@ from cliff import lister
 from cliff import show
 
 from coriolisclient.cli import formatter
+from coriolisclient.cli import progress
 
 
 class ReplicaExecutionFormatter(formatter.EntityFormatter):
@@ -55,6 +57,10 @@ class ReplicaExecutionDetailFormatter(formatter.EntityFormatter):
                "tasks",
                )
 
+    def __init__(self, include_tasks=True):
+        if not include_tasks:
+            self.columns = self.columns[:-1]
+
     def _format_instances(self, obj):
         return os.linesep.join(sorted(set([t.instance for t in obj.tasks])))
 
@@ -95,8 +101,9 @@ class ReplicaExecutionDetailFormatter(formatter.EntityFormatter):
                 obj.created_at,
                 obj.updated_at,
                 self._format_instances(obj),
-                self._format_tasks(obj),
                 )
+        if "tasks" in self.columns:
+            data += (self._format_tasks(obj),)
         return data
 
 
@@ -127,13 +134,23 @@ class ShowReplicaExecution(show.ShowOne):
         parser = super(ShowReplicaExecution, self).get_parser(prog_name)
         parser.add_argument('replica', help='The replica\'s id')
         parser.add_argument('id', help='The replica execution\'s id')
+        parser.add_argument('--follow', action='store_true', default=False,
+                            help='Keep polling the execution and only show '
+                            'its new task status changes and progress '
+                            'updates, until it finishes')
         return parser
 
     def take_action(self, args):
-        execution = self.app.client_manager.coriolis.replica_executions.get(
-            args.replica, args.id)
-        return ReplicaExecutionDetailFormatter().get_formatted_entity(
-            execution)
+        executions = self.app.client_manager.coriolis.replica_executions
+        if args.follow:
+            execution = progress.follow(
+                functools.partial(executions.get, args.replica, args.id),
+                executions.get_waiter(), self.app.stdout)
+        else:
+            execution = executions.get(args.replica, args.id)
+        # NOTE: the tasks were already shown while following:
+        return ReplicaExecutionDetailFormatter(
+            include_tasks=not args.follow).get_formatted_entity(execution)
 
 
 class CancelReplicaExecution(command.Command):
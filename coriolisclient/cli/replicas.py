@@ -26,6 +26,7 @@ from cliff import show
 from coriolisclient.cli import formatter
 from coriolisclient.cli import replica_executions
 from coriolisclient.cli import utils as cli_utils
+from coriolisclient import manifest
 
 
 class ReplicaFormatter(formatter.EntityFormatter):
@@ -56,6 +57,22 @@ class ReplicaFormatter(formatter.EntityFormatter):
         return data
 
 
+class ReplicaBulkResultFormatter(formatter.EntityFormatter):
+
+    columns = ("Row",
+               "Instances",
+               "ID",
+               "Error",
+               )
+
+    def _get_formatted_data(self, obj):
+        return (obj["row"],
+                "\n".join(obj.get("instances") or []),
+                obj["id"],
+                obj["error"],
+                )
+
+
 class ReplicaDetailFormatter(formatter.EntityFormatter):
 
     def __init__(self, show_instances_data=False):
@@ -214,6 +231,45 @@ class CreateReplica(show.ShowOne):
         return ReplicaDetailFormatter().get_formatted_entity(replica)
 
 
+class CreateReplicaBulk(lister.Lister):
+    """Create many replicas described in a manifest file"""
+
+    def get_parser(self, prog_name):
+        parser = super(CreateReplicaBulk, self).get_parser(prog_name)
+        parser.add_argument(
+            'manifest',
+            help='Path of a YAML, JSON or CSV file with a row for each '
+                 'replica. Row keys are origin_endpoint_id, '
+                 'destination_endpoint_id (both of which accept endpoint '
+                 'names), instances, notes, source_environment, '
+                 'destination_environment, network_map, storage_mappings, '
+                 'origin_minion_pool_id, destination_minion_pool_id, '
+                 'instance_osmorphing_minion_pool_mappings and user_scripts. '
+                 'CSV cells hold "%s" separated instances and JSON '
+                 'documents for the other structured fields. YAML and JSON '
+                 'manifests may also hold the rows under "rows", next to '
+                 '"defaults" applied to every row.' % (
+                     manifest.CSV_LIST_SEPARATOR))
+        parser.add_argument(
+            '--manifest-format', choices=manifest.FORMATS,
+            help='The format of the manifest. Guessed from its extension '
+                 'by default.')
+        cli_utils.add_bulk_args_to_parser(parser)
+        return parser
+
+    def take_action(self, args):
+        rows = manifest.load(args.manifest, fmt=args.manifest_format)
+        results = self.app.client_manager.coriolis.replicas.create_many(
+            rows, max_workers=args.max_workers,
+            requests_per_second=args.requests_per_second)
+
+        records = cli_utils.get_bulk_result_records(
+            results, lambda row: {"instances": row.get("instances")})
+        if args.result_file:
+            cli_utils.write_bulk_result_file(args.result_file, records)
+        return ReplicaBulkResultFormatter().list_objects(records)
+
+
 class ShowReplica(show.ShowOne):
     """Show a replica"""
 
@@ -17,16 +17,18 @@
 Command-line interface to the Coriolis API.
 """
 
+import argparse
 from collections import namedtuple
+import cProfile
 import logging
 import os
 import sys
 
 from cliff import app
 from cliff import command
-from cliff import commandmanager
 from cliff import complete
 from cliff import help
+from keystoneauth1 import exceptions as keystoneauth_exceptions
 from keystoneauth1.identity import v2
 from keystoneauth1.identity import v3
 from keystoneauth1 import loading
@@ -34,13 +36,47 @@ from keystoneauth1 import session
 
 import six
 
+from coriolisclient.cli import command_index
+from coriolisclient.cli import timings
+from coriolisclient.cli import token_cache
+from coriolisclient import cache
 from coriolisclient import client
-from coriolisclient import version
+from coriolisclient import exceptions
+from coriolisclient import instrumentation
+from coriolisclient import ratelimit
+from coriolisclient import retry
 
 
 _DEFAULT_IDENTITY_API_VERSION = '3'
 _IDENTITY_API_VERSION_2 = ['2', '2.0']
 _IDENTITY_API_VERSION_3 = ['3']
+_SHELL_COMMAND = 'shell'
+
+
+def _get_commands_stamp():
+    """Returns a stamp of the installed CLI commands for the command index.
+
+    The modification time of the commands' package changes whenever the
+    client gets upgraded, without asking pbr for the version, which is
+    slow.
+    """
+    return str(os.stat(os.path.dirname(os.path.abspath(__file__))).st_mtime)
+
+
+class _VersionAction(argparse.Action):
+    """Prints the version of the client, only looking it up if asked to."""
+
+    def __init__(self, option_strings, dest=argparse.SUPPRESS,
+                 default=argparse.SUPPRESS, help=None):
+        super(_VersionAction, self).__init__(
+            option_strings=option_strings, dest=dest, default=default,
+            nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        # NOTE: importing the version module computes the version:
+        from coriolisclient import version
+        sys.stdout.write("%s %s\n" % (parser.prog, version.__version__))
+        parser.exit()
 
 
 class Coriolis(app.App):
@@ -49,6 +85,9 @@ class Coriolis(app.App):
 
     def __init__(self, **kwargs):
         self.client = None
+        self._token_cache = None
+        self._cached_auth = None
+        self._timings = None
 
         # Patch command.Command to add a default auth_required = True
         command.Command.auth_required = True
@@ -59,9 +98,9 @@ class Coriolis(app.App):
 
         super(Coriolis, self).__init__(
             description=__doc__.strip(),
-            version=version.__version__,
-            command_manager=commandmanager.CommandManager(
-                'coriolis.v1'),
+            version=None,
+            command_manager=command_index.IndexedCommandManager(
+                'coriolis.v1', _get_commands_stamp()),
             deferred_help=True,
             **kwargs
         )
@@ -147,12 +186,18 @@ class Coriolis(app.App):
             method = v3.Token if auth_type == 'token' else v3.Password
 
         auth = method(**kwargs)
+        if args.token_cache:
+            self._token_cache = token_cache.TokenCache(
+                cache_dir=args.token_cache_dir)
+            self._token_cache.load(auth)
+            self._cached_auth = auth
 
         return session.Session(auth=auth, verify=not args.insecure)
 
     def create_client(self, args):
         created_client = None
         endpoint_filter_kwargs = self._get_endpoint_filter_kwargs(args)
+        client_kwargs = self._get_client_kwargs(args)
 
         api_version = args.os_identity_api_version
         if args.no_auth and args.os_auth_url:
@@ -171,7 +216,8 @@ class Coriolis(app.App):
                 endpoint=args.endpoint,
                 project_id=args.os_tenant_id or args.os_project_id,
                 verify=not args.insecure,
-                **endpoint_filter_kwargs
+                **endpoint_filter_kwargs,
+                **client_kwargs
             )
         # Token-based authentication
         elif args.os_auth_token:
@@ -187,7 +233,8 @@ class Coriolis(app.App):
             created_client = client.Client(
                 session=session,
                 endpoint=args.endpoint,
-                **endpoint_filter_kwargs
+                **endpoint_filter_kwargs,
+                **client_kwargs
             )
 
         # Password-based authentication
@@ -204,13 +251,27 @@ class Coriolis(app.App):
             created_client = client.Client(
                 session=session,
                 endpoint=args.endpoint,
-                **endpoint_filter_kwargs
+                **endpoint_filter_kwargs,
+                **client_kwargs
             )
         else:
             raise Exception('ERROR: please specify authentication credentials')
 
         return created_client
 
+    def _get_client_kwargs(self, args):
+        kwargs = {'retry_policy': retry.RetryPolicy(
+            max_retries=args.max_retries)}
+        if args.rate_limit or args.rate_limit_quotas:
+            kwargs['rate_limiter'] = ratelimit.RateLimiter(
+                rate=args.rate_limit, quotas=args.rate_limit_quotas)
+        if self._timings is not None:
+            kwargs['instrumentation'] = instrumentation.Instrumentation(
+                sinks=[self._timings.record_request])
+        if self.interactive_mode:
+            kwargs['response_cache'] = cache.ResponseCache()
+        return kwargs
+
     def _get_endpoint_filter_kwargs(self, args):
         endpoint_filter_keys = ('interface', 'service_type', 'service_name',
                                 'coriolis_api_version', 'region_name')
@@ -224,8 +285,14 @@ class Coriolis(app.App):
         """Introduces global arguments for the application.
         This is inherited from the framework.
         """
+        # NOTE: the `--version` argument of the framework gets replaced by
+        # one which only looks the version up when given:
+        argparse_kwargs = dict(argparse_kwargs or {})
+        argparse_kwargs['conflict_handler'] = 'resolve'
         parser = super(Coriolis, self).build_option_parser(
             description, version, argparse_kwargs)
+        parser.add_argument('--version', action=_VersionAction,
+                            help="show program's version number and exit")
         parser.add_argument('--no-auth', '-N', action='store_true',
                             help='Do not use authentication.')
         parser.add_argument('--os-identity-api-version',
@@ -316,6 +383,60 @@ class Coriolis(app.App):
                             metavar='<coriolis-api-version>',
                             default=self._env('CORIOLIS_API_VERSION'),
                             help='Defaults to env[CORIOLIS_API_VERSION].')
+        parser.add_argument('--max-retries',
+                            metavar='<max-retries>', type=int,
+                            default=int(self._env(
+                                'CORIOLIS_MAX_RETRIES',
+                                retry.DEFAULT_MAX_RETRIES)),
+                            help='Maximum number of retries of idempotent '
+                                 'requests failing with connection errors '
+                                 'or 429, 502, 503 or 504 responses. '
+                                 'Defaults to env[CORIOLIS_MAX_RETRIES] or '
+                                 '%s.' % retry.DEFAULT_MAX_RETRIES)
+        parser.add_argument('--rate-limit',
+                            metavar='<requests-per-second>', type=float,
+                            default=self._env('CORIOLIS_RATE_LIMIT'),
+                            help='Maximum number of requests issued per '
+                                 'second, after which requests wait for '
+                                 'their turn. Defaults to '
+                                 'env[CORIOLIS_RATE_LIMIT].')
+        parser.add_argument('--rate-limit-quota', action='append',
+                            metavar='<[method ]url-pattern=rate>',
+                            type=ratelimit.parse_quota,
+                            dest='rate_limit_quotas', default=[],
+                            help='Maximum number of requests issued per '
+                                 'second to the URLs matching a pattern, '
+                                 'in which "*" matches a path segment, '
+                                 'e.g. "GET /endpoints/*/instances=0.5". '
+                                 'May be given multiple times.')
+        parser.add_argument('--timings',
+                            action='store_true', default=False,
+                            help='Print to stderr how long each phase of '
+                                 'the command took: startup, '
+                                 'authentication, service catalog lookup, '
+                                 'each API request, formatting and '
+                                 'output.')
+        # NOTE: handled by main(), so as to profile the whole invocation:
+        parser.add_argument('--profile',
+                            metavar='<file>',
+                            help='Profile the command and dump the '
+                                 'cProfile stats to the given file, to '
+                                 'be read with the pstats module.')
+        parser.add_argument('--token-cache',
+                            action='store_true',
+                            default=self._env_bool('CORIOLIS_TOKEN_CACHE'),
+                            help='Cache the Keystone token and service '
+                                 'catalog on disk and reuse them across '
+                                 'invocations until the token expires. '
+                                 'Defaults to env[CORIOLIS_TOKEN_CACHE].')
+        parser.add_argument('--token-cache-dir',
+                            metavar='<token-cache-dir>',
+                            default=self._env(
+                                'CORIOLIS_TOKEN_CACHE_DIR',
+                                token_cache.DEFAULT_CACHE_DIR),
+                            help='Directory holding the cached tokens. '
+                                 'Defaults to env[CORIOLIS_TOKEN_CACHE_DIR] '
+                                 'or %s.' % token_cache.DEFAULT_CACHE_DIR)
         parser.epilog = ('See "coriolis help COMMAND" for help '
                          'on a specific command.')
         loading.register_session_argparse_arguments(parser)
@@ -325,6 +446,50 @@ class Coriolis(app.App):
     def _env(self, var_name, default=None):
         return os.environ.get(var_name, default)
 
+    def _env_bool(self, var_name):
+        value = self._env(var_name)
+        if not value:
+            return False
+        # NOTE: strutils is only imported if needed, as compiling its
+        # regular expressions takes a sizable part of the CLI startup:
+        from oslo_utils import strutils
+        return strutils.bool_from_string(value)
+
+    def initialize_app(self, argv):
+        """Starts timing the command, if asked to.
+
+        Running the `shell` command starts the interactive mode instead.
+
+        This is inherited from the framework.
+        """
+        if self.options.timings:
+            self._timings = timings.Timings()
+            self._timings.activate()
+        if argv == [_SHELL_COMMAND]:
+            self.interactive_mode = True
+
+    def interact(self):
+        # NOTE: the interactive mode is only imported when started, as
+        # importing cmd2 is slow:
+        from coriolisclient.cli import interactive
+        self.interactive_app_factory = interactive.CoriolisInteractiveApp
+        super(Coriolis, self).interact()
+
+    def _authenticate(self, coriolis):
+        """Authenticates and looks up the API endpoint ahead of time.
+
+        Both would otherwise happen as part of the first request, so this
+        is only done to tell their durations apart with `--timings`.
+        """
+        # NOTE: the adapter holds the session and the endpoint filter:
+        adapter = coriolis._httpclient
+        if getattr(adapter.session, 'auth', None) is None:
+            return
+        with self._timings.phase("auth"):
+            adapter.get_token()
+        with self._timings.phase("catalog"):
+            adapter.get_endpoint()
+
     def prepare_to_run_command(self, cmd):
         """Prepares to run the command
         Checks if the minimal parameters are provided and creates the
@@ -333,15 +498,58 @@ class Coriolis(app.App):
         """
         self.client_manager = namedtuple(
             'ClientManager', 'coriolis')
-        if cmd.auth_required:
-            self.client_manager.coriolis = self.create_client(self.options)
+        if self._timings is not None:
+            cmd.get_parser = self._timings.wrap(cmd.get_parser, "arguments")
+            cmd.take_action = self._timings.wrap(cmd.take_action, "command")
+            if hasattr(cmd, 'produce_output'):
+                cmd.produce_output = self._timings.wrap(
+                    cmd.produce_output, "output")
+        if not cmd.auth_required:
+            return
+        if self.interactive_mode and self.client is not None:
+            # NOTE: the commands run in the interactive shell all share the
+            # same client, which only authenticates once:
+            self.client_manager.coriolis = self.client
+            return
+        if self._timings is None:
+            self.client = self.create_client(self.options)
+        else:
+            with self._timings.phase("client"):
+                self.client = self.create_client(self.options)
+            self._authenticate(self.client)
+        self.client_manager.coriolis = self.client
+
+    def clean_up(self, cmd, result, err):
+        """Updates the token cache once the command has run.
+
+        This is inherited from the framework.
+        """
+        if self._token_cache is None:
+            return
+        if isinstance(err, (exceptions.HTTPAuthError,
+                            keystoneauth_exceptions.Unauthorized)):
+            # NOTE: the cached token may have been revoked:
+            self._token_cache.invalidate(self._cached_auth)
+        else:
+            self._token_cache.save(self._cached_auth)
+
+    def _finish_timings(self):
+        if self._timings is not None:
+            self._timings.deactivate()
+            self.stderr.write(
+                os.linesep.join(self._timings.format_waterfall()) +
+                os.linesep)
+            self._timings = None
 
     def run(self, argv):
         # If no arguments are provided, usage is displayed
         if not argv:
             self.stderr.write(self.parser.format_usage())
             return 1
-        return super(Coriolis, self).run(argv)
+        try:
+            return super(Coriolis, self).run(argv)
+        finally:
+            self._finish_timings()
 
 
 def _setup_logging():
@@ -349,10 +557,32 @@ def _setup_logging():
     logging.getLogger("keystoneclient").setLevel(logging.ERROR)
 
 
+def _get_profile_path(argv):
+    """Returns the `--profile` file given in the arguments, if any.
+
+    The arguments are looked into ahead of the application, which imports
+    the command modules and parses the arguments as part of what gets
+    profiled.
+    """
+    parser = argparse.ArgumentParser(add_help=False, allow_abbrev=False)
+    parser.add_argument('--profile')
+    args, _ = parser.parse_known_args(argv)
+    return args.profile
+
+
 def main(argv=sys.argv[1:]):
     _setup_logging()
-    coriolis_app = Coriolis()
-    return coriolis_app.run(argv)
+    profile_path = _get_profile_path(argv)
+    if not profile_path:
+        return Coriolis().run(argv)
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return Coriolis().run(argv)
+    finally:
+        profiler.disable()
+        profiler.dump_stats(profile_path)
 
 
 if __name__ == '__main__':   # pragma: no cover
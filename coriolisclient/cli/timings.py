@@ -0,0 +1,133 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Timing of the phases of a command-line invocation, see `--timings`.
+"""
+
+import collections
+import contextlib
+import functools
+import time
+
+
+_BAR_WIDTH = 40
+
+# NOTE: the `Timings` of the running invocation, if `--timings` was given:
+_active = None
+
+
+Phase = collections.namedtuple('Phase', ['name', 'start', 'duration', 'depth'])
+
+
+def get_active():
+    """Returns the `Timings` being recorded, or None."""
+    return _active
+
+
+class Timings(object):
+    """Records the phases of an invocation, as offsets from its creation.
+
+    The CPU time spent before the creation, on starting the interpreter,
+    importing modules and parsing options, is recorded as the `startup`
+    phase, ending at offset 0.
+    """
+
+    def __init__(self):
+        self._start = time.perf_counter()
+        self._wall_start = time.time()
+        startup = time.process_time()
+        self._phases = [Phase("startup (CPU)", -startup, startup, 0)]
+        self._accumulated = collections.OrderedDict()
+        self._depth = 0
+
+    def activate(self):
+        global _active
+        _active = self
+
+    def deactivate(self):
+        global _active
+        if _active is self:
+            _active = None
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Records the duration of the enclosed block as a phase."""
+        start = time.perf_counter() - self._start
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth = depth
+            self._phases.append(Phase(
+                name, start, time.perf_counter() - self._start - start,
+                depth))
+
+    def wrap(self, func, name):
+        """Returns `func` with each of its calls recorded as a phase."""
+        @functools.wraps(func)
+        def _wrapper(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return _wrapper
+
+    @contextlib.contextmanager
+    def accumulate(self, name):
+        """Adds the duration of the enclosed block to a single phase.
+
+        Meant for short and frequent operations, such as formatting each
+        listed entity, which get shown as one phase spanning from the
+        first of them, with their total duration.
+        """
+        start = time.perf_counter() - self._start
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - self._start - start
+            first_start, total = self._accumulated.get(name, (start, 0))
+            self._accumulated[name] = (first_start, total + duration)
+
+    def record_request(self, record):
+        """Instrumentation sink recording requests as phases."""
+        self._phases.append(Phase(
+            "%s %s -> %s" % (
+                record.method, record.url, record.status or record.error),
+            record.started_at - self._wall_start, record.latency,
+            self._depth))
+
+    def get_phases(self):
+        """Returns the recorded `Phase` tuples, ordered by start."""
+        phases = list(self._phases) + [
+            Phase(name, start, duration, 0)
+            for name, (start, duration) in self._accumulated.items()]
+        phases.sort(key=lambda p: p.start)
+        return phases
+
+    def format_waterfall(self):
+        """Returns the lines of a waterfall chart of the phases."""
+        phases = self.get_phases()
+        total = time.perf_counter() - self._start
+        first = min(p.start for p in phases)
+        span = (total - first) or 1
+        name_width = max(len(p.name) + 2 * p.depth for p in phases)
+        lines = ["%-*s %9s %9s" % (name_width, "Phase", "Start", "Seconds")]
+        for p in phases + [Phase("total", first, total - first, 0)]:
+            offset = int((p.start - first) / span * _BAR_WIDTH)
+            width = max(1, int(round(p.duration / span * _BAR_WIDTH)))
+            lines.append("%-*s %9.3f %9.3f |%s%s" % (
+                name_width, "  " * p.depth + p.name, p.start, p.duration,
+                " " * offset, "#" * width))
+        return lines
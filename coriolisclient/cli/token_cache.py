@@ -0,0 +1,118 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+On-disk cache of Keystone tokens shared across CLI invocations.
+"""
+
+import hashlib
+import logging
+import os
+import stat
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "coriolis", "tokens")
+# NOTE: cached tokens expiring within this many seconds are discarded so
+# that a command never starts with a token about to expire mid-way:
+_EXPIRY_WINDOW = 60
+
+
+class TokenCache(object):
+    """Stores the auth state (token and service catalog) of auth plugins.
+
+    Entries are keyed by the plugin's cache ID, which is derived from the
+    auth URL, user, project and credentials it was created with. Entries
+    are only readable by their owner.
+    """
+
+    def __init__(self, cache_dir=None):
+        self._cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self._loaded_states = {}
+
+    def _get_path(self, auth):
+        cache_id = auth.get_cache_id()
+        if not cache_id:
+            return None
+        file_name = hashlib.sha256(cache_id.encode()).hexdigest()
+        return os.path.join(self._cache_dir, file_name)
+
+    def load(self, auth):
+        """Installs the cached auth state into the given plugin, if any.
+
+        :returns: whether a valid cached token was installed
+        """
+        path = self._get_path(auth)
+        if not path or not os.path.exists(path):
+            return False
+
+        try:
+            if os.stat(path).st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+                LOG.warning(
+                    "Ignoring token cache file '%s' as it is accessible by "
+                    "other users.", path)
+                self._remove(path)
+                return False
+            with open(path, 'r') as fin:
+                state = fin.read()
+            auth.set_auth_state(state)
+        except Exception as ex:
+            LOG.debug("Failed to load cached token from '%s': %s", path, ex)
+            self._remove(path)
+            return False
+
+        auth_ref = auth.auth_ref
+        if auth_ref is None or auth_ref.will_expire_soon(_EXPIRY_WINDOW):
+            auth.set_auth_state(None)
+            self._remove(path)
+            return False
+
+        self._loaded_states[path] = state
+        return True
+
+    def save(self, auth):
+        """Persists the auth state of the given plugin, if changed."""
+        path = self._get_path(auth)
+        state = auth.get_auth_state()
+        if not path or not state or self._loaded_states.get(path) == state:
+            return
+
+        try:
+            os.makedirs(self._cache_dir, mode=0o700, exist_ok=True)
+            tmp_path = "%s.%d.tmp" % (path, os.getpid())
+            fd = os.open(
+                tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as fout:
+                fout.write(state)
+            os.replace(tmp_path, path)
+            self._loaded_states[path] = state
+        except OSError as ex:
+            LOG.warning("Failed to write token cache file '%s': %s", path, ex)
+
+    def invalidate(self, auth):
+        """Removes the cached auth state of the given plugin."""
+        path = self._get_path(auth)
+        if path:
+            self._loaded_states.pop(path, None)
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
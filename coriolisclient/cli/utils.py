@@ -17,9 +17,10 @@
 import argparse
 import json
 import os
-import uuid
 
+from coriolisclient import bulk
 from coriolisclient import constants
+from coriolisclient import utils
 
 
 def add_storage_mappings_arguments_to_parser(parser):
@@ -121,21 +122,9 @@ def format_json_for_object_property(obj, prop_name):
     return json.dumps(prop, indent=2)
 
 
-def validate_uuid_string(uuid_obj, uuid_version=4):
-    """ Checks whether the provided string is a valid UUID string
-
-        :param uuid_obj: A string or stringable object containing the UUID
-        :param uuid_version: The UUID version to be used
-    """
-    uuid_string = str(uuid_obj).lower()
-    try:
-        uuid.UUID(uuid_string, version=uuid_version)
-    except ValueError:
-        # If it's a value error, then the string
-        # is not a valid hex code for a UUID.
-        return False
-
-    return True
+# NOTE: kept here for backwards compatibility, now that the API client
+# uses it as well:
+validate_uuid_string = utils.validate_uuid_string
 
 
 def add_args_for_json_option_to_parser(parser, option_name):
@@ -264,3 +253,44 @@ def add_minion_pool_args_to_parser(
                  'same OS type and which are compatible with OSMorphing '
                  'the guest OS of each afferent instance. The mappings must '
                  'be of the form "INSTANCE_IDENTIFIER=MINION_POOL_ID".')
+
+
+def add_bulk_args_to_parser(parser):
+    parser.add_argument(
+        '--max-workers', type=int, default=bulk.DEFAULT_MAX_WORKERS,
+        help='Maximum number of concurrent requests. Default: %s' % (
+            bulk.DEFAULT_MAX_WORKERS))
+    parser.add_argument(
+        '--rate', type=float, dest='requests_per_second',
+        help='Maximum number of requests issued per second. No limit '
+             'applies by default.')
+    parser.add_argument(
+        '--result-file',
+        help='Path of a JSON file to write the outcome of each row to')
+
+
+def get_bulk_result_records(results, get_item_info=None):
+    """Returns a JSON serializable record for each `bulk.BulkResult`.
+
+    :param get_item_info: callable returning a dict of extra fields
+        describing a row, to be included in its record
+    """
+    records = []
+    for row, result in enumerate(results, 1):
+        record = {"row": row}
+        if get_item_info is not None:
+            record.update(get_item_info(result.item))
+        record["id"] = None
+        if result.result is not None:
+            record["id"] = result.result.id
+        record["error"] = None
+        if result.error is not None:
+            record["error"] = str(result.error) or repr(result.error)
+        records.append(record)
+    return records
+
+
+def write_bulk_result_file(path, records):
+    with open(path, 'w') as fout:
+        json.dump(records, fout, indent=2)
+        fout.write(os.linesep)
@@ -13,32 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
 import logging
+import time
 
 from keystoneauth1 import adapter
+from keystoneauth1 import exceptions as keystoneauth_exceptions
 
-from coriolisclient.v1 import diagnostics
-from coriolisclient.v1 import endpoint_destination_minion_pool_options
-from coriolisclient.v1 import endpoint_destination_options
-from coriolisclient.v1 import endpoint_instances
-from coriolisclient.v1 import endpoint_networks
-from coriolisclient.v1 import endpoint_source_minion_pool_options
-from coriolisclient.v1 import endpoint_source_options
-from coriolisclient.v1 import endpoint_storage
-from coriolisclient.v1 import endpoints
-from coriolisclient.v1 import licensing
-from coriolisclient.v1 import licensing_appliances
-from coriolisclient.v1 import licensing_reservations
-from coriolisclient.v1 import licensing_server
-from coriolisclient.v1 import logging as coriolis_logging
-from coriolisclient.v1 import migrations
-from coriolisclient.v1 import minion_pools
-from coriolisclient.v1 import providers
-from coriolisclient.v1 import regions
-from coriolisclient.v1 import replica_executions
-from coriolisclient.v1 import replica_schedules
-from coriolisclient.v1 import replicas
-from coriolisclient.v1 import services
+from coriolisclient import instrumentation
+from coriolisclient import retry
 
 
 LOG = logging.getLogger(__name__)
@@ -46,10 +29,36 @@ LOG = logging.getLogger(__name__)
 _DEFAULT_SERVICE_TYPE = 'migration'
 _DEFAULT_SERVICE_INTERFACE = 'public'
 _DEFAULT_API_VERSION = 'v1'
+_SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+# NOTE: connection errors after which the request is known not to have
+# reached the API, or which are worth retrying for idempotent requests:
+_TRANSIENT_CONNECTION_ERRORS = (
+    keystoneauth_exceptions.ConnectFailure,
+    keystoneauth_exceptions.ConnectTimeout,
+    keystoneauth_exceptions.UnknownConnectionError,
+)
 
 
 class _HTTPClient(adapter.Adapter):
-    def __init__(self, session, project_id=None, **kwargs):
+    """Adapter retrying transient failures of idempotent requests.
+
+    :param retry_policy: `retry.RetryPolicy` deciding which requests are
+        retried and after how long, defaulting to `retry.RetryPolicy()`
+    :param circuit_failure_threshold: consecutive failures after which
+        requests to the API fail fast, or None to never fail fast
+    :param circuit_reset_timeout: seconds after which a request is let
+        through again once failing fast
+    :param rate_limiter: optional `ratelimit.RateLimiter` every request
+        goes through, retries included
+    :param instrumentation: optional `instrumentation.Instrumentation`
+        recording every request, along with its retries
+    """
+
+    def __init__(self, session, project_id=None, response_cache=None,
+                 compact_resources=False, retry_policy=None,
+                 circuit_failure_threshold=retry.DEFAULT_FAILURE_THRESHOLD,
+                 circuit_reset_timeout=retry.DEFAULT_RESET_TIMEOUT,
+                 rate_limiter=None, instrumentation=None, **kwargs):
         kwargs.setdefault('interface', _DEFAULT_SERVICE_INTERFACE)
         kwargs.setdefault('service_type', _DEFAULT_SERVICE_TYPE)
         kwargs.setdefault('version', _DEFAULT_API_VERSION)
@@ -59,46 +68,250 @@ class _HTTPClient(adapter.Adapter):
 
         if endpoint:
             self.endpoint_override = '{0}/{1}'.format(endpoint, self.version)
+        self.response_cache = response_cache
+        self.compact_resources = compact_resources
+        self.rate_limiter = rate_limiter
+        self.instrumentation = instrumentation
+        self.retry_policy = retry_policy or retry.RetryPolicy()
+        self.retry_metrics = retry.RetryMetrics()
+        self.circuit_breaker = None
+        if circuit_failure_threshold is not None:
+            self.circuit_breaker = retry.CircuitBreaker(
+                self.endpoint_override or self.service_type,
+                failure_threshold=circuit_failure_threshold,
+                reset_timeout=circuit_reset_timeout,
+                metrics=self.retry_metrics)
+
+    def _request_once(self, url, method, **kwargs):
+        """Issues a single request, going through the circuit breaker.
+
+        :returns: tuple of the response, the error raised if any, and the
+            status code, which is None if no response was received
+        """
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.before_request()
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, url)
+        try:
+            resp = super(_HTTPClient, self).request(url, method, **kwargs)
+            error = None
+            status_code = resp.status_code
+        except keystoneauth_exceptions.HttpError as ex:
+            resp, error, status_code = ex.response, ex, ex.http_status
+        except _TRANSIENT_CONNECTION_ERRORS as ex:
+            resp, error, status_code = None, ex, None
+        except Exception:
+            # NOTE: other errors do not tell whether the API is down:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_success()
+            raise
+
+        if self.circuit_breaker is not None:
+            if status_code is None or (
+                    status_code in retry.FAILURE_STATUS_CODES):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+        return resp, error, status_code
+
+    def request(self, url, method, **kwargs):
+        if self.response_cache is not None and method not in _SAFE_METHODS:
+            self.response_cache.invalidate(url)
+
+        policy = self.retry_policy
+        retries = 0
+        delay = None
+        succeeded = False
+        resp = error = status_code = None
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            while True:
+                resp, error, status_code = self._request_once(
+                    url, method, **kwargs)
+                transient = (
+                    (error is not None and status_code is None) or
+                    status_code in policy.status_codes)
+                if not transient or retries >= policy.max_retries or (
+                        not policy.is_retryable(method, status_code)):
+                    break
+
+                retry_after = None
+                if resp is not None:
+                    retry_after = retry.parse_retry_after(
+                        resp.headers.get('Retry-After'))
+                delay = policy.get_delay(delay, retry_after)
+                reason = str(status_code or type(error).__name__)
+                LOG.debug(
+                    "%s %s failed with %s, retrying in %.1f seconds",
+                    method, url, reason, delay)
+                self.retry_metrics.record_retry(reason, delay)
+                retries += 1
+                time.sleep(delay)
+
+            succeeded = not transient
+        except Exception as ex:
+            error = ex
+            raise
+        finally:
+            if retries:
+                self.retry_metrics.record_retried_request(succeeded)
+            if self.instrumentation is not None:
+                self.instrumentation.record(
+                    instrumentation.SERVICE_CORIOLIS, method, url,
+                    started_at, time.perf_counter() - start, resp=resp,
+                    status=status_code, retries=retries, error=error)
+
+        if error is not None:
+            raise error
+        return resp
+
+
+class _LazyManager(object):
+    """Builds the manager of a `Client` on first access.
+
+    The built manager gets cached in the instance's `__dict__`, which takes
+    precedence over this (non-data) descriptor on any later access. The
+    manager's module is only imported then as well, so that importing the
+    client does not import all of them.
+
+    :param manager_path: dotted path of the manager class, relative to
+        `coriolisclient.v1`
+    :param uses_endpoint_manager: have the manager share the endpoint
+        manager of the client, along with its index of the endpoint names
+    """
+
+    def __init__(self, manager_path, uses_licensing_client=False,
+                 uses_endpoint_manager=False):
+        self._manager_path = manager_path
+        self._uses_licensing_client = uses_licensing_client
+        self._uses_endpoint_manager = uses_endpoint_manager
+        self._name = None
+
+    def _get_manager_class(self):
+        module_name, class_name = self._manager_path.rsplit('.', 1)
+        module = importlib.import_module(
+            'coriolisclient.v1.%s' % module_name)
+        return getattr(module, class_name)
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        kwargs = {}
+        if self._uses_licensing_client:
+            kwargs['licensing_client'] = instance._licensing_client
+        if self._uses_endpoint_manager:
+            kwargs['endpoint_manager'] = instance.endpoints
+        manager = self._get_manager_class()(instance._httpclient, **kwargs)
+        instance.__dict__[self._name] = manager
+        return manager
 
 
 class Client(object):
+    """Coriolis API client.
+
+    Managers are only built on first access, and none of them looks up its
+    endpoint in the service catalog before issuing its first request, so
+    creating a client does not involve any request.
+
+    :param response_cache: optional `cache.ResponseCache` used for the
+        GET requests of the managers; it is invalidated by any other request
+        on the same collection
+    :param compact_resources: have the managers return
+        `base.CompactResource` objects, which do not duplicate the API data
+        in their attributes and whose `to_dict()` returns a read-only view
+    :param retry_policy: `retry.RetryPolicy` for the requests to the API;
+        pass `retry.RetryPolicy(max_retries=0)` to never retry
+    :param circuit_failure_threshold: consecutive failures of the API after
+        which requests fail fast with `exceptions.CircuitOpen`, or None
+    :param circuit_reset_timeout: seconds for which requests fail fast
+    :param rate_limiter: optional `ratelimit.RateLimiter` shared by the
+        requests to the API and to the licensing server
+    :param instrumentation: `instrumentation.Instrumentation` recording
+        the requests to the API, the licensing server and the logging
+        service, a new one with no sinks besides the in-memory histograms
+        of `stats()` by default
+    """
+
+    endpoints = _LazyManager('endpoints.EndpointManager')
+    endpoint_instances = _LazyManager(
+        'endpoint_instances.EndpointInstanceManager')
+    endpoint_networks = _LazyManager(
+        'endpoint_networks.EndpointNetworkManager')
+    endpoint_destination_options = _LazyManager(
+        'endpoint_destination_options.EndpointDestinationOptionsManager')
+    endpoint_source_minion_pool_options = _LazyManager(
+        'endpoint_source_minion_pool_options.'
+        'EndpointSourceMinionPoolOptionsManager')
+    endpoint_destination_minion_pool_options = _LazyManager(
+        'endpoint_destination_minion_pool_options.'
+        'EndpointDestinationMinionPoolOptionsManager')
+    endpoint_source_options = _LazyManager(
+        'endpoint_source_options.EndpointSourceOptionsManager')
+    endpoint_storage = _LazyManager(
+        'endpoint_storage.EndpointStorageManager')
+    migrations = _LazyManager('migrations.MigrationManager')
+    minion_pools = _LazyManager('minion_pools.MinionPoolManager')
+    providers = _LazyManager('providers.ProvidersManager')
+    replicas = _LazyManager(
+        'replicas.ReplicaManager', uses_endpoint_manager=True)
+    replica_schedules = _LazyManager(
+        'replica_schedules.ReplicaScheduleManager')
+    replica_executions = _LazyManager(
+        'replica_executions.ReplicaExecutionManager')
+    regions = _LazyManager('regions.RegionManager')
+    services = _LazyManager('services.ServiceManager')
+    logging = _LazyManager('logging.CoriolisLogDownloadManager')
+    diagnostics = _LazyManager('diagnostics.DiagnosticsManager')
+    licensing = _LazyManager(
+        'licensing.LicensingManager', uses_licensing_client=True)
+    licensing_appliances = _LazyManager(
+        'licensing_appliances.LicensingAppliancesManager',
+        uses_licensing_client=True)
+    licensing_reservations = _LazyManager(
+        'licensing_reservations.LicensingReservationsManager',
+        uses_licensing_client=True)
+    licensing_server = _LazyManager(
+        'licensing_server.LicensingServerManager',
+        uses_licensing_client=True)
+
     def __init__(self, session=None, *args, **kwargs):
-        httpclient = _HTTPClient(session=session, *args, **kwargs)
-
-        self.endpoints = endpoints.EndpointManager(httpclient)
-        self.endpoint_instances = endpoint_instances.EndpointInstanceManager(
-            httpclient)
-        self.endpoint_networks = endpoint_networks.EndpointNetworkManager(
-            httpclient)
-        self.endpoint_destination_options = (
-            endpoint_destination_options.EndpointDestinationOptionsManager(
-                httpclient))
-        self.endpoint_source_minion_pool_options = (
-            endpoint_source_minion_pool_options.
-            EndpointSourceMinionPoolOptionsManager(httpclient))
-        self.endpoint_destination_minion_pool_options = (
-            endpoint_destination_minion_pool_options.
-            EndpointDestinationMinionPoolOptionsManager(httpclient))
-        self.endpoint_source_options = (
-            endpoint_source_options.EndpointSourceOptionsManager(httpclient))
-        self.endpoint_storage = endpoint_storage.EndpointStorageManager(
-            httpclient)
-        self.migrations = migrations.MigrationManager(httpclient)
-        self.minion_pools = minion_pools.MinionPoolManager(httpclient)
-        self.providers = providers.ProvidersManager(httpclient)
-        self.replicas = replicas.ReplicaManager(httpclient)
-        self.replica_schedules = replica_schedules.ReplicaScheduleManager(
-            httpclient)
-        self.replica_executions = replica_executions.ReplicaExecutionManager(
-            httpclient)
-        self.regions = regions.RegionManager(httpclient)
-        self.services = services.ServiceManager(httpclient)
-        self.logging = coriolis_logging.CoriolisLogDownloadManager(httpclient)
-        self.diagnostics = diagnostics.DiagnosticsManager(httpclient)
-        self.licensing = licensing.LicensingManager(httpclient)
-        self.licensing_appliances = (
-            licensing_appliances.LicensingAppliancesManager(httpclient))
-        self.licensing_reservations = (
-            licensing_reservations.LicensingReservationsManager(httpclient))
-        self.licensing_server = (
-            licensing_server.LicensingServerManager(httpclient))
+        self._licensing_kwargs = {
+            key: kwargs.pop('licensing_%s' % key)
+            for key in ('pool_size', 'timeout')
+            if 'licensing_%s' % key in kwargs}
+        kwargs['instrumentation'] = (
+            kwargs.get('instrumentation') or
+            instrumentation.Instrumentation())
+        self._httpclient = _HTTPClient(session=session, *args, **kwargs)
+        self._licensing_cli = None
+
+    @property
+    def _licensing_client(self):
+        """The client shared by all licensing managers, built on first use.
+
+        Sharing it makes them all use the same pooled session.
+        """
+        if self._licensing_cli is None:
+            licensing = importlib.import_module('coriolisclient.v1.licensing')
+            self._licensing_cli = licensing.LicensingClient(
+                self._httpclient,
+                rate_limiter=self._httpclient.rate_limiter,
+                instrumentation=self._httpclient.instrumentation,
+                **self._licensing_kwargs)
+        return self._licensing_cli
+
+    def stats(self):
+        """Returns the stats of the requests issued so far.
+
+        See `instrumentation.HistogramSink.snapshot()` for their format.
+        """
+        return self._httpclient.instrumentation.stats()
+
+    def get_retry_metrics(self):
+        """Returns the counts and total delay of the retried requests."""
+        return self._httpclient.retry_metrics.snapshot()
@@ -16,6 +16,46 @@
 MIGRATION_STATUS_RUNNING = "RUNNING"
 MIGRATION_STATUS_COMPLETED = "COMPLETED"
 MIGRATION_STATUS_ERROR = "ERROR"
+MIGRATION_STATUS_CANCELED = "CANCELED"
+MIGRATION_STATUS_DEADLOCKED = "DEADLOCKED"
+MIGRATION_STATUS_CANCELED_FOR_DEBUGGING = "CANCELED_FOR_DEBUGGING"
+MIGRATION_STATUS_ERROR_ALLOCATING_MINIONS = "ERROR_ALLOCATING_MINIONS"
+
+FINALIZED_MIGRATION_STATUSES = [
+    MIGRATION_STATUS_COMPLETED,
+    MIGRATION_STATUS_ERROR,
+    MIGRATION_STATUS_CANCELED,
+    MIGRATION_STATUS_DEADLOCKED,
+    MIGRATION_STATUS_CANCELED_FOR_DEBUGGING,
+    MIGRATION_STATUS_ERROR_ALLOCATING_MINIONS,
+]
+
+EXECUTION_STATUS_RUNNING = "RUNNING"
+EXECUTION_STATUS_COMPLETED = "COMPLETED"
+EXECUTION_STATUS_ERROR = "ERROR"
+EXECUTION_STATUS_CANCELED = "CANCELED"
+EXECUTION_STATUS_DEADLOCKED = "DEADLOCKED"
+EXECUTION_STATUS_CANCELED_FOR_DEBUGGING = "CANCELED_FOR_DEBUGGING"
+EXECUTION_STATUS_ERROR_ALLOCATING_MINIONS = "ERROR_ALLOCATING_MINIONS"
+
+FINALIZED_EXECUTION_STATUSES = [
+    EXECUTION_STATUS_COMPLETED,
+    EXECUTION_STATUS_ERROR,
+    EXECUTION_STATUS_CANCELED,
+    EXECUTION_STATUS_DEADLOCKED,
+    EXECUTION_STATUS_CANCELED_FOR_DEBUGGING,
+    EXECUTION_STATUS_ERROR_ALLOCATING_MINIONS,
+]
+
+MINION_POOL_STATUS_ALLOCATED = "ALLOCATED"
+MINION_POOL_STATUS_DEALLOCATED = "DEALLOCATED"
+MINION_POOL_STATUS_ERROR = "ERROR"
+
+FINALIZED_MINION_POOL_STATUSES = [
+    MINION_POOL_STATUS_ALLOCATED,
+    MINION_POOL_STATUS_DEALLOCATED,
+    MINION_POOL_STATUS_ERROR,
+]
 
 TASK_STATUS_PENDING = "PENDING"
 TASK_STATUS_RUNNING = "RUNNING"
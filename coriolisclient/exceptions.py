@@ -85,3 +85,52 @@ class LicensingEndpointNotFound(CoriolisException):
         super(LicensingEndpointNotFound, self).__init__(
             "Provided licensing endpoint: '%s' not found in the service "
             "catalogue" % endpoint_id)
+
+
+class WaitTimeout(CoriolisException):
+    """Raised when a resource did not reach a final status in time"""
+
+    def __init__(self, resource_id, status, timeout):
+        super(WaitTimeout, self).__init__(
+            "'%s' is still in status '%s' after waiting for %s seconds" % (
+                resource_id, status, timeout))
+
+
+class FleetWaitTimeout(WaitTimeout):
+    """Raised when some of the watched resources did not finish in time"""
+
+    def __init__(self, resource_ids, timeout):
+        self.resource_ids = resource_ids
+        CoriolisException.__init__(
+            self, "%d resources still not finished after waiting for %s "
+            "seconds: %s" % (
+                len(resource_ids), timeout, ", ".join(resource_ids)))
+
+
+class WaitCanceled(CoriolisException):
+    """Raised when waiting on a resource was canceled by the caller"""
+
+    def __init__(self, resource_id):
+        super(WaitCanceled, self).__init__(
+            "Waiting on '%s' was canceled" % resource_id)
+
+
+class CircuitOpen(CoriolisException):
+    """Raised when requests to a failing endpoint are failed fast"""
+
+    def __init__(self, endpoint, retry_in):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super(CircuitOpen, self).__init__(
+            "Requests to '%s' are failing, not trying again for another "
+            "%.1f seconds" % (endpoint, retry_in))
+
+
+class LazyLoadingNotSupported(CoriolisException):
+    """Raised when lazily loading details through an async manager"""
+
+    def __init__(self, resource_name, key):
+        super(LazyLoadingNotSupported, self).__init__(
+            "The '%s' detail of this %s was not listed and cannot be lazily "
+            "loaded through an asyncio client: await the manager's get() "
+            "for the full resource instead." % (key, resource_name))
@@ -0,0 +1,308 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Instrumentation of the requests issued by the clients.
+
+Each request produces a `RequestRecord`, which gets fed to a set of sinks:
+in-memory histograms, a JSON Lines file or Python logging.
+"""
+
+import bisect
+import collections
+import json
+import logging
+import re
+import threading
+
+from six.moves.urllib import parse as urlparse
+
+
+LOG = logging.getLogger(__name__)
+
+SERVICE_CORIOLIS = "coriolis"
+SERVICE_LICENSING = "licensing"
+SERVICE_LOGGING = "logging"
+
+# NOTE: upper bounds in seconds of the latency histogram buckets, the last
+# bucket holding all the slower requests:
+LATENCY_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+_ID_SEGMENT_REGEX = re.compile(
+    r"^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-"
+    r"[0-9a-fA-F]{12}|[0-9a-fA-F]{32}|[0-9]+)$")
+_ID_PLACEHOLDER = "{id}"
+# NOTE: collections whose members are addressed by opaque IDs, such as the
+# base64 encoded IDs of the endpoint instances:
+_OPAQUE_ID_COLLECTIONS = ("instances",)
+
+
+RequestRecord = collections.namedtuple('RequestRecord', [
+    'service', 'method', 'url', 'status', 'latency', 'request_bytes',
+    'response_bytes', 'retries', 'error', 'started_at'])
+RequestRecord.__doc__ = """Outcome of a request issued by a client.
+
+`url` is the path of the request with its IDs replaced by `{id}` and its
+query string dropped. `latency` is in seconds and covers all the retries
+of the request. `status` is None if no response was received, in which
+case `error` holds the name of the exception raised.
+"""
+
+
+def get_url_template(url):
+    """Returns the path of a URL with its IDs replaced by placeholders."""
+    segments = urlparse.urlsplit(url).path.split("/")
+    for i, segment in enumerate(segments):
+        if _ID_SEGMENT_REGEX.match(segment) or (
+                i > 0 and segment and
+                segments[i - 1] in _OPAQUE_ID_COLLECTIONS):
+            segments[i] = _ID_PLACEHOLDER
+    return "/".join(segments)
+
+
+def get_request_bytes(resp):
+    """Returns the size of the body sent along a `requests` response."""
+    try:
+        body = resp.request.body
+        if body is None:
+            return 0
+        if isinstance(body, str):
+            return len(body.encode('utf-8'))
+        return len(body)
+    except (AttributeError, TypeError):
+        return None
+
+
+def get_response_bytes(resp):
+    """Returns the size of the body of a `requests` response.
+
+    The body is only measured if already read, streamed responses being
+    sized by their `Content-Length` only.
+    """
+    try:
+        content_length = resp.headers.get('Content-Length')
+        if content_length is not None:
+            return int(content_length)
+        if getattr(resp, '_content_consumed', False):
+            return len(resp.content)
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return None
+
+
+class _Histogram(object):
+    """Counts of values falling within fixed buckets."""
+
+    def __init__(self, buckets):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.
+        self.min = None
+        self.max = None
+
+    def add(self, value):
+        self._counts[bisect.bisect_left(self._buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def get_percentile(self, percentile):
+        """Returns an upper bound of the given percentile of the values."""
+        if not self.count:
+            return None
+        rank = percentile / 100. * self.count
+        cumulative = 0
+        for index, count in enumerate(self._counts):
+            cumulative += count
+            if cumulative >= rank:
+                if index < len(self._buckets):
+                    return min(self._buckets[index], self.max)
+                break
+        return self.max
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max,
+            'mean': self.total / self.count if self.count else None,
+            'p50': self.get_percentile(50),
+            'p90': self.get_percentile(90),
+            'p99': self.get_percentile(99),
+            'buckets': dict(zip(
+                [str(b) for b in self._buckets] + ['+Inf'], self._counts)),
+        }
+
+
+class _RequestStats(object):
+
+    def __init__(self):
+        self.latency = _Histogram(LATENCY_BUCKETS)
+        self.statuses = collections.Counter()
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def add(self, record):
+        self.latency.add(record.latency)
+        self.statuses[str(record.status)] += 1
+        if record.error is not None or (
+                record.status is not None and record.status >= 400):
+            self.errors += 1
+        self.retries += record.retries
+        self.request_bytes += record.request_bytes or 0
+        self.response_bytes += record.response_bytes or 0
+
+
+class HistogramSink(object):
+    """Aggregates the records in memory, by service, method and URL."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def __call__(self, record):
+        key = (record.service, record.method, record.url)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = _RequestStats()
+            stats.add(record)
+
+    def snapshot(self):
+        """Returns the stats of each kind of request, slowest overall first.
+
+        :returns: list of dicts, holding the `service`, `method` and `url`
+            of the requests, their `count`, `errors`, `retries`, counts by
+            `statuses`, total `request_bytes` and `response_bytes`, and
+            `latency` figures in seconds
+        """
+        with self._lock:
+            result = []
+            for (service, method, url), stats in self._stats.items():
+                result.append({
+                    'service': service,
+                    'method': method,
+                    'url': url,
+                    'count': stats.latency.count,
+                    'errors': stats.errors,
+                    'retries': stats.retries,
+                    'statuses': dict(stats.statuses),
+                    'request_bytes': stats.request_bytes,
+                    'response_bytes': stats.response_bytes,
+                    'latency': stats.latency.to_dict(),
+                })
+        result.sort(key=lambda s: s['latency']['total'], reverse=True)
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+class JSONLinesSink(object):
+    """Appends each record as a JSON document on its own line of a file."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a')
+
+    def __call__(self, record):
+        line = json.dumps(record._asdict())
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class LoggingSink(object):
+    """Logs each record through Python logging."""
+
+    def __init__(self, logger=None, level=logging.DEBUG):
+        self._logger = logger or LOG
+        self._level = level
+
+    def __call__(self, record):
+        self._logger.log(
+            self._level, "%s %s %s: %s in %.3fs (sent %s bytes, received %s "
+            "bytes, %d retries)", record.service, record.method, record.url,
+            record.status or record.error, record.latency,
+            record.request_bytes, record.response_bytes, record.retries)
+
+
+class Instrumentation(object):
+    """Feeds the records of the requests issued by the clients to sinks.
+
+    The in-memory histograms are always kept, and available through
+    `stats()`. Sinks are callables taking a `RequestRecord`; a failing sink
+    does not fail the request being recorded.
+
+    :param sinks: additional sinks, such as `JSONLinesSink` or
+        `LoggingSink` instances
+    """
+
+    def __init__(self, sinks=None):
+        self.histograms = HistogramSink()
+        self._sinks = [self.histograms] + list(sinks or [])
+
+    def add_sink(self, sink):
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink):
+        self._sinks.remove(sink)
+
+    def record(self, service, method, url, started_at, latency, resp=None,
+               status=None, retries=0, error=None, response_bytes=None):
+        """Records a request.
+
+        :param started_at: UNIX timestamp at which the request started
+        :param resp: the `requests` response received, if any, out of which
+            the status and sizes are taken
+        :param error: the exception raised by the request, if any
+        :param response_bytes: size of the response body, if known better
+            than from `resp`
+        """
+        request_bytes = None
+        if resp is not None:
+            if status is None:
+                status = getattr(resp, 'status_code', None)
+            request_bytes = get_request_bytes(resp)
+            if response_bytes is None:
+                response_bytes = get_response_bytes(resp)
+        record = RequestRecord(
+            service, method.upper(), get_url_template(url), status, latency,
+            request_bytes, response_bytes, retries,
+            type(error).__name__ if error is not None else None, started_at)
+        for sink in list(self._sinks):
+            try:
+                sink(record)
+            except Exception as ex:
+                LOG.warning(
+                    "Failed to record request in sink %s: %s", sink, ex)
+
+    def stats(self):
+        """Returns the in-memory stats, see `HistogramSink.snapshot()`."""
+        return self.histograms.snapshot()
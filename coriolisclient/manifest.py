@@ -0,0 +1,128 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Loading of manifests describing many resources to be created at once.
+
+A manifest is either a YAML or JSON document holding a list of rows, or
+a mapping with a `rows` list and optional `defaults` applied to each row,
+or a CSV file with one row per line. Row keys are the arguments of the
+matching manager's `create()` method.
+"""
+
+import csv
+import json
+import os
+
+from coriolisclient import exceptions
+
+
+FORMAT_CSV = "csv"
+FORMAT_JSON = "json"
+FORMAT_YAML = "yaml"
+
+FORMATS = [FORMAT_CSV, FORMAT_JSON, FORMAT_YAML]
+
+_FORMATS_BY_EXTENSION = {
+    ".csv": FORMAT_CSV,
+    ".json": FORMAT_JSON,
+    ".yaml": FORMAT_YAML,
+    ".yml": FORMAT_YAML,
+}
+
+# NOTE: CSV cells of these columns hold lists separated by this char:
+CSV_LIST_SEPARATOR = ";"
+CSV_LIST_FIELDS = ["instances"]
+# NOTE: CSV cells of these columns hold JSON documents:
+CSV_JSON_FIELDS = [
+    "source_environment",
+    "destination_environment",
+    "network_map",
+    "storage_mappings",
+    "instance_osmorphing_minion_pool_mappings",
+    "user_scripts",
+]
+
+
+def get_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    fmt = _FORMATS_BY_EXTENSION.get(extension)
+    if fmt is None:
+        raise exceptions.CoriolisException(
+            "Cannot tell the format of manifest '%s' from its extension, "
+            "expected one of: %s" % (
+                path, ", ".join(sorted(_FORMATS_BY_EXTENSION))))
+    return fmt
+
+
+def _parse_csv_row(row):
+    parsed = {}
+    for key, value in row.items():
+        if key is None:
+            raise exceptions.CoriolisException(
+                "CSV manifest row has more cells than columns: %s" % row)
+        value = (value or "").strip()
+        if not value:
+            continue
+        if key in CSV_LIST_FIELDS:
+            value = [v.strip() for v in value.split(CSV_LIST_SEPARATOR)
+                     if v.strip()]
+        elif key in CSV_JSON_FIELDS:
+            try:
+                value = json.loads(value)
+            except ValueError as ex:
+                raise exceptions.CoriolisException(
+                    "Invalid JSON in column '%s' of the CSV manifest: "
+                    "%s" % (key, ex))
+        parsed[key] = value
+    return parsed
+
+
+def _load_document(fin, fmt):
+    if fmt == FORMAT_JSON:
+        return json.load(fin)
+
+    try:
+        import yaml
+    except ImportError:
+        raise exceptions.CoriolisException(
+            "PyYAML must be installed to read YAML manifests")
+    return yaml.safe_load(fin)
+
+
+def load(path, fmt=None):
+    """Loads the rows of a manifest file.
+
+    :param path: path of the manifest
+    :param fmt: one of `FORMATS`, guessed from the extension if None
+    :returns: list of dicts, one per row
+    """
+    fmt = fmt or get_format(path)
+    with open(path, 'r', newline='') as fin:
+        if fmt == FORMAT_CSV:
+            return [_parse_csv_row(row) for row in csv.DictReader(fin)]
+        document = _load_document(fin, fmt)
+
+    defaults = {}
+    rows = document
+    if isinstance(document, dict):
+        defaults = document.get("defaults") or {}
+        rows = document.get("rows")
+    if not isinstance(rows, list) or not all(
+            isinstance(row, dict) for row in rows):
+        raise exceptions.CoriolisException(
+            "Manifest '%s' must hold a list of rows, either at its top "
+            "level or under 'rows'" % path)
+    return [dict(defaults, **row) for row in rows]
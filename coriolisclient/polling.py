@@ -0,0 +1,323 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers for waiting on long running operations.
+"""
+
+import collections
+import logging
+import random
+import time
+
+from coriolisclient import cache
+from coriolisclient import exceptions
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MIN_INTERVAL = 1
+DEFAULT_MAX_INTERVAL = 30
+DEFAULT_BACKOFF_FACTOR = 2
+
+
+StatusChange = collections.namedtuple(
+    'StatusChange', ['id', 'resource', 'previous_status', 'status', 'final'])
+StatusChange.__doc__ = """Status change of one of the resources being watched.
+
+`resource` is None, as well as `status`, if the resource is no longer
+listed, which is considered final as well.
+"""
+
+
+def _get_id(resource):
+    return resource._info.get('id')
+
+
+class Backoff(object):
+    """Exponentially growing intervals, with jitter.
+
+    Each interval is drawn between half and the whole of the current
+    backoff, which doubles (by default) after each draw up to
+    `max_interval`, so that many waiters started at once do not poll in
+    lockstep.
+    """
+
+    def __init__(self, min_interval=DEFAULT_MIN_INTERVAL,
+                 max_interval=DEFAULT_MAX_INTERVAL,
+                 factor=DEFAULT_BACKOFF_FACTOR):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError(
+                "Intervals must be positive, with 'max_interval' not lower "
+                "than 'min_interval'")
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._factor = factor
+        self._current = min_interval
+
+    def reset(self):
+        self._current = self._min_interval
+
+    def next_interval(self):
+        interval = random.uniform(self._current / 2., self._current)
+        self._current = min(self._current * self._factor, self._max_interval)
+        return interval
+
+
+def get_status(resource):
+    return resource._info.get('status')
+
+
+def get_migration_status(resource):
+    """Returns the status of a migration, which is its last execution's."""
+    return (resource._info.get('last_execution_status') or
+            resource._info.get('status'))
+
+
+def get_tasks_progress(resource):
+    """Returns a marker which changes whenever the resource's tasks progress.
+
+    Works on migrations and replica executions, whose tasks are part of
+    their `_info`, without building the task resources.
+    """
+    return tuple(
+        (task.get('status'), len(task.get('progress_updates') or []))
+        for task in resource._info.get('tasks') or [])
+
+
+def get_events_progress(resource):
+    """Returns a marker which changes whenever a minion pool progresses."""
+    return (
+        len(resource._info.get('events') or []),
+        len(resource._info.get('progress_updates') or []))
+
+
+class Waiter(object):
+    """Decides for how long to sleep between polls of a resource.
+
+    The interval grows exponentially while the resource shows no progress,
+    and drops back to the minimum as soon as it progresses again.
+
+    :param final_statuses: statuses on which waiting ends
+    :param timeout: seconds after which `exceptions.WaitTimeout` is raised,
+        or None to wait for as long as it takes
+    :param get_progress: callable returning a progress marker for a
+        polled resource, or None
+    :param get_status: callable returning the status of a polled resource
+    :param min_interval: minimum seconds between polls
+    :param max_interval: maximum seconds between polls
+    """
+
+    def __init__(self, final_statuses, timeout=None, get_progress=None,
+                 min_interval=DEFAULT_MIN_INTERVAL,
+                 max_interval=DEFAULT_MAX_INTERVAL, get_status=get_status):
+        self._final_statuses = final_statuses
+        self.get_status = get_status
+        self.timeout = timeout
+        self._get_progress = get_progress
+        self._backoff = Backoff(min_interval, max_interval)
+        self._deadline = None
+        if timeout is not None:
+            self._deadline = time.monotonic() + timeout
+        self._progress = None
+
+    def get_interval(self, resource):
+        """Returns the seconds to sleep before polling the resource again.
+
+        :returns: None if the resource reached one of the final statuses
+        :raises: exceptions.WaitTimeout if the deadline has passed
+        """
+        status = self.get_status(resource)
+        if self.is_final(status):
+            return None
+
+        progressed = False
+        if self._get_progress is not None:
+            progress = self._get_progress(resource)
+            progressed = progress != self._progress
+            self._progress = progress
+
+        interval = self.next_interval(progressed)
+        if interval is None:
+            raise exceptions.WaitTimeout(
+                _get_id(resource), status, self.timeout)
+        LOG.debug(
+            "'%s' is in status '%s', polling again in %.1f seconds",
+            _get_id(resource), status, interval)
+        return interval
+
+    def is_final(self, status):
+        return status in self._final_statuses
+
+    def next_interval(self, progressed=False):
+        """Returns the seconds to sleep, or None if the deadline passed."""
+        if progressed:
+            self._backoff.reset()
+        interval = self._backoff.next_interval()
+        if self._deadline is not None:
+            remaining = self._deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            interval = min(interval, remaining)
+        return interval
+
+
+def wait_for(get_func, waiter, cancel_event=None):
+    """Polls a resource until it reaches one of the waiter's final statuses.
+
+    :param get_func: callable returning the current state of the resource
+    :param waiter: `Waiter` instance
+    :param cancel_event: `threading.Event` which aborts waiting when set
+    :returns: the resource in its final status
+    :raises: exceptions.WaitTimeout, exceptions.WaitCanceled
+    """
+    while True:
+        with cache.bypass():
+            resource = get_func()
+        interval = waiter.get_interval(resource)
+        if interval is None:
+            return resource
+        if cancel_event is None:
+            time.sleep(interval)
+        elif cancel_event.wait(interval):
+            raise exceptions.WaitCanceled(_get_id(resource))
+
+
+async def sleep_async(interval, cancel_event=None):
+    """Sleeps for the given interval.
+
+    :returns: True if the cancel event got set in the meantime
+    """
+    # NOTE: asyncio takes a while to import, and is only needed by the
+    # coroutines, which the synchronous callers never use:
+    import asyncio
+
+    if cancel_event is None:
+        await asyncio.sleep(interval)
+        return False
+    try:
+        await asyncio.wait_for(cancel_event.wait(), interval)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+async def wait_for_async(get_func, waiter, cancel_event=None):
+    """Coroutine counterpart of `wait_for()`.
+
+    :param get_func: coroutine function returning the current state of the
+        resource
+    :param cancel_event: `asyncio.Event` which aborts waiting when set
+    """
+    while True:
+        resource = await get_func()
+        interval = waiter.get_interval(resource)
+        if interval is None:
+            return resource
+        if await sleep_async(interval, cancel_event):
+            raise exceptions.WaitCanceled(_get_id(resource))
+
+
+class _FleetState(object):
+    """Tracks the statuses of many resources across listings."""
+
+    def __init__(self, ids, waiter):
+        # NOTE: a dict keeps events in the order the IDs were given in:
+        self.pending = dict.fromkeys(ids)
+        self._waiter = waiter
+
+    def update(self, resources):
+        """Returns the status changes since the previous listing."""
+        listed = {}
+        for resource in resources:
+            resource_id = _get_id(resource)
+            if resource_id in self.pending:
+                listed[resource_id] = resource
+
+        changes = []
+        for resource_id, previous_status in list(self.pending.items()):
+            resource = listed.get(resource_id)
+            status = None
+            if resource is not None:
+                status = self._waiter.get_status(resource)
+            final = resource is None or self._waiter.is_final(status)
+            if final or status != previous_status:
+                changes.append(StatusChange(
+                    resource_id, resource, previous_status, status, final))
+            if final:
+                del self.pending[resource_id]
+            else:
+                self.pending[resource_id] = status
+        return changes
+
+    def next_interval(self, progressed):
+        interval = self._waiter.next_interval(progressed)
+        if interval is None:
+            raise exceptions.FleetWaitTimeout(
+                list(self.pending), self._waiter.timeout)
+        LOG.debug(
+            "%d resources still pending, polling again in %.1f seconds",
+            len(self.pending), interval)
+        return interval
+
+
+def watch(list_func, ids, waiter, cancel_event=None):
+    """Yields the status changes of many resources, polling with listings.
+
+    Each polling cycle issues a single listing, no matter how many
+    resources are being watched, and the polling interval drops back to
+    the minimum whenever any of them changes status. The first cycle
+    yields the initial status of each resource.
+
+    :param list_func: callable listing the resources
+    :param ids: IDs of the resources to watch
+    :param waiter: `Waiter` instance
+    :param cancel_event: `threading.Event` which aborts watching when set
+    :returns: generator of `StatusChange`, ending once all the resources
+        reached a final status
+    :raises: exceptions.FleetWaitTimeout, exceptions.WaitCanceled
+    """
+    state = _FleetState(ids, waiter)
+    while state.pending:
+        with cache.bypass():
+            resources = list_func()
+        changes = state.update(resources)
+        for change in changes:
+            yield change
+        if not state.pending:
+            return
+        interval = state.next_interval(bool(changes))
+        if cancel_event is None:
+            time.sleep(interval)
+        elif cancel_event.wait(interval):
+            raise exceptions.WaitCanceled(", ".join(state.pending))
+
+
+async def watch_async(list_func, ids, waiter, cancel_event=None):
+    """Asynchronous generator counterpart of `watch()`.
+
+    :param list_func: coroutine function listing the resources
+    :param cancel_event: `asyncio.Event` which aborts watching when set
+    """
+    state = _FleetState(ids, waiter)
+    while state.pending:
+        changes = state.update(await list_func())
+        for change in changes:
+            yield change
+        if not state.pending:
+            return
+        interval = state.next_interval(bool(changes))
+        if await sleep_async(interval, cancel_event):
+            raise exceptions.WaitCanceled(", ".join(state.pending))
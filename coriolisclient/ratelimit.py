@@ -0,0 +1,186 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Client-side rate limiting of API requests.
+"""
+
+import logging
+import re
+import threading
+import time
+
+
+LOG = logging.getLogger(__name__)
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket.
+
+    Tokens are added at a steady `rate` and up to `capacity`, which
+    bounds the size of bursts after idle periods.
+
+    :param rate: tokens added per second
+    :param capacity: maximum number of tokens, defaulting to `rate`
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError("'rate' must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self, tokens=1):
+        """Takes tokens from the bucket, going into debt if there are none.
+
+        Later callers have to wait for the debt to be paid back as well, so
+        that tokens are handed out in the order they were asked for.
+
+        :returns: the seconds to wait before using the tokens
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+    def try_acquire(self, tokens=1):
+        """Takes tokens from the bucket without blocking.
+
+        :returns: 0 if the tokens were taken, else the seconds after which
+            enough tokens should be available
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens=1):
+        """Takes tokens from the bucket, waiting for them if needed.
+
+        :returns: the seconds spent waiting
+        """
+        waited = 0
+        while True:
+            wait = self.try_acquire(tokens)
+            if not wait:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+
+class Quota(object):
+    """Rate limit of the requests matching a method and a URL pattern.
+
+    In patterns, `*` matches a single path segment, and a pattern also
+    matches the paths nested under it, so that `/endpoints/*/instances`
+    covers both listing and getting the instances of any endpoint.
+
+    :param rate: requests allowed per second
+    :param capacity: maximum burst of requests, defaulting to `rate`
+    :param method: HTTP method of the matching requests, or None for all
+    :param pattern: URL path pattern of the matching requests, or None for
+        all
+    """
+
+    def __init__(self, rate, capacity=None, method=None, pattern=None):
+        self.method = method.upper() if method else None
+        self.pattern = pattern
+        self._regex = None
+        if pattern:
+            self._regex = re.compile("^%s(/.*)?$" % "[^/]*".join(
+                re.escape(part) for part in pattern.rstrip('/').split('*')))
+        self.bucket = TokenBucket(rate, capacity=capacity)
+
+    def matches(self, method, path):
+        if self.method is not None and self.method != method.upper():
+            return False
+        return self._regex is None or bool(self._regex.match(path))
+
+    def __repr__(self):
+        return "<Quota %s %s: %s/s>" % (
+            self.method or "*", self.pattern or "*", self.bucket.rate)
+
+
+def parse_quota(value):
+    """Parses a quota given as `[METHOD ]PATTERN=RATE`.
+
+    :raises: ValueError if the value is malformed
+    """
+    target, sep, rate = value.rpartition('=')
+    if not sep or not target.strip():
+        raise ValueError(
+            "Quota '%s' is not of the form '[METHOD ]PATTERN=RATE'" % value)
+    method = None
+    pattern = target.strip()
+    if ' ' in pattern:
+        method, pattern = pattern.split(None, 1)
+    return Quota(float(rate), method=method, pattern=pattern)
+
+
+class RateLimiter(object):
+    """Rate limits all the requests of a client.
+
+    Every request takes a token from the client-wide budget, if any, and
+    from each quota it matches. Once a budget is spent, requests block
+    until their turn comes, in the order they were issued, so that
+    concurrent jobs sharing a client get served fairly.
+
+    :param rate: requests allowed per second overall, or None for no limit
+    :param capacity: maximum burst of requests overall
+    :param quotas: list of `Quota` for specific methods and URLs
+    """
+
+    def __init__(self, rate=None, capacity=None, quotas=None):
+        self._bucket = None
+        if rate:
+            self._bucket = TokenBucket(rate, capacity=capacity)
+        self.quotas = list(quotas or [])
+
+    def _get_buckets(self, method, url):
+        path = url.split('?', 1)[0]
+        buckets = [
+            quota.bucket for quota in self.quotas
+            if quota.matches(method, path)]
+        if self._bucket is not None:
+            buckets.append(self._bucket)
+        return buckets
+
+    def acquire(self, method, url):
+        """Waits until a request may be issued.
+
+        :param url: URL or path of the request
+        :returns: the seconds spent waiting
+        """
+        wait = 0
+        for bucket in self._get_buckets(method, url):
+            wait = max(wait, bucket.reserve())
+        if wait:
+            LOG.debug(
+                "Rate limiting %s %s for %.2f seconds", method, url, wait)
+            time.sleep(wait)
+        return wait
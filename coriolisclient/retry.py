@@ -0,0 +1,243 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Retrying of API requests on transient failures.
+"""
+
+import collections
+import datetime
+from email import utils as email_utils
+import logging
+import random
+import threading
+import time
+
+from coriolisclient import exceptions
+
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30
+
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+# NOTE: statuses meaning the API is down, as opposed to merely busy:
+FAILURE_STATUS_CODES = (502, 503, 504)
+
+
+def parse_retry_after(value):
+    """Returns the seconds to wait as per a `Retry-After` header value.
+
+    :param value: either a number of seconds or an HTTP date
+    :returns: the seconds to wait, or None if the value is invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email_utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(0., (
+        retry_at - datetime.datetime.now(datetime.timezone.utc)
+    ).total_seconds())
+
+
+class RetryPolicy(object):
+    """Decides which failed requests are retried, and after how long.
+
+    Delays follow the "decorrelated jitter" backoff, each being drawn
+    between `base_delay` and three times the previous one, up to
+    `max_delay`, which spreads out the retries of many clients failing at
+    once. A `Retry-After` header sent along a retried response takes
+    precedence, up to `max_delay`.
+
+    :param max_retries: maximum number of retries of a request
+    :param base_delay: minimum seconds to wait before a retry
+    :param max_delay: maximum seconds to wait before a retry
+    :param methods: HTTP methods of the requests which may be retried,
+        which should be the idempotent ones
+    :param status_codes: response statuses on which to retry
+    """
+
+    def __init__(self, max_retries=DEFAULT_MAX_RETRIES,
+                 base_delay=DEFAULT_BASE_DELAY, max_delay=DEFAULT_MAX_DELAY,
+                 methods=IDEMPOTENT_METHODS, status_codes=RETRY_STATUS_CODES):
+        if max_retries < 0:
+            raise ValueError("'max_retries' must not be negative")
+        if base_delay <= 0 or max_delay < base_delay:
+            raise ValueError(
+                "Delays must be positive, with 'max_delay' not lower than "
+                "'base_delay'")
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.methods = frozenset(m.upper() for m in methods)
+        self.status_codes = frozenset(status_codes)
+
+    def is_retryable(self, method, status_code=None):
+        """Tells whether a request may be retried.
+
+        :param status_code: status of the response, or None if the request
+            failed to connect
+        """
+        if method.upper() not in self.methods:
+            return False
+        return status_code is None or status_code in self.status_codes
+
+    def get_delay(self, previous_delay=None, retry_after=None):
+        """Returns the seconds to wait before the next retry.
+
+        :param previous_delay: the delay before the previous retry, or None
+            ahead of the first one
+        :param retry_after: the seconds asked for by the server, if any
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        upper = max(self.base_delay, (previous_delay or 0) * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+
+class CircuitBreaker(object):
+    """Fails requests fast while an endpoint keeps failing.
+
+    The circuit opens after `failure_threshold` consecutive failures, all
+    requests then failing with `exceptions.CircuitOpen` without reaching
+    the endpoint. After `reset_timeout` seconds a single trial request is
+    let through, which closes the circuit if it succeeds, or opens it for
+    another `reset_timeout` if it fails.
+
+    :param name: name of the endpoint, for error messages
+    """
+
+    def __init__(self, name, failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout=DEFAULT_RESET_TIMEOUT, metrics=None):
+        if failure_threshold < 1:
+            raise ValueError("'failure_threshold' must be at least 1")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._metrics = metrics
+        self._failures = 0
+        self._opened_at = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self._opened_at is not None
+
+    def before_request(self):
+        """Checks whether a request may go through.
+
+        :raises: exceptions.CircuitOpen if it may not
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self._opened_at + self.reset_timeout - (
+                time.monotonic())
+            if remaining <= 0 and not self._trial_running:
+                LOG.debug(
+                    "Letting a trial request through to '%s'", self.name)
+                self._trial_running = True
+                return
+        if self._metrics is not None:
+            self._metrics.record_rejection()
+        raise exceptions.CircuitOpen(self.name, max(remaining, 0))
+
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                LOG.info("Circuit to '%s' closed", self.name)
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            reopened = self._trial_running
+            self._trial_running = False
+            if not reopened and (
+                    self._opened_at is not None or
+                    self._failures < self.failure_threshold):
+                return
+            self._opened_at = time.monotonic()
+        LOG.warning(
+            "Circuit to '%s' opened after %d consecutive failures",
+            self.name, self._failures)
+        if self._metrics is not None:
+            self._metrics.record_circuit_open()
+
+
+class RetryMetrics(object):
+    """Thread-safe counters of the retries issued by a client."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = collections.Counter()
+        self._retries_by_reason = collections.Counter()
+        self._delay = 0.
+
+    def record_retry(self, reason, delay):
+        with self._lock:
+            self._counts['retries'] += 1
+            self._retries_by_reason[reason] += 1
+            self._delay += delay
+
+    def record_retried_request(self, succeeded):
+        with self._lock:
+            self._counts['retried_requests'] += 1
+            if not succeeded:
+                self._counts['exhausted_requests'] += 1
+
+    def record_circuit_open(self):
+        with self._lock:
+            self._counts['circuit_opens'] += 1
+
+    def record_rejection(self):
+        with self._lock:
+            self._counts['circuit_rejections'] += 1
+
+    def snapshot(self):
+        """Returns the current values of the metrics as a dict."""
+        with self._lock:
+            return {
+                'retries': self._counts['retries'],
+                'retries_by_reason': dict(self._retries_by_reason),
+                'retry_delay': self._delay,
+                'retried_requests': self._counts['retried_requests'],
+                'exhausted_requests': self._counts['exhausted_requests'],
+                'circuit_opens': self._counts['circuit_opens'],
+                'circuit_rejections': self._counts['circuit_rejections'],
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counts.clear()
+            self._retries_by_reason.clear()
+            self._delay = 0.
@@ -0,0 +1,220 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Scheduling of many long running operations under concurrency caps.
+"""
+
+import collections
+import logging
+import time
+
+from coriolisclient import bulk
+from coriolisclient import cache
+from coriolisclient import exceptions
+from coriolisclient import polling
+
+
+LOG = logging.getLogger(__name__)
+
+
+class SlidingWindowScheduler(object):
+    """Keeps as many operations running as the concurrency caps allow.
+
+    Operations are started in the given order, skipping over the ones
+    which would exceed a cap for as long as they would. Running operations
+    are all polled at once with a single listing per cycle, and new ones
+    are started as soon as earlier ones finish.
+
+    Each operation has a demand on a set of resources, such as 1 on its
+    origin endpoint or the number of its instances on a minion pool. An
+    operation only starts if none of these resources would exceed its
+    capacity, unless nothing else is running on them, so that operations
+    demanding more than a whole capacity still run, one at a time.
+
+    :param start_func: callable starting the operation of an item and
+        returning its resource (e.g. an execution), or coroutine function
+        doing so when using `run_async()`
+    :param list_func: callable listing the resources of all operations, or
+        coroutine function doing so when using `run_async()`
+    :param waiter: `polling.Waiter` deciding the polling intervals and
+        which statuses are final
+    :param get_demands: callable returning a dict mapping the resources
+        an item's operation uses to the amount it uses of each
+    :param get_capacity: callable returning the capacity of a resource,
+        or None if unlimited
+    :param max_running: maximum number of operations running at once, or
+        None for no limit
+    """
+
+    def __init__(self, start_func, list_func, waiter, get_demands=None,
+                 get_capacity=None, max_running=None):
+        if max_running is not None and max_running < 1:
+            raise ValueError("'max_running' must be at least 1")
+        self._start_func = start_func
+        self._list_func = list_func
+        self._waiter = waiter
+        self._get_demands = get_demands or (lambda item: {})
+        self._get_capacity = get_capacity or (lambda resource: None)
+        self._max_running = max_running
+        self._usage = collections.Counter()
+
+    def _can_start(self, demands):
+        for resource, demand in demands.items():
+            capacity = self._get_capacity(resource)
+            if capacity is None or not self._usage[resource]:
+                continue
+            if self._usage[resource] + demand > capacity:
+                return False
+        return True
+
+    def _iter_startable(self, pending, running):
+        """Pops the pending items which the caps allow starting, in order.
+
+        The caps are checked against the items started by the caller
+        while iterating.
+        """
+        for index, item in list(pending.items()):
+            if (self._max_running is not None and
+                    len(running) >= self._max_running):
+                break
+            demands = self._get_demands(item)
+            if not self._can_start(demands):
+                continue
+            del pending[index]
+            yield index, item, demands
+
+    def _set_running(self, running, index, item, demands, resource):
+        self._usage.update(demands)
+        running[resource._info.get('id')] = (index, item, demands)
+
+    @staticmethod
+    def _get_start_failure(index, item, ex):
+        LOG.debug("Failed to start operation for '%s': %s", item, ex)
+        return index, bulk.BulkResult(item, None, ex)
+
+    def _start_pending(self, pending, running):
+        """Starts pending items while the caps allow, in order.
+
+        :returns: the results of the items which failed to start
+        """
+        failed = []
+        for index, item, demands in self._iter_startable(pending, running):
+            try:
+                resource = self._start_func(item)
+            except Exception as ex:
+                failed.append(self._get_start_failure(index, item, ex))
+                continue
+            self._set_running(running, index, item, demands, resource)
+        return failed
+
+    async def _start_pending_async(self, pending, running):
+        failed = []
+        for index, item, demands in self._iter_startable(pending, running):
+            try:
+                resource = await self._start_func(item)
+            except Exception as ex:
+                failed.append(self._get_start_failure(index, item, ex))
+                continue
+            self._set_running(running, index, item, demands, resource)
+        return failed
+
+    def _collect_finished(self, running):
+        with cache.bypass():
+            resources = self._list_func()
+        return self._pop_finished(running, resources)
+
+    def _pop_finished(self, running, resources):
+        """Returns the results of the operations listed as finished."""
+        listed = {
+            resource._info.get('id'): resource for resource in resources}
+        finished = []
+        for resource_id, (index, item, demands) in list(running.items()):
+            resource = listed.get(resource_id)
+            if resource is None:
+                result = bulk.BulkResult(
+                    item, None, exceptions.CoriolisException(
+                        "'%s' is no longer listed" % resource_id))
+            elif self._waiter.is_final(self._waiter.get_status(resource)):
+                result = bulk.BulkResult(item, resource, None)
+            else:
+                continue
+            del running[resource_id]
+            self._usage.subtract(demands)
+            finished.append((index, result))
+        return finished
+
+    def _next_interval(self, running, progressed):
+        interval = self._waiter.next_interval(progressed)
+        if interval is None:
+            raise exceptions.FleetWaitTimeout(
+                list(running), self._waiter.timeout)
+        return interval
+
+    def run(self, items, cancel_event=None):
+        """Runs the operations of the given items.
+
+        :param items: iterable of items to run the operations of
+        :param cancel_event: `threading.Event` which stops starting and
+            polling operations when set, raising exceptions.WaitCanceled
+        :returns: generator of (index, `bulk.BulkResult`) pairs in order of
+            completion, whose result is the operation's resource in its
+            final status
+        """
+        pending = collections.OrderedDict(enumerate(items))
+        running = {}
+        progressed = True
+        while pending or running:
+            failed = self._start_pending(pending, running)
+            for index_result in failed:
+                yield index_result
+            if not running:
+                continue
+
+            interval = self._next_interval(running, progressed)
+            if cancel_event is None:
+                time.sleep(interval)
+            elif cancel_event.wait(interval):
+                raise exceptions.WaitCanceled(", ".join(running))
+
+            finished = self._collect_finished(running)
+            for index_result in finished:
+                yield index_result
+            progressed = bool(finished)
+
+    async def run_async(self, items, cancel_event=None):
+        """Asynchronous generator counterpart of `run()`.
+
+        :param cancel_event: `asyncio.Event` which stops starting and
+            polling operations when set
+        """
+        pending = collections.OrderedDict(enumerate(items))
+        running = {}
+        progressed = True
+        while pending or running:
+            failed = await self._start_pending_async(pending, running)
+            for index_result in failed:
+                yield index_result
+            if not running:
+                continue
+
+            interval = self._next_interval(running, progressed)
+            if await polling.sleep_async(interval, cancel_event):
+                raise exceptions.WaitCanceled(", ".join(running))
+
+            finished = self._pop_finished(running, await self._list_func())
+            for index_result in finished:
+                yield index_result
+            progressed = bool(finished)
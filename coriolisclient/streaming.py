@@ -0,0 +1,159 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Incremental decoding of JSON arrays out of streamed response bodies.
+"""
+
+import codecs
+import json
+
+
+_WHITESPACE = ' \t\n\r'
+_NUMBER_CHARS = '0123456789+-.eE'
+_DECODER = json.JSONDecoder()
+
+
+class _StreamReader(object):
+    """Buffers just enough of a stream of text chunks to decode values."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def _read_more(self, min_size=0):
+        """Reads chunks until the buffer holds at least `min_size` chars.
+
+        Already consumed text is dropped from the buffer.
+        :returns: False if the stream had already ended
+        """
+        if self._eof:
+            return False
+        parts = [self._buf[self._pos:]]
+        size = len(parts[0])
+        while True:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._eof = True
+                break
+            parts.append(chunk)
+            size += len(chunk)
+            if size >= min_size:
+                break
+        self._buf = ''.join(parts)
+        self._pos = 0
+        return True
+
+    def peek(self):
+        """Returns the next non-whitespace char without consuming it."""
+        while True:
+            while (self._pos < len(self._buf) and
+                    self._buf[self._pos] in _WHITESPACE):
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._read_more():
+                raise ValueError("Unexpected end of JSON stream")
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(
+                "Expected '%s' at this point of the JSON stream, found "
+                "'%s'" % (char, found))
+        self._pos += 1
+
+    def decode_value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except ValueError:
+                # NOTE: the value is likely incomplete; doubling the buffer
+                # bounds the number of decoding attempts for large values:
+                pending = len(self._buf) - self._pos
+                if not self._read_more(min_size=2 * pending):
+                    raise
+                continue
+            if self._is_cut_short(value, end) and self._read_more():
+                continue
+            self._pos = end
+            return value
+
+    def _is_cut_short(self, value, end):
+        """Tells whether a decoded number may go on past the buffer.
+
+        Numbers are the only values not ending on a delimiter, with e.g.
+        `0.` or `1e` decoding as a shorter number when cut at the end of
+        the buffer. They are thus only complete once followed by a
+        non-number char, or by the end of the stream.
+        """
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return False
+        while end < len(self._buf) and self._buf[end] in _NUMBER_CHARS:
+            end += 1
+        return end == len(self._buf)
+
+
+def _decode_chunks(chunks, encoding):
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def iter_json_array(chunks, key=None, encoding='utf-8'):
+    """Yields the elements of a JSON array one at a time.
+
+    Only the element being decoded is held in memory, no matter the size of
+    the whole document.
+
+    :param chunks: iterable of bytes or text chunks of the JSON document
+    :param key: the key of the array within the top level object, or None
+        if the document itself is the array
+    :param encoding: encoding of the chunks given as bytes
+    """
+    reader = _StreamReader(_decode_chunks(chunks, encoding))
+
+    if key is not None:
+        reader.expect('{')
+        while True:
+            if reader.peek() == '}':
+                raise KeyError(key)
+            name = reader.decode_value()
+            reader.expect(':')
+            if name == key:
+                break
+            # NOTE: skip the value of any other key:
+            reader.decode_value()
+            if reader.peek() == ',':
+                reader.expect(',')
+
+    reader.expect('[')
+    if reader.peek() == ']':
+        return
+    while True:
+        yield reader.decode_value()
+        if reader.peek() == ']':
+            return
+        reader.expect(',')
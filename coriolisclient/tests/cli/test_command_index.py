@@ -0,0 +1,151 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import os
+import shutil
+import sys
+import tempfile
+from unittest import mock
+
+from coriolisclient.cli import command_index
+from coriolisclient.tests import test_base
+
+
+TARGETS = {
+    'endpoint_list': 'coriolisclient.cli.endpoints:ListEndpoint',
+    'replica_show': 'coriolisclient.cli.replicas:ShowReplica',
+}
+
+
+class ScanEntryPointsTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis CLI entry point scan."""
+
+    def test_scan_entry_points(self):
+        entry_point = mock.Mock(value='mod:Cmd')
+        entry_point.name = 'cmd'
+        entry_points = mock.Mock()
+        entry_points.select.return_value = [entry_point]
+
+        with mock.patch.object(
+                command_index.importlib_metadata, 'entry_points',
+                return_value=entry_points):
+            self.assertEqual(
+                {'cmd': 'mod:Cmd'},
+                command_index.scan_entry_points('coriolis.v1'))
+        entry_points.select.assert_called_once_with(group='coriolis.v1')
+
+
+class CommandIndexTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis CLI command index."""
+
+    def setUp(self):
+        super(CommandIndexTestCase, self).setUp()
+        self.cache_dir = os.path.join(tempfile.mkdtemp(), "commands")
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.cache_dir))
+        patcher = mock.patch.object(
+            command_index, 'scan_entry_points', return_value=TARGETS)
+        self.mock_scan = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_targets(self):
+        index = command_index.CommandIndex("1.0", cache_dir=self.cache_dir)
+
+        self.assertEqual(TARGETS, index.get_targets('coriolis.v1'))
+        self.assertEqual(TARGETS, command_index.CommandIndex(
+            "1.0", cache_dir=self.cache_dir).get_targets('coriolis.v1'))
+
+        self.mock_scan.assert_called_once_with('coriolis.v1')
+
+    def test_get_targets_new_version(self):
+        command_index.CommandIndex(
+            "1.0", cache_dir=self.cache_dir).get_targets('coriolis.v1')
+        command_index.CommandIndex(
+            "1.1", cache_dir=self.cache_dir).get_targets('coriolis.v1')
+
+        self.assertEqual(2, self.mock_scan.call_count)
+
+    def test_get_targets_corrupt_index(self):
+        index = command_index.CommandIndex("1.0", cache_dir=self.cache_dir)
+        index.get_targets('coriolis.v1')
+        with open(index._get_path('coriolis.v1'), 'w') as fout:
+            fout.write("{")
+
+        self.assertEqual(TARGETS, index.get_targets('coriolis.v1'))
+        self.assertEqual(2, self.mock_scan.call_count)
+
+    def test_get_targets_prunes_stale_indexes(self):
+        os.makedirs(self.cache_dir)
+        for file_name in ('coriolis.v1-stale.json', 'other-index.json'):
+            open(os.path.join(self.cache_dir, file_name), 'w').close()
+        index = command_index.CommandIndex("1.0", cache_dir=self.cache_dir)
+
+        index.get_targets('coriolis.v1')
+
+        self.assertEqual(
+            sorted(['other-index.json',
+                    os.path.basename(index._get_path('coriolis.v1'))]),
+            sorted(os.listdir(self.cache_dir)))
+
+    def test_get_index_key(self):
+        key = command_index.get_index_key('coriolis.v1', "1.0")
+
+        self.assertNotEqual(
+            key, command_index.get_index_key('coriolis.v1', "1.1"))
+        with mock.patch.object(sys, 'path', sys.path + [self.cache_dir]):
+            self.assertNotEqual(
+                key, command_index.get_index_key('coriolis.v1', "1.0"))
+
+
+class IndexedCommandManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis CLI indexed command manager."""
+
+    def setUp(self):
+        super(IndexedCommandManagerTestCase, self).setUp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        patcher = mock.patch.object(
+            command_index, 'scan_entry_points', return_value=TARGETS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_find_command(self):
+        manager = command_index.IndexedCommandManager(
+            'coriolis.v1', "1.0", cache_dir=self.cache_dir)
+
+        self.assertEqual(
+            ['endpoint list', 'replica show'],
+            sorted(manager.get_command_names()))
+        with mock.patch.object(
+                command_index.importlib, 'import_module') as mock_import:
+            cmd_factory, cmd_name, args = manager.find_command(
+                ['replica', 'show', 'id'])
+
+        mock_import.assert_called_once_with('coriolisclient.cli.replicas')
+        self.assertEqual(mock_import.return_value.ShowReplica, cmd_factory)
+        self.assertEqual('replica show', cmd_name)
+        self.assertEqual(['id'], args)
+
+    def test_ignored_modules(self):
+        manager = command_index.IndexedCommandManager(
+            'coriolis.v1', "1.0", cache_dir=self.cache_dir,
+            ignored_modules=['coriolisclient.cli.replicas'])
+
+        self.assertEqual(['endpoint list'], manager.get_command_names())
+
+    def test_ignored_modules_unsupported(self):
+        manager = command_index.IndexedCommandManager(
+            'coriolis.v1', "1.0", cache_dir=self.cache_dir)
+        # NOTE: as with the cliff releases not supporting ignored modules:
+        del manager.ignored_modules
+        manager.commands = {}
+
+        manager.load_commands('coriolis.v1')
+
+        self.assertEqual(
+            ['endpoint list', 'replica show'], sorted(manager.commands))
+
+    def test_entry_point_load(self):
+        entry_point = command_index.IndexedEntryPoint(
+            'index', 'coriolisclient.cli.command_index:CommandIndex')
+
+        self.assertIs(command_index.CommandIndex, entry_point.load())
@@ -134,6 +134,7 @@ class ListEndpointInstanceTestCase(
         args.marker = mock.sentinel.marker
         args.limit = mock.sentinel.limit
         args.name = mock.sentinel.name
+        args.all = False
         mock_endpoints = mock.Mock()
         mock_ei = mock.Mock()
         self.mock_app.client_manager.coriolis.endpoints = mock_endpoints
@@ -156,6 +157,39 @@ class ListEndpointInstanceTestCase(
         )
         mock_list_objects.assert_called_once_with(mock_ei.list.return_value)
 
+    @mock.patch.object(endpoint_instances.EndpointInstanceFormatter,
+                       'list_objects')
+    @mock.patch.object(cli_utils, 'get_option_value_from_args')
+    def test_take_action_all(
+        self,
+        mock_get_option_value_from_args,
+        mock_list_objects
+    ):
+        args = mock.Mock()
+        args.marker = mock.sentinel.marker
+        args.limit = mock.sentinel.limit
+        args.name = mock.sentinel.name
+        args.all = True
+        mock_endpoints = self.mock_app.client_manager.coriolis.endpoints
+        mock_ei = self.mock_app.client_manager.coriolis.endpoint_instances
+
+        result = self.endpoint.take_action(args)
+
+        self.assertEqual(
+            mock_list_objects.return_value,
+            result
+        )
+        mock_ei.list.assert_not_called()
+        mock_ei.list_iter.assert_called_once_with(
+            mock_endpoints.get_endpoint_id_for_name(args.endpoint),
+            mock_get_option_value_from_args.return_value,
+            mock.sentinel.marker,
+            name=mock.sentinel.name,
+            limit=mock.sentinel.limit
+        )
+        mock_list_objects.assert_called_once_with(
+            mock_ei.list_iter.return_value)
+
 
 class ShowEndpointInstanceTestCase(
         test_base.CoriolisBaseTestCase):
@@ -0,0 +1,144 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import io
+from unittest import mock
+
+from coriolisclient import cache
+from coriolisclient.cli import command_index
+from coriolisclient.cli import interactive
+from coriolisclient.cli import shell
+from coriolisclient.tests import test_base
+from coriolisclient import version
+
+
+def _get_client(response_cache):
+    return mock.Mock(_httpclient=mock.Mock(response_cache=response_cache))
+
+
+class GetCachedIdsTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for listing the IDs of the cached objects."""
+
+    def test_get_cached_ids(self):
+        response_cache = cache.ResponseCache()
+        response_cache.set('/replicas', {'replicas': [
+            {'id': 'r1'}, {'id': 'r2'}]})
+        response_cache.set('/endpoints/e1', {'endpoint': {'id': 'e1'}})
+        response_cache.set('/endpoints/e1/instances', [{'id': 'i1'}])
+
+        self.assertEqual(
+            ['e1', 'r1', 'r2'],
+            interactive.get_cached_ids(_get_client(response_cache)))
+
+    def test_get_cached_ids_no_cache(self):
+        self.assertEqual([], interactive.get_cached_ids(_get_client(None)))
+        self.assertEqual([], interactive.get_cached_ids(None))
+
+
+class CoriolisInteractiveAppTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis CLI interactive mode."""
+
+    def setUp(self):
+        super(CoriolisInteractiveAppTestCase, self).setUp()
+        response_cache = cache.ResponseCache()
+        response_cache.set('/replicas', {'replicas': [
+            {'id': 'abc1'}, {'id': 'abc2'}, {'id': 'def3'}]})
+        self.parent_app = mock.Mock(
+            spec=['NAME', 'client'], client=_get_client(response_cache))
+        command_manager = [('replica show', None), ('replica list', None)]
+        self.app = interactive.CoriolisInteractiveApp(
+            self.parent_app, command_manager, None, None)
+
+    def test_complete_ids(self):
+        self.assertEqual(
+            ['abc1', 'abc2'],
+            self.app.completedefault('ab', 'replica show ab', 13, 15))
+
+    def test_complete_commands(self):
+        self.assertEqual(
+            ['show'], self.app.completedefault('sh', 'replica sh', 8, 10))
+
+
+class ShellTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for running the Coriolis CLI as an interactive shell."""
+
+    def setUp(self):
+        super(ShellTestCase, self).setUp()
+        patcher = mock.patch.object(command_index, 'IndexedCommandManager')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.app = shell.Coriolis()
+        self.app.options = mock.Mock(profile=None, timings=False)
+
+    @mock.patch.object(version, '__version__', '1.0')
+    @mock.patch('sys.stdout', new_callable=io.StringIO)
+    def test_version(self, mock_stdout):
+        self.assertRaises(
+            SystemExit, self.app.parser.parse_args, ['--version'])
+
+        self.assertEqual(
+            "%s 1.0\n" % self.app.parser.prog, mock_stdout.getvalue())
+
+    @mock.patch.object(shell.cProfile, 'Profile')
+    @mock.patch.object(shell, 'Coriolis')
+    def test_main_profile(self, mock_app_class, mock_profile_class):
+        argv = ['--profile=out.prof', 'replica', 'list']
+        calls = mock.Mock()
+        calls.attach_mock(mock_profile_class.return_value, 'profiler')
+        calls.attach_mock(mock_app_class, 'app_class')
+
+        result = shell.main(argv)
+
+        self.assertIs(mock_app_class.return_value.run.return_value, result)
+        self.assertEqual([
+            mock.call.profiler.enable(),
+            mock.call.app_class(),
+            mock.call.app_class().run(argv),
+            mock.call.profiler.disable(),
+            mock.call.profiler.dump_stats('out.prof')], calls.mock_calls)
+
+    @mock.patch.object(shell.cProfile, 'Profile')
+    @mock.patch.object(shell, 'Coriolis')
+    def test_main_no_profile(self, mock_app_class, mock_profile_class):
+        shell.main(['--profile-name', 'x', 'replica', 'list'])
+
+        mock_profile_class.assert_not_called()
+        mock_app_class.return_value.run.assert_called_once_with(
+            ['--profile-name', 'x', 'replica', 'list'])
+
+    def test_initialize_app(self):
+        self.app.initialize_app(['shell'])
+
+        self.assertTrue(self.app.interactive_mode)
+
+    @mock.patch.object(shell.Coriolis, 'create_client')
+    def test_prepare_to_run_command_reuses_client(self, mock_create_client):
+        cmd = mock.Mock(auth_required=True)
+        self.app.initialize_app(['shell'])
+
+        self.app.prepare_to_run_command(cmd)
+        self.app.prepare_to_run_command(cmd)
+
+        mock_create_client.assert_called_once_with(self.app.options)
+        self.assertEqual(
+            mock_create_client.return_value,
+            self.app.client_manager.coriolis)
+
+    @mock.patch.object(shell.Coriolis, 'create_client')
+    def test_prepare_to_run_command(self, mock_create_client):
+        cmd = mock.Mock(auth_required=True)
+        self.app.initialize_app(['replica', 'list'])
+
+        self.app.prepare_to_run_command(cmd)
+        self.app.prepare_to_run_command(cmd)
+
+        self.assertEqual(2, mock_create_client.call_count)
+
+    def test_get_client_kwargs(self):
+        args = mock.Mock(max_retries=1, rate_limit=None, rate_limit_quotas=[])
+
+        self.assertNotIn('response_cache', self.app._get_client_kwargs(args))
+        self.app.interactive_mode = True
+        self.assertIsInstance(
+            self.app._get_client_kwargs(args)['response_cache'],
+            cache.ResponseCache)
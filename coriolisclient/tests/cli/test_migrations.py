@@ -10,7 +10,9 @@ from cliff import show
 
 from coriolisclient.cli import formatter
 from coriolisclient.cli import migrations
+from coriolisclient.cli import progress
 from coriolisclient.cli import utils as cli_utils
+from coriolisclient import bulk
 from coriolisclient.tests import test_base
 
 
@@ -431,6 +433,46 @@ class CreateMigrationFromReplicaTestCase(test_base.CoriolisBaseTestCase):
             mock_migrations.create_from_replica.return_value)
 
 
+class DeployMigrationBulkTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Client Deploy Migration Bulk."""
+
+    def setUp(self):
+        self.mock_app = mock.Mock()
+        super(DeployMigrationBulkTestCase, self).setUp()
+        self.migration = migrations.DeployMigrationBulk(
+            self.mock_app, mock.sentinel.app_args)
+
+    def test_take_action(self):
+        mock_deploy_many = (
+            self.mock_app.client_manager.coriolis.migrations.deploy_many)
+        migration = mock.Mock(
+            id="m1", _info={"last_execution_status": "COMPLETED"})
+        mock_deploy_many.return_value = iter([
+            bulk.BulkResult("r2", None, Exception("replica is running")),
+            bulk.BulkResult("r1", migration, None)])
+        args = self.migration.get_parser("migration deploy-bulk").parse_args(
+            ["r1", "r2", "--max-running", "3", "--skip-os-morphing"])
+
+        columns, data = self.migration.take_action(args)
+
+        self.assertEqual(
+            migrations.MigrationDeployBulkResultFormatter.columns, columns)
+        self.assertEqual(
+            [("r2", None, None, "replica is running"),
+             ("r1", "m1", "COMPLETED", None)],
+            list(data))
+        mock_deploy_many.assert_called_once_with(
+            ["r1", "r2"], clone_disks=True, force=False,
+            skip_os_morphing=True,
+            instance_osmorphing_minion_pool_mappings=None,
+            max_running=3, timeout=None)
+        self.mock_app.stderr.write.assert_has_calls([
+            mock.call("Replica r2: failed: replica is running" + os.linesep),
+            mock.call("Replica r1: migration m1 finished with status "
+                      "COMPLETED" + os.linesep)])
+        self.mock_app.stdout.write.assert_not_called()
+
+
 class ShowMigrationTestCase(test_base.CoriolisBaseTestCase):
     """Test suite for the Coriolis Client Show Migration."""
 
@@ -455,6 +497,7 @@ class ShowMigrationTestCase(test_base.CoriolisBaseTestCase):
     def test_take_action(self, mock_get_formatted_entity):
         args = mock.Mock()
         args.id = mock.sentinel.id
+        args.follow = False
         mock_migration = mock.Mock()
         self.mock_app.client_manager.coriolis.migrations.get = mock_migration
 
@@ -468,6 +511,35 @@ class ShowMigrationTestCase(test_base.CoriolisBaseTestCase):
         mock_get_formatted_entity.assert_called_once_with(
             mock_migration.return_value)
 
+    @mock.patch.object(migrations.MigrationDetailFormatter,
+                       'get_formatted_entity')
+    @mock.patch.object(progress, 'follow')
+    def test_take_action_follow(self, mock_follow, mock_get_formatted_entity):
+        args = mock.Mock()
+        args.id = mock.sentinel.id
+        args.follow = True
+        args.show_instances_data = False
+        mock_migrations = self.mock_app.client_manager.coriolis.migrations
+
+        result = self.migration.take_action(args)
+
+        self.assertEqual(
+            mock_get_formatted_entity.return_value,
+            result
+        )
+        (get_func, waiter, stdout), _ = mock_follow.call_args
+        get_func()
+        mock_migrations.get.assert_called_once_with(mock.sentinel.id)
+        self.assertEqual(mock_migrations.get_waiter.return_value, waiter)
+        self.assertEqual(self.mock_app.stdout, stdout)
+        mock_get_formatted_entity.assert_called_once_with(
+            mock_follow.return_value)
+
+    def test_formatter_without_tasks(self):
+        formatter = migrations.MigrationDetailFormatter(include_tasks=False)
+
+        self.assertNotIn("tasks", formatter.columns)
+
 
 class CancelMigrationTestCase(test_base.CoriolisBaseTestCase):
     """Test suite for the Coriolis Client Cancel Migration."""
@@ -0,0 +1,84 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import io
+from unittest import mock
+
+from coriolisclient.cli import progress
+from coriolisclient import constants
+from coriolisclient import polling
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import migrations
+
+
+def _migration(status, task_status, progress_updates):
+    return migrations.Migration(None, {
+        "id": "m1", "last_execution_status": status,
+        "tasks": [{"id": "t1", "task_type": "DEPLOY", "instance": "vm1",
+                   "status": task_status,
+                   "progress_updates": progress_updates}]},
+        loaded=True)
+
+
+def _update(index, message, current_step=None):
+    return {"index": index, "message": message,
+            "created_at": "2024-01-01T00:00:0%d" % index,
+            "current_step": current_step, "total_steps": 4}
+
+
+class ProgressTailTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis CLI progress tail."""
+
+    def setUp(self):
+        super(ProgressTailTestCase, self).setUp()
+        self.tail = progress.ProgressTail()
+
+    def test_get_new_lines(self):
+        first = self.tail.get_new_lines(_migration(
+            "RUNNING", "RUNNING", [_update(1, "b"), _update(0, "a")]))
+        unchanged = self.tail.get_new_lines(_migration(
+            "RUNNING", "RUNNING", [_update(0, "a"), _update(1, "b")]))
+        last = self.tail.get_new_lines(_migration(
+            "COMPLETED", "COMPLETED",
+            [_update(0, "a"), _update(1, "b"), _update(2, "c")]))
+
+        self.assertEqual([
+            "Task t1 (DEPLOY, instance vm1): RUNNING",
+            "  2024-01-01T00:00:00 a",
+            "  2024-01-01T00:00:01 b"], first)
+        self.assertEqual([], unchanged)
+        self.assertEqual([
+            "Task t1 (DEPLOY, instance vm1): COMPLETED",
+            "  2024-01-01T00:00:02 c"], last)
+
+    def test_get_new_lines_step_update(self):
+        self.tail.get_new_lines(_migration(
+            "RUNNING", "RUNNING", [_update(0, "copy", 1)]))
+
+        result = self.tail.get_new_lines(_migration(
+            "RUNNING", "RUNNING", [_update(0, "copy", 2)]))
+
+        self.assertEqual(["  2024-01-01T00:00:00 [50%] copy"], result)
+
+
+class FollowTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for following the progress from the Coriolis CLI."""
+
+    def test_follow(self):
+        get_func = mock.Mock(side_effect=[
+            _migration("RUNNING", "RUNNING", [_update(0, "a")]),
+            _migration("COMPLETED", "COMPLETED", [_update(0, "a")])])
+        waiter = polling.Waiter(
+            constants.FINALIZED_MIGRATION_STATUSES,
+            get_status=polling.get_migration_status,
+            min_interval=0.001, max_interval=0.001)
+        stdout = io.StringIO()
+
+        result = progress.follow(get_func, waiter, stdout)
+
+        self.assertEqual("COMPLETED", result.last_execution_status)
+        self.assertEqual(
+            ["Task t1 (DEPLOY, instance vm1): RUNNING",
+             "  2024-01-01T00:00:00 a",
+             "Task t1 (DEPLOY, instance vm1): COMPLETED"],
+            stdout.getvalue().splitlines())
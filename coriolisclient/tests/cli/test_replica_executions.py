@@ -9,6 +9,7 @@ from cliff import lister
 from cliff import show
 
 from coriolisclient.cli import formatter
+from coriolisclient.cli import progress
 from coriolisclient.cli import replica_executions
 from coriolisclient.tests import test_base
 
@@ -305,6 +306,7 @@ class ShowReplicaExecutionTestCase(test_base.CoriolisBaseTestCase):
         args = mock.Mock()
         args.replica = mock.sentinel.replica
         args.id = mock.sentinel.id
+        args.follow = False
         execution = mock.Mock()
         self.mock_app.client_manager.coriolis.replica_executions.get = \
             execution
@@ -319,6 +321,30 @@ class ShowReplicaExecutionTestCase(test_base.CoriolisBaseTestCase):
         mock_get_formatted_entity.assert_called_once_with(
             execution.return_value)
 
+    @mock.patch.object(replica_executions.ReplicaExecutionDetailFormatter,
+                       'get_formatted_entity')
+    @mock.patch.object(progress, 'follow')
+    def test_take_action_follow(self, mock_follow, mock_get_formatted_entity):
+        args = mock.Mock()
+        args.replica = mock.sentinel.replica
+        args.id = mock.sentinel.id
+        args.follow = True
+        mock_executions = (
+            self.mock_app.client_manager.coriolis.replica_executions)
+
+        result = self.replica.take_action(args)
+
+        self.assertEqual(
+            mock_get_formatted_entity.return_value,
+            result
+        )
+        (get_func, waiter, stdout), _ = mock_follow.call_args
+        get_func()
+        mock_executions.get.assert_called_once_with(
+            mock.sentinel.replica, mock.sentinel.id)
+        mock_get_formatted_entity.assert_called_once_with(
+            mock_follow.return_value)
+
 
 class CancelReplicaExecutionTestCase(test_base.CoriolisBaseTestCase):
     """Test suite for the Coriolis Client Cancel Replica Execution."""
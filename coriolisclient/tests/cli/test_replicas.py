@@ -1,6 +1,9 @@
 # Copyright 2024 Cloudbase Solutions Srl
 # All Rights Reserved.
 
+import json
+import os
+import tempfile
 from unittest import mock
 
 from cliff import command
@@ -10,6 +13,8 @@ from cliff import show
 from coriolisclient.cli import replica_executions
 from coriolisclient.cli import replicas
 from coriolisclient.cli import utils as cli_utils
+from coriolisclient import bulk
+from coriolisclient import manifest
 from coriolisclient.tests import test_base
 
 
@@ -330,6 +335,50 @@ class CreateReplicaTestCase(test_base.CoriolisBaseTestCase):
             mock_replicas.return_value)
 
 
+class CreateReplicaBulkTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Client Create Replica Bulk."""
+
+    def setUp(self):
+        self.mock_app = mock.Mock()
+        super(CreateReplicaBulkTestCase, self).setUp()
+        self.replica = replicas.CreateReplicaBulk(
+            self.mock_app, mock.sentinel.app_args)
+
+    @mock.patch.object(manifest, 'load')
+    def test_take_action(self, mock_load):
+        rows = [{"instances": ["vm1"]}, {"instances": ["vm2"]}]
+        mock_load.return_value = rows
+        mock_create_many = (
+            self.mock_app.client_manager.coriolis.replicas.create_many)
+        mock_create_many.return_value = [
+            bulk.BulkResult(rows[0], mock.Mock(id="r1"), None),
+            bulk.BulkResult(rows[1], None, Exception("quota exceeded"))]
+        tmp_dir = tempfile.mkdtemp()
+        result_file = os.path.join(tmp_dir, "result.json")
+        self.addCleanup(os.rmdir, tmp_dir)
+        self.addCleanup(os.remove, result_file)
+        args = self.replica.get_parser("replica create-bulk").parse_args([
+            "wave.csv", "--max-workers", "4", "--rate", "2",
+            "--result-file", result_file])
+
+        columns, data = self.replica.take_action(args)
+
+        expected = [
+            {"row": 1, "instances": ["vm1"], "id": "r1", "error": None},
+            {"row": 2, "instances": ["vm2"], "id": None,
+             "error": "quota exceeded"}]
+        self.assertEqual(
+            replicas.ReplicaBulkResultFormatter.columns, columns)
+        self.assertEqual(
+            [(1, "vm1", "r1", None), (2, "vm2", None, "quota exceeded")],
+            list(data))
+        with open(result_file) as fin:
+            self.assertEqual(expected, json.load(fin))
+        mock_load.assert_called_once_with("wave.csv", fmt=None)
+        mock_create_many.assert_called_once_with(
+            rows, max_workers=4, requests_per_second=2.)
+
+
 class ShowReplicaTestCase(test_base.CoriolisBaseTestCase):
     """Test suite for the Coriolis Client Show Replica."""
 
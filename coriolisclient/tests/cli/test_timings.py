@@ -0,0 +1,84 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient.cli import formatter
+from coriolisclient.cli import timings
+from coriolisclient import instrumentation
+from coriolisclient.tests import test_base
+
+
+class TimingsTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis CLI timings."""
+
+    def setUp(self):
+        super(TimingsTestCase, self).setUp()
+        self.clock = [100.]
+        for name, func in (('perf_counter', lambda: self.clock[0]),
+                           ('time', lambda: 1000. + self.clock[0]),
+                           ('process_time', lambda: 0.5)):
+            patcher = mock.patch.object(timings.time, name, side_effect=func)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.timings = timings.Timings()
+
+    def _tick(self, seconds):
+        self.clock[0] += seconds
+
+    def test_phases(self):
+        with self.timings.phase("command"):
+            self._tick(1)
+            self.timings.record_request(instrumentation.RequestRecord(
+                'coriolis', 'GET', '/replicas/{id}', 200, 0.5, 0, 10, 0,
+                None, 1100.2))
+            with self.timings.accumulate("formatting"):
+                self._tick(0.25)
+            with self.timings.accumulate("formatting"):
+                self._tick(0.25)
+
+        self.assertEqual([
+            timings.Phase("startup (CPU)", -0.5, 0.5, 0),
+            timings.Phase("command", 0, 1.5, 0),
+            timings.Phase("GET /replicas/{id} -> 200", mock.ANY, 0.5, 1),
+            timings.Phase("formatting", 1, 0.5, 0),
+        ], self.timings.get_phases())
+        self.assertAlmostEqual(0.2, self.timings.get_phases()[2].start)
+
+    def test_wrap(self):
+        func = self.timings.wrap(lambda x: self._tick(x) or x * 2, "output")
+
+        self.assertEqual(4, func(2))
+        self.assertEqual(
+            timings.Phase("output", 0, 2, 0), self.timings.get_phases()[-1])
+
+    def test_format_waterfall(self):
+        with self.timings.phase("auth"):
+            self._tick(1.5)
+
+        lines = self.timings.format_waterfall()
+
+        self.assertEqual(4, len(lines))
+        self.assertTrue(lines[0].startswith("Phase"))
+        self.assertIn("auth", lines[2])
+        self.assertIn("1.500 |", lines[2])
+        self.assertTrue(lines[3].startswith("total"))
+        self.assertTrue(lines[3].endswith("|" + "#" * 40))
+
+    def test_formatter_accumulates(self):
+        entity_formatter = formatter.EntityFormatter()
+        entity_formatter.columns = ["id"]
+        entity_formatter._get_formatted_data = lambda obj: self._tick(1)
+
+        entity_formatter.get_formatted_entity(mock.sentinel.obj)
+        self.assertEqual(1, len(self.timings.get_phases()))
+
+        self.timings.activate()
+        self.addCleanup(self.timings.deactivate)
+        entity_formatter.get_formatted_entity(mock.sentinel.obj)
+        entity_formatter.get_formatted_entity(mock.sentinel.obj)
+
+        self.assertEqual(
+            timings.Phase("formatting", 1, 2, 0),
+            self.timings.get_phases()[-1])
+        self.assertIs(self.timings, timings.get_active())
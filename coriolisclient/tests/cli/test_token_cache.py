@@ -0,0 +1,96 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import os
+import shutil
+import stat
+import tempfile
+from unittest import mock
+
+from coriolisclient.cli import token_cache
+from coriolisclient.tests import test_base
+
+
+class TokenCacheTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis CLI token cache."""
+
+    def setUp(self):
+        super(TokenCacheTestCase, self).setUp()
+        self.cache_dir = os.path.join(tempfile.mkdtemp(), "tokens")
+        self.addCleanup(shutil.rmtree, os.path.dirname(self.cache_dir))
+        self.cache = token_cache.TokenCache(cache_dir=self.cache_dir)
+        self.auth = mock.Mock()
+        self.auth.get_cache_id.return_value = "cache/id+"
+        self.auth.get_auth_state.return_value = '{"auth_token": "tok"}'
+        self.auth.auth_ref.will_expire_soon.return_value = False
+
+    def _get_path(self):
+        return self.cache._get_path(self.auth)
+
+    def test_save(self):
+        self.cache.save(self.auth)
+
+        path = self._get_path()
+        self.assertEqual(
+            0o600, stat.S_IMODE(os.stat(path).st_mode))
+        self.assertEqual(
+            0o700, stat.S_IMODE(os.stat(self.cache_dir).st_mode))
+        with open(path) as fin:
+            self.assertEqual('{"auth_token": "tok"}', fin.read())
+
+    def test_save_no_state(self):
+        self.auth.get_auth_state.return_value = None
+
+        self.cache.save(self.auth)
+
+        self.assertFalse(os.path.exists(self.cache_dir))
+
+    def test_load(self):
+        self.cache.save(self.auth)
+
+        result = token_cache.TokenCache(cache_dir=self.cache_dir).load(
+            self.auth)
+
+        self.assertTrue(result)
+        self.auth.set_auth_state.assert_called_once_with(
+            '{"auth_token": "tok"}')
+
+    def test_load_missing(self):
+        self.assertFalse(self.cache.load(self.auth))
+        self.auth.set_auth_state.assert_not_called()
+
+    def test_load_expired(self):
+        self.cache.save(self.auth)
+        self.auth.auth_ref.will_expire_soon.return_value = True
+
+        result = self.cache.load(self.auth)
+
+        self.assertFalse(result)
+        self.auth.set_auth_state.assert_called_with(None)
+        self.assertFalse(os.path.exists(self._get_path()))
+
+    def test_load_insecure_permissions(self):
+        self.cache.save(self.auth)
+        os.chmod(self._get_path(), 0o644)
+
+        result = self.cache.load(self.auth)
+
+        self.assertFalse(result)
+        self.auth.set_auth_state.assert_not_called()
+        self.assertFalse(os.path.exists(self._get_path()))
+
+    def test_save_unchanged_state(self):
+        self.cache.save(self.auth)
+        self.cache.load(self.auth)
+
+        with mock.patch.object(os, 'replace') as mock_replace:
+            self.cache.save(self.auth)
+
+        mock_replace.assert_not_called()
+
+    def test_invalidate(self):
+        self.cache.save(self.auth)
+
+        self.cache.invalidate(self.auth)
+
+        self.assertFalse(os.path.exists(self._get_path()))
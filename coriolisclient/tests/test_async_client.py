@@ -0,0 +1,242 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import asyncio
+from unittest import mock
+
+from aiohttp import test_utils
+from aiohttp import web
+from keystoneauth1 import exceptions as keystoneauth_exceptions
+
+from coriolisclient import async_client
+from coriolisclient import exceptions
+from coriolisclient.tests import test_base
+
+
+class AsyncHTTPClientTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis asyncio HTTP client."""
+
+    def _run_with_server(self, routes, coro_func):
+        async def _run():
+            app = web.Application()
+            app.add_routes(routes)
+            server = test_utils.TestServer(app)
+            await server.start_server()
+            httpclient = async_client._AsyncHTTPClient(
+                endpoint=str(server.make_url('')).rstrip('/'))
+            try:
+                return await coro_func(httpclient)
+            finally:
+                await httpclient.close()
+                await server.close()
+
+        return asyncio.run(_run())
+
+    def test_request(self):
+        seen = {}
+
+        async def handler(request):
+            seen['body'] = await request.json()
+            return web.json_response({"replica": {"id": "r1"}})
+
+        async def _do(httpclient):
+            return await httpclient.post(
+                '/replicas', json={"replica": {}})
+
+        resp = self._run_with_server(
+            [web.post('/v1/replicas', handler)], _do)
+
+        self.assertEqual({"replica": {}}, seen['body'])
+        self.assertEqual({"replica": {"id": "r1"}}, resp.json())
+
+    def test_request_error(self):
+        async def handler(request):
+            return web.json_response(
+                {"error": {"message": "not here", "code": 404}}, status=404)
+
+        async def _do(httpclient):
+            return await httpclient.get('/replicas/missing')
+
+        self.assertRaises(
+            keystoneauth_exceptions.NotFound, self._run_with_server,
+            [web.get('/v1/replicas/missing', handler)], _do)
+
+    def test_requests_share_connection_pool(self):
+        async def handler(request):
+            return web.json_response({"replicas": []})
+
+        async def _do(httpclient):
+            await asyncio.gather(
+                *[httpclient.get('/replicas') for _ in range(10)])
+            return httpclient._get_http_session()
+
+        http_session = self._run_with_server(
+            [web.get('/v1/replicas', handler)], _do)
+
+        self.assertTrue(http_session.closed)
+
+
+class AsyncClientTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis asyncio client managers."""
+
+    def setUp(self):
+        super(AsyncClientTestCase, self).setUp()
+        self.client = async_client.AsyncClient(endpoint="http://coriolis")
+        self.httpclient = mock.AsyncMock()
+        for manager in vars(self.client).values():
+            if isinstance(manager, async_client.AsyncManagerMixin):
+                manager.client = self.httpclient
+
+    def _response(self, body):
+        return async_client._AsyncResponse(200, {}, body.encode())
+
+    def test_list(self):
+        self.httpclient.get.return_value = self._response(
+            '{"replicas": [{"id": "r1"}, {"id": "r2"}]}')
+
+        result = asyncio.run(self.client.replicas.list(detail=True))
+
+        self.httpclient.get.assert_awaited_once_with('/replicas/detail')
+        self.assertEqual(["r1", "r2"], [r.id for r in result])
+
+    def test_post_returns_loaded_resource(self):
+        self.httpclient.post.return_value = self._response(
+            '{"execution": {"id": "e1"}}')
+
+        result = asyncio.run(
+            self.client.replica_executions.create("r1"))
+
+        self.assertTrue(result.is_loaded())
+        self.assertRaises(AttributeError, getattr, result, "status")
+
+    def test_get_endpoint_id_for_name(self):
+        self.httpclient.get.return_value = self._response(
+            '{"endpoints": [{"id": "e1", "name": "src"}]}')
+
+        result = asyncio.run(
+            self.client.endpoints.get_endpoint_id_for_name("src"))
+
+        self.assertEqual("e1", result)
+
+    def test_unauthorized(self):
+        self.httpclient.get.side_effect = (
+            keystoneauth_exceptions.http.Unauthorized())
+
+        self.assertRaises(
+            exceptions.HTTPAuthError, asyncio.run,
+            self.client.migrations.get("m1"))
+
+    def test_get_many(self):
+        self.httpclient.get.side_effect = [
+            self._response('{"migration": {"id": "m1"}}'),
+            keystoneauth_exceptions.NotFound()]
+
+        result = asyncio.run(
+            self.client.migrations.get_many(["m1", "m2"], max_workers=1))
+
+        self.assertEqual("m1", result[0].result.id)
+        self.assertIsNone(result[0].error)
+        self.assertEqual("m2", result[1].item)
+        self.assertIsInstance(
+            result[1].error, keystoneauth_exceptions.NotFound)
+
+    def test_endpoint_instances_list_iter(self):
+        self.httpclient.get.side_effect = [
+            self._response('{"instances": [{"id": "i1"}, {"id": "i2"}]}'),
+            self._response('{"instances": [{"id": "i3"}]}')]
+
+        async def _list():
+            return [instance.id async for instance in
+                    self.client.endpoint_instances.list_iter("e1", limit=2)]
+
+        self.assertEqual(["i1", "i2", "i3"], asyncio.run(_list()))
+        self.httpclient.get.assert_has_awaits([
+            mock.call('/endpoints/e1/instances?limit=2'),
+            mock.call('/endpoints/e1/instances?marker=i2&limit=2')])
+
+    def test_lazy_loading_not_supported(self):
+        self.httpclient.get.return_value = self._response(
+            '{"migrations": [{"id": "m1"}]}')
+
+        migration = asyncio.run(self.client.migrations.list())[0]
+
+        self.assertRaises(
+            exceptions.LazyLoadingNotSupported, getattr, migration, "tasks")
+        self.httpclient.get.assert_awaited_once_with('/migrations')
+
+    def test_create_many(self):
+        self.httpclient.get.return_value = self._response(
+            '{"endpoints": [{"id": "e1", "name": "src"}]}')
+        self.httpclient.post.return_value = self._response(
+            '{"replica": {"id": "r1"}}')
+        rows = [
+            {"origin_endpoint_id": "src", "destination_endpoint_id": "src",
+             "destination_environment": {}, "source_environment": None,
+             "instances": ["vm1"]},
+            {"origin_endpoint_id": "missing",
+             "destination_endpoint_id": "src",
+             "destination_environment": {}, "source_environment": None,
+             "instances": ["vm2"]}]
+
+        result = asyncio.run(self.client.replicas.create_many(
+            rows, max_workers=1, requests_per_second=1000))
+
+        self.assertEqual("r1", result[0].result.id)
+        self.assertIsInstance(
+            result[1].error, exceptions.EndpointIDNotFound)
+        self.httpclient.post.assert_awaited_once()
+        body = self.httpclient.post.await_args[1]['json']['replica']
+        self.assertEqual("e1", body['origin_endpoint_id'])
+
+    def test_execute_many(self):
+        self.httpclient.get.side_effect = [
+            self._response('{"replicas": [{"id": "r1"}, {"id": "r2"}]}'),
+            self._response(
+                '{"replicas": [{"id": "r1", "executions": ['
+                '{"id": "e1", "status": "COMPLETED"}]}]}'),
+            self._response(
+                '{"replicas": [{"id": "r2", "executions": ['
+                '{"id": "e2", "status": "ERROR"}]}]}')]
+        self.httpclient.post.side_effect = [
+            self._response('{"execution": {"id": "e1"}}'),
+            self._response('{"execution": {"id": "e2"}}')]
+
+        async def _execute():
+            return [result async for result in
+                    self.client.replica_executions.execute_many(
+                        ["r1", "r2"], max_running=1,
+                        min_interval=0.001, max_interval=0.001)]
+
+        result = asyncio.run(_execute())
+
+        self.assertEqual(
+            [("r1", "COMPLETED"), ("r2", "ERROR")],
+            [(r.item, r.result.status) for r in result])
+
+    def test_deploy_many(self):
+        self.httpclient.get.side_effect = [
+            self._response(
+                '{"replicas": [{"id": "r1", "instances": ["vm1"], '
+                '"instance_osmorphing_minion_pool_mappings": '
+                '{"vm1": "p1"}}]}'),
+            self._response(
+                '{"minion_pools": [{"id": "p1", "maximum_minions": 1}]}'),
+            self._response(
+                '{"migrations": [{"id": "m1", "status": "COMPLETED"}]}')]
+        self.httpclient.post.return_value = self._response(
+            '{"migration": {"id": "m1"}}')
+
+        async def _deploy():
+            return [result async for result in
+                    self.client.migrations.deploy_many(
+                        ["r1"], min_interval=0.001, max_interval=0.001)]
+
+        result = asyncio.run(_deploy())
+
+        self.assertEqual(
+            [("r1", "COMPLETED")],
+            [(r.item, r.result.status) for r in result])
+        self.assertEqual(
+            "r1",
+            self.httpclient.post.await_args[1]['json']['migration'][
+                'replica_id'])
@@ -0,0 +1,111 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import threading
+import time
+from unittest import mock
+
+from coriolisclient import base
+from coriolisclient import bulk
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import diagnostics
+from coriolisclient.v1 import endpoint_instances
+from coriolisclient.v1 import logging as coriolis_logging
+from coriolisclient.v1 import providers
+from coriolisclient.v1 import replica_executions
+
+
+class RunBulkTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis bulk helpers."""
+
+    def test_run_bulk_keeps_order(self):
+        def _func(item):
+            # NOTE: make earlier items finish last:
+            time.sleep((5 - item) * 0.01)
+            return item * 2
+
+        result = bulk.run_bulk(_func, range(5), max_workers=5)
+
+        self.assertEqual(
+            [bulk.BulkResult(i, i * 2, None) for i in range(5)], result)
+
+    def test_run_bulk_errors(self):
+        error = ValueError("boom")
+
+        def _func(item):
+            if item == "bad":
+                raise error
+            return item
+
+        result = bulk.run_bulk(_func, ["good", "bad"])
+
+        self.assertEqual(
+            [bulk.BulkResult("good", "good", None),
+             bulk.BulkResult("bad", None, error)],
+            result)
+
+    def test_run_bulk_bounded(self):
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def _func(item):
+            with lock:
+                running.append(item)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.remove(item)
+
+        bulk.run_bulk(_func, range(20), max_workers=3)
+
+        self.assertLessEqual(max(peak), 3)
+
+    def test_run_bulk_empty(self):
+        self.assertEqual([], bulk.run_bulk(mock.Mock(), []))
+
+    def test_run_bulk_invalid_max_workers(self):
+        self.assertRaises(
+            ValueError, bulk.run_bulk, mock.Mock(), [1], max_workers=0)
+
+
+class GetManyTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis managers' get_many."""
+
+    def test_get_many(self):
+        manager = base.BaseManager(mock.Mock())
+        manager.get = mock.Mock(side_effect=lambda item: item.upper())
+
+        result = manager.get_many(["a", "b"], max_workers=2)
+
+        self.assertEqual(
+            [bulk.BulkResult("a", "A", None),
+             bulk.BulkResult("b", "B", None)],
+            result)
+
+    @mock.patch.object(replica_executions.ReplicaExecutionManager, 'get')
+    def test_get_many_replica_executions(self, mock_get):
+        manager = replica_executions.ReplicaExecutionManager(mock.Mock())
+
+        result = manager.get_many([("r1", "e1"), ("r2", "e2")])
+
+        mock_get.assert_has_calls(
+            [mock.call("r1", "e1"), mock.call("r2", "e2")], any_order=True)
+        self.assertEqual(
+            [mock_get.return_value] * 2, [r.result for r in result])
+
+    @mock.patch.object(endpoint_instances.EndpointInstanceManager, 'get')
+    def test_get_many_endpoint_instances(self, mock_get):
+        manager = endpoint_instances.EndpointInstanceManager(mock.Mock())
+
+        result = manager.get_many([("e1", "vm-1")])
+
+        mock_get.assert_called_once_with("e1", "vm-1")
+        self.assertEqual(mock_get.return_value, result[0].result)
+
+    def test_get_many_not_supported(self):
+        for manager in (
+                diagnostics.DiagnosticsManager(mock.Mock()),
+                coriolis_logging.CoriolisLogDownloadManager(mock.Mock()),
+                providers.ProvidersManager(mock.Mock())):
+            self.assertRaises(TypeError, manager.get_many, ["a"])
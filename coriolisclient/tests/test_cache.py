@@ -0,0 +1,207 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient import cache
+from coriolisclient import client
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import replicas
+
+
+class ResponseCacheTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis response cache."""
+
+    def test_get_collection_prefix(self):
+        for url in ('/replicas', 'replicas/detail', '/replicas/r1/executions',
+                    '/replicas?limit=1'):
+            self.assertEqual('/replicas', cache.get_collection_prefix(url))
+
+    def test_lru_eviction(self):
+        response_cache = cache.ResponseCache(max_entries=2)
+        response_cache.set('/a', 1)
+        response_cache.set('/b', 2)
+        response_cache.get('/a')
+
+        response_cache.set('/c', 3)
+
+        self.assertEqual(['/a', '/c'], [k for k, _ in response_cache.items()])
+
+    def test_invalidate(self):
+        response_cache = cache.ResponseCache()
+        for url in ('/replicas', '/replicas/detail', '/replicas/r1',
+                    '/migrations'):
+            response_cache.set(url, {})
+
+        response_cache.invalidate('/replicas/r1/executions')
+
+        self.assertEqual(
+            ['/migrations'], [k for k, _ in response_cache.items()])
+
+    @mock.patch.object(cache.time, 'monotonic')
+    def test_entry(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        response_cache = cache.ResponseCache(ttl=10)
+
+        entry = response_cache.set(
+            '/a', {}, {'ETag': '"x"', 'Last-Modified': 'yesterday'})
+
+        self.assertTrue(entry.has_validators)
+        self.assertEqual(
+            {'If-None-Match': '"x"', 'If-Modified-Since': 'yesterday'},
+            entry.get_validation_headers())
+        self.assertTrue(entry.is_fresh())
+        mock_monotonic.return_value = 110
+        self.assertFalse(entry.is_fresh())
+
+
+class CachedManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis managers' use of the response cache."""
+
+    def setUp(self):
+        super(CachedManagerTestCase, self).setUp()
+        self.response_cache = cache.ResponseCache()
+        self.client = mock.Mock(response_cache=self.response_cache)
+        self.manager = replicas.ReplicaManager(self.client)
+
+    def _response(self, body, status_code=200, headers=None):
+        resp = mock.Mock(status_code=status_code, headers=headers or {})
+        resp.json.return_value = body
+        return resp
+
+    def test_served_within_ttl(self):
+        self.client.get.return_value = self._response(
+            {"replicas": [{"id": "r1"}]})
+
+        first = self.manager.list()
+        second = self.manager.list()
+
+        self.client.get.assert_called_once_with('/replicas', headers={})
+        self.assertEqual(first, second)
+
+    def test_bypassed(self):
+        self.client.get.side_effect = [
+            self._response({"replicas": [{"id": "r1"}]}),
+            self._response({"replicas": [{"id": "r2"}]})]
+
+        self.manager.list()
+        with cache.bypass():
+            bypassed = self.manager.list()
+        cached = self.manager.list()
+
+        self.assertEqual(2, self.client.get.call_count)
+        self.assertEqual("r2", bypassed[0].id)
+        self.assertEqual("r2", cached[0].id)
+
+    def test_revalidated_with_etag(self):
+        self.client.get.side_effect = [
+            self._response({"replica": {"id": "r1"}},
+                           headers={'ETag': '"v1"'}),
+            self._response(None, status_code=304)]
+
+        self.manager.get("r1")
+        result = self.manager.get("r1")
+
+        self.assertEqual("r1", result.id)
+        self.client.get.assert_called_with(
+            '/replicas/r1', headers={'If-None-Match': '"v1"'})
+
+    def test_lazy_load_after_cached_listing(self):
+        self.client.get.side_effect = [
+            self._response({"replicas": [{"id": "r1"}]},
+                           headers={'ETag': '"v1"'}),
+            self._response({"replica": {
+                "id": "r1", "executions": [{"status": "RUNNING"}]}},
+                headers={'ETag': '"v1"'}),
+            self._response(None, status_code=304),
+            self._response({"replica": {
+                "id": "r1", "executions": [{"status": "COMPLETED"}]}},
+                headers={'ETag': '"v2"'})]
+
+        first = self.manager.list()[0].executions
+        second = self.manager.list()[0].executions
+
+        self.assertEqual("RUNNING", first[0].status)
+        self.assertEqual("COMPLETED", second[0].status)
+        self.assertEqual(
+            {"replicas": [{"id": "r1"}]},
+            self.response_cache.get('/replicas').body)
+
+    def test_no_cache(self):
+        self.client.response_cache = None
+        self.client.get.return_value = self._response({"replicas": []})
+
+        self.manager.list()
+        self.manager.list()
+
+        self.client.get.assert_has_calls(
+            [mock.call('/replicas'), mock.call().json()] * 2)
+
+
+class ListingIndexTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis listing lookup index."""
+
+    def setUp(self):
+        super(ListingIndexTestCase, self).setUp()
+        self.list_func = mock.Mock(return_value=["a1", "a2", "b1"])
+        self.index = cache.ListingIndex(
+            self.list_func, {'initial': lambda item: item[0]})
+
+    def test_build_lookup_tables(self):
+        result = cache.build_lookup_tables(
+            ["a1", "a2", "b1"], {'initial': lambda item: item[0],
+                                 'full': lambda item: item})
+
+        self.assertEqual({"a": ["a1", "a2"], "b": ["b1"]}, result['initial'])
+        self.assertEqual(["b1"], result['full']["b1"])
+
+    def test_lookup(self):
+        self.assertEqual(["a1", "a2"], self.index.lookup('initial', "a"))
+        self.assertEqual(["b1"], self.index.lookup('initial', "b"))
+        self.list_func.assert_called_once_with()
+
+    def test_lookup_miss(self):
+        self.assertEqual([], self.index.lookup('initial', "c"))
+        self.list_func.assert_called_once_with()
+
+        self.list_func.return_value = ["a1", "c1"]
+        self.assertEqual(["c1"], self.index.lookup('initial', "c"))
+        self.assertEqual([], self.index.lookup('initial', "b"))
+        self.assertEqual(3, self.list_func.call_count)
+
+    def test_invalidate(self):
+        self.index.lookup('initial', "a")
+        self.index.invalidate()
+        self.index.lookup('initial', "a")
+
+        self.assertEqual(2, self.list_func.call_count)
+
+    @mock.patch('time.monotonic')
+    def test_ttl(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.index.lookup('initial', "a")
+        mock_monotonic.return_value = 100 + cache.DEFAULT_TTL
+        self.index.lookup('initial', "a")
+
+        self.assertEqual(2, self.list_func.call_count)
+
+
+class HTTPClientCacheInvalidationTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the cache invalidation by the Coriolis HTTP client."""
+
+    @mock.patch('keystoneauth1.adapter.Adapter.request')
+    def test_request(self, mock_request):
+        response_cache = cache.ResponseCache()
+        response_cache.set('/replicas/detail', {})
+        response_cache.set('/migrations', {})
+        httpclient = client._HTTPClient(
+            mock.Mock(), response_cache=response_cache)
+
+        httpclient.get('/migrations')
+        self.assertEqual(2, len(response_cache))
+
+        httpclient.post('/replicas/r1/executions', json={})
+        self.assertEqual(
+            ['/migrations'], [k for k, _ in response_cache.items()])
+        mock_request.assert_called_with(
+            '/replicas/r1/executions', 'POST', json={})
@@ -0,0 +1,212 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import timeit
+from unittest import mock
+
+from keystoneauth1 import adapter
+from keystoneauth1 import exceptions as keystoneauth_exceptions
+
+from coriolisclient import client
+from coriolisclient import exceptions
+from coriolisclient import instrumentation
+from coriolisclient import ratelimit
+from coriolisclient import retry
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import licensing
+from coriolisclient.v1 import replicas
+
+
+# NOTE: generous upper bound on the average cost of a `Client()`, only
+# meant to catch managers or catalog lookups sneaking back into it:
+_CLIENT_INIT_BUDGET = 0.001
+
+
+class ClientTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Client."""
+
+    def setUp(self):
+        super(ClientTestCase, self).setUp()
+        self.session = mock.Mock()
+
+    def test_init_is_lazy(self):
+        coriolis = client.Client(session=self.session)
+
+        self.assertEqual(
+            [], [name for name in vars(coriolis) if not name.startswith('_')])
+        self.session.get_endpoint.assert_not_called()
+        self.session.get_token.assert_not_called()
+        self.session.request.assert_not_called()
+
+    def test_manager_built_once(self):
+        coriolis = client.Client(session=self.session)
+
+        manager = coriolis.replicas
+
+        self.assertIsInstance(manager, replicas.ReplicaManager)
+        self.assertIs(manager, coriolis.replicas)
+        self.assertIs(coriolis._httpclient, manager.client)
+
+    def test_replica_manager_shares_endpoint_manager(self):
+        coriolis = client.Client(session=self.session)
+
+        self.assertIs(coriolis.endpoints, coriolis.replicas._endpoint_manager)
+
+    def test_logging_manager_defers_endpoint_lookup(self):
+        coriolis = client.Client(session=self.session)
+
+        coriolis.logging
+
+        self.session.get_endpoint.assert_not_called()
+
+    def test_licensing_managers_share_client(self):
+        coriolis = client.Client(
+            session=self.session, licensing_pool_size=3, licensing_timeout=7)
+
+        licensing_clients = {
+            id(manager._licensing_cli) for manager in (
+                coriolis.licensing, coriolis.licensing_appliances,
+                coriolis.licensing_reservations, coriolis.licensing_server)}
+
+        self.assertEqual({id(coriolis._licensing_client)}, licensing_clients)
+        self.assertIsInstance(
+            coriolis._licensing_client, licensing.LicensingClient)
+        self.assertEqual(3, coriolis._licensing_client._pool_size)
+        self.assertEqual(7, coriolis._licensing_client._timeout)
+
+    def test_licensing_client_shares_rate_limiter(self):
+        rate_limiter = ratelimit.RateLimiter(rate=5)
+
+        coriolis = client.Client(
+            session=self.session, rate_limiter=rate_limiter)
+
+        self.assertIs(rate_limiter, coriolis._httpclient.rate_limiter)
+        self.assertIs(rate_limiter, coriolis._licensing_client._rate_limiter)
+
+    def test_instrumentation_shared(self):
+        coriolis = client.Client(session=self.session)
+
+        self.assertIs(
+            coriolis._httpclient.instrumentation,
+            coriolis._licensing_client._instrumentation)
+        self.assertIs(
+            coriolis._httpclient.instrumentation,
+            coriolis.logging._coriolis_cli._instrumentation)
+        self.assertEqual([], coriolis.stats())
+
+    def test_init_benchmark(self):
+        number = 200
+        duration = timeit.timeit(
+            lambda: client.Client(session=self.session), number=number)
+
+        self.assertLess(duration / number, _CLIENT_INIT_BUDGET)
+
+
+class HTTPClientRetryTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the retries of the Coriolis HTTP client."""
+
+    def setUp(self):
+        super(HTTPClientRetryTestCase, self).setUp()
+        self.httpclient = client._HTTPClient(
+            mock.Mock(), endpoint="http://coriolis",
+            retry_policy=retry.RetryPolicy(max_retries=2, base_delay=1),
+            circuit_failure_threshold=3)
+        sleep_patcher = mock.patch.object(client.time, 'sleep')
+        self.mock_sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+        request_patcher = mock.patch.object(adapter.Adapter, 'request')
+        self.mock_request = request_patcher.start()
+        self.addCleanup(request_patcher.stop)
+
+    @staticmethod
+    def _get_http_error(status_code, headers=None):
+        response = mock.Mock(status_code=status_code, headers=headers or {})
+        return keystoneauth_exceptions.from_response(response, "GET", "/x")
+
+    def test_retries_transient_failures(self):
+        response = mock.Mock(status_code=200)
+        self.mock_request.side_effect = [
+            keystoneauth_exceptions.ConnectFailure(),
+            self._get_http_error(429, {"Retry-After": "5"}),
+            response]
+
+        result = self.httpclient.request("/replicas", "GET")
+
+        self.assertEqual(response, result)
+        self.assertEqual(3, self.mock_request.call_count)
+        self.assertEqual(mock.call(5.), self.mock_sleep.call_args)
+        metrics = self.httpclient.retry_metrics.snapshot()
+        self.assertEqual(2, metrics['retries'])
+        self.assertEqual(
+            {'ConnectFailure': 1, '429': 1}, metrics['retries_by_reason'])
+        self.assertEqual(1, metrics['retried_requests'])
+        self.assertEqual(0, metrics['exhausted_requests'])
+
+    def test_rate_limits_each_attempt(self):
+        self.httpclient.rate_limiter = mock.Mock()
+        self.mock_request.side_effect = [
+            self._get_http_error(503), mock.Mock(status_code=200)]
+
+        self.httpclient.request("/endpoints/e1/instances", "GET")
+
+        self.assertEqual(
+            [mock.call("GET", "/endpoints/e1/instances")] * 2,
+            self.httpclient.rate_limiter.acquire.call_args_list)
+
+    def test_records_requests(self):
+        self.httpclient.instrumentation = instrumentation.Instrumentation()
+        response = mock.Mock(status_code=200, headers={'Content-Length': 9})
+        response.request.body = None
+        self.mock_request.side_effect = [
+            keystoneauth_exceptions.ConnectFailure(), response,
+            self._get_http_error(404)]
+
+        self.httpclient.request("/replicas/1234", "GET")
+        self.assertRaises(
+            keystoneauth_exceptions.NotFound,
+            self.httpclient.request, "/replicas/5678", "GET")
+
+        [stats] = self.httpclient.instrumentation.stats()
+        self.assertEqual('/replicas/{id}', stats['url'])
+        self.assertEqual(2, stats['count'])
+        self.assertEqual(1, stats['errors'])
+        self.assertEqual(1, stats['retries'])
+        self.assertEqual({'200': 1, '404': 1}, stats['statuses'])
+        self.assertEqual(9, stats['response_bytes'])
+
+    def test_retries_exhausted(self):
+        error = self._get_http_error(503)
+        self.mock_request.side_effect = error
+
+        self.assertRaises(
+            keystoneauth_exceptions.ServiceUnavailable,
+            self.httpclient.request, "/replicas", "GET")
+
+        self.assertEqual(3, self.mock_request.call_count)
+        self.assertEqual(
+            1, self.httpclient.retry_metrics.snapshot()['exhausted_requests'])
+        self.assertTrue(self.httpclient.circuit_breaker.is_open)
+        self.assertRaises(
+            exceptions.CircuitOpen,
+            self.httpclient.request, "/replicas", "GET")
+        self.assertEqual(3, self.mock_request.call_count)
+
+    def test_non_idempotent_not_retried(self):
+        self.mock_request.side_effect = self._get_http_error(503)
+
+        self.assertRaises(
+            keystoneauth_exceptions.ServiceUnavailable,
+            self.httpclient.request, "/replicas", "POST")
+
+        self.assertEqual(1, self.mock_request.call_count)
+        self.mock_sleep.assert_not_called()
+
+    def test_client_errors_not_retried(self):
+        self.mock_request.side_effect = self._get_http_error(404)
+
+        self.assertRaises(
+            keystoneauth_exceptions.NotFound,
+            self.httpclient.request, "/replicas/r1", "GET")
+
+        self.assertEqual(1, self.mock_request.call_count)
+        self.assertFalse(self.httpclient.circuit_breaker.is_open)
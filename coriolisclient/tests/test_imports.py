@@ -0,0 +1,91 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from coriolisclient.tests import test_base
+
+
+# NOTE: modules which are only needed by some of the commands, and which
+# must thus stay out of the startup of all the others:
+DEFERRED_MODULES = (
+    'asyncio',
+    'cmd2',
+    'coriolisclient.cli.utils',
+    # NOTE: pbr computes the version of the client on import of this
+    # module, which is slow:
+    'coriolisclient.version',
+    'oslo_utils.strutils',
+    'websockets',
+)
+DEFERRED_PACKAGES = (
+    'coriolisclient.v1',
+)
+
+# NOTE: generous budget, in microseconds, of the time spent on running the
+# CLI's own modules on import, third party ones excluded:
+OWN_IMPORT_BUDGET = 100000
+
+
+def _get_import_times(code, env=None):
+    """Returns the self import time, in microseconds, of each module
+    imported by running the given code.
+    """
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        stderr=subprocess.PIPE, universal_newlines=True, env=env,
+        check=True).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_time, _, name = line[len('import time:'):].split('|')
+        if self_time.strip().isdigit():
+            times[name.strip()] = int(self_time)
+    return times
+
+
+class ImportTimeTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite guarding the import time of the CLI."""
+
+    def _assert_deferred(self, times):
+        for name in times:
+            self.assertNotIn(name, DEFERRED_MODULES)
+            for package in DEFERRED_PACKAGES:
+                self.assertFalse(
+                    name == package or name.startswith(package + '.'),
+                    "%s imported on startup" % name)
+
+    def _assert_own_time(self, times):
+        own_time = sum(
+            t for name, t in times.items()
+            if name.split('.')[0] == 'coriolisclient')
+        self.assertLess(own_time, OWN_IMPORT_BUDGET)
+
+    def test_shell(self):
+        times = _get_import_times('import coriolisclient.cli.shell')
+
+        self._assert_deferred(times)
+        self._assert_own_time(times)
+
+    def test_shell_app(self):
+        # NOTE: building the application builds the command index as well,
+        # which must not land in the actual cache directory:
+        home = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, home)
+        env = dict(os.environ, HOME=home)
+
+        times = _get_import_times(
+            'from coriolisclient.cli import shell; shell.Coriolis()',
+            env=env)
+
+        self._assert_deferred(times)
+        self._assert_own_time(times)
+
+    def test_client(self):
+        self._assert_deferred(
+            _get_import_times('import coriolisclient.client'))
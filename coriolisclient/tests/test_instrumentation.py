@@ -0,0 +1,174 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import json
+import logging
+import os
+import tempfile
+from unittest import mock
+
+from coriolisclient import instrumentation
+from coriolisclient.tests import test_base
+
+
+def _get_record(**kwargs):
+    values = {
+        'service': instrumentation.SERVICE_CORIOLIS, 'method': 'GET',
+        'url': '/replicas/{id}', 'status': 200, 'latency': 0.02,
+        'request_bytes': 0, 'response_bytes': 100, 'retries': 0,
+        'error': None, 'started_at': 1000.}
+    values.update(kwargs)
+    return instrumentation.RequestRecord(**values)
+
+
+class InstrumentationHelpersTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis instrumentation helpers."""
+
+    def test_get_url_template(self):
+        self.assertEqual(
+            "/replicas/{id}/executions/{id}",
+            instrumentation.get_url_template(
+                "/replicas/7c4e8a0e-5b6e-4a0a-9d4f-3f2a1b0c9d8e/executions/"
+                "0f1e2d3c4b5a69788796a5b4c3d2e1f0?show_deleted=true"))
+        self.assertEqual(
+            "/v1/{id}/endpoints/{id}/instances",
+            instrumentation.get_url_template(
+                "http://coriolis:7667/v1/3b1f0e4c2d5a4f6e8a9b0c1d2e3f4a5b/"
+                "endpoints/12/instances"))
+        self.assertEqual(
+            "/endpoints/{id}/instances/{id}",
+            instrumentation.get_url_template(
+                "/endpoints/3b1f0e4c2d5a4f6e8a9b0c1d2e3f4a5b/instances/"
+                "dm0tMDE="))
+        self.assertEqual(
+            "/endpoints/{id}/instances/",
+            instrumentation.get_url_template(
+                "/endpoints/3b1f0e4c2d5a4f6e8a9b0c1d2e3f4a5b/instances/"))
+        self.assertEqual(
+            "/logs/coriolis-worker/",
+            instrumentation.get_url_template("/logs/coriolis-worker/"))
+
+    def test_get_request_bytes(self):
+        self.assertEqual(9, instrumentation.get_request_bytes(
+            mock.Mock(request=mock.Mock(body='{"é": 1}'))))
+        self.assertEqual(0, instrumentation.get_request_bytes(
+            mock.Mock(request=mock.Mock(body=None))))
+
+    def test_get_response_bytes(self):
+        self.assertEqual(42, instrumentation.get_response_bytes(
+            mock.Mock(headers={'Content-Length': '42'})))
+        self.assertEqual(3, instrumentation.get_response_bytes(
+            mock.Mock(headers={}, content=b"abc", _content_consumed=True)))
+        self.assertIsNone(instrumentation.get_response_bytes(
+            mock.Mock(headers={}, _content_consumed=False)))
+
+
+class HistogramSinkTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis in-memory request histograms."""
+
+    def test_snapshot(self):
+        sink = instrumentation.HistogramSink()
+        for latency in (0.02, 0.03, 0.2, 4):
+            sink(_get_record(latency=latency))
+        sink(_get_record(method='POST', url='/replicas', status=503,
+                         latency=0.001, request_bytes=10, retries=2))
+        sink(_get_record(status=None, error='ConnectFailure', latency=0.5))
+
+        get_stats, post_stats = sink.snapshot()
+
+        self.assertEqual('GET', get_stats['method'])
+        self.assertEqual(5, get_stats['count'])
+        self.assertEqual(1, get_stats['errors'])
+        self.assertEqual({'200': 4, 'None': 1}, get_stats['statuses'])
+        self.assertEqual(500, get_stats['response_bytes'])
+        self.assertEqual(0.02, get_stats['latency']['min'])
+        self.assertEqual(4, get_stats['latency']['max'])
+        self.assertEqual(0.25, get_stats['latency']['p50'])
+        self.assertEqual(4, get_stats['latency']['p99'])
+        self.assertEqual(1, get_stats['latency']['buckets']['5'])
+        self.assertEqual('/replicas', post_stats['url'])
+        self.assertEqual(1, post_stats['errors'])
+        self.assertEqual(2, post_stats['retries'])
+        self.assertEqual(10, post_stats['request_bytes'])
+
+    def test_reset(self):
+        sink = instrumentation.HistogramSink()
+        sink(_get_record())
+
+        sink.reset()
+
+        self.assertEqual([], sink.snapshot())
+
+
+class SinksTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis request record sinks."""
+
+    def test_json_lines_sink(self):
+        fd, path = tempfile.mkstemp(suffix=".jsonl")
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        sink = instrumentation.JSONLinesSink(path)
+
+        sink(_get_record())
+        sink(_get_record(status=404))
+        sink.close()
+
+        with open(path) as fin:
+            records = [json.loads(line) for line in fin]
+        self.assertEqual([200, 404], [r['status'] for r in records])
+        self.assertEqual('/replicas/{id}', records[0]['url'])
+
+    def test_logging_sink(self):
+        logger = mock.Mock()
+        sink = instrumentation.LoggingSink(logger, level=logging.INFO)
+
+        sink(_get_record())
+
+        logger.log.assert_called_once_with(
+            logging.INFO, mock.ANY, 'coriolis', 'GET', '/replicas/{id}', 200,
+            0.02, 0, 100, 0)
+
+
+class InstrumentationTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis request instrumentation."""
+
+    def test_record(self):
+        sink = mock.Mock()
+        instr = instrumentation.Instrumentation(sinks=[sink])
+        resp = mock.Mock(status_code=201, headers={'Content-Length': '7'})
+        resp.request.body = b"{}"
+
+        instr.record(
+            instrumentation.SERVICE_LICENSING, "post",
+            "/appliances/1234", 1000., 0.5, resp=resp, retries=1)
+
+        sink.assert_called_once_with(instrumentation.RequestRecord(
+            'licensing', 'POST', '/appliances/{id}', 201, 0.5, 2, 7, 1, None,
+            1000.))
+        self.assertEqual(1, instr.stats()[0]['count'])
+
+    def test_record_error(self):
+        sink = mock.Mock()
+        instr = instrumentation.Instrumentation(sinks=[sink])
+
+        instr.record(
+            instrumentation.SERVICE_CORIOLIS, "GET", "/replicas", 1000., 1,
+            error=ValueError())
+
+        record = sink.call_args[0][0]
+        self.assertIsNone(record.status)
+        self.assertEqual('ValueError', record.error)
+
+    def test_failing_sink(self):
+        failing_sink = mock.Mock(side_effect=IOError)
+        sink = mock.Mock()
+        instr = instrumentation.Instrumentation()
+        instr.add_sink(failing_sink)
+        instr.add_sink(sink)
+
+        instr.record(
+            instrumentation.SERVICE_CORIOLIS, "GET", "/replicas", 1000., 1)
+
+        sink.assert_called_once()
+        instr.remove_sink(sink)
+        self.assertNotIn(sink, instr._sinks)
@@ -0,0 +1,78 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import json
+import os
+import tempfile
+
+from coriolisclient import exceptions
+from coriolisclient import manifest
+from coriolisclient.tests import test_base
+
+
+class ManifestTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis manifest loading."""
+
+    def _write(self, name, content):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(os.rmdir, tmp_dir)
+        path = os.path.join(tmp_dir, name)
+        with open(path, 'w') as fout:
+            fout.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_load_csv(self):
+        path = self._write("wave.csv", (
+            "origin_endpoint_id,instances,destination_environment,notes\n"
+            'src,vm1; vm2,"{""network_map"": {}}",\n'))
+
+        result = manifest.load(path)
+
+        self.assertEqual([{
+            "origin_endpoint_id": "src",
+            "instances": ["vm1", "vm2"],
+            "destination_environment": {"network_map": {}}}], result)
+
+    def test_load_csv_invalid_json(self):
+        path = self._write(
+            "wave.csv", "network_map\n{invalid\n")
+
+        self.assertRaises(
+            exceptions.CoriolisException, manifest.load, path)
+
+    def test_load_json_defaults(self):
+        path = self._write("wave.json", json.dumps({
+            "defaults": {"origin_endpoint_id": "src", "notes": "wave 1"},
+            "rows": [{"instances": ["vm1"]},
+                     {"instances": ["vm2"], "notes": "db"}]}))
+
+        result = manifest.load(path)
+
+        self.assertEqual([
+            {"origin_endpoint_id": "src", "notes": "wave 1",
+             "instances": ["vm1"]},
+            {"origin_endpoint_id": "src", "notes": "db",
+             "instances": ["vm2"]}], result)
+
+    def test_load_yaml(self):
+        path = self._write("wave.yml", "- instances: [vm1]\n")
+
+        self.assertEqual([{"instances": ["vm1"]}], manifest.load(path))
+
+    def test_load_explicit_format(self):
+        path = self._write("wave.txt", '[{"instances": ["vm1"]}]')
+
+        self.assertEqual(
+            [{"instances": ["vm1"]}],
+            manifest.load(path, fmt=manifest.FORMAT_JSON))
+
+    def test_load_invalid(self):
+        path = self._write("wave.json", '{"instances": ["vm1"]}')
+
+        self.assertRaises(
+            exceptions.CoriolisException, manifest.load, path)
+
+    def test_get_format_unknown(self):
+        self.assertRaises(
+            exceptions.CoriolisException, manifest.get_format, "wave.txt")
@@ -0,0 +1,295 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import asyncio
+import threading
+from unittest import mock
+
+from coriolisclient import cache
+from coriolisclient import constants
+from coriolisclient import exceptions
+from coriolisclient import polling
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import migrations
+from coriolisclient.v1 import minion_pools
+from coriolisclient.v1 import replica_executions
+
+
+def _migration(status, progress_updates=0):
+    return migrations.Migration(None, {
+        "id": "m1", "status": status,
+        "tasks": [{"status": "RUNNING",
+                   "progress_updates": [{}] * progress_updates}]},
+        loaded=True)
+
+
+class BackoffTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis polling backoff."""
+
+    def test_next_interval(self):
+        backoff = polling.Backoff(min_interval=1, max_interval=4)
+
+        result = [backoff.next_interval() for _ in range(4)]
+
+        for interval, current in zip(result, [1, 2, 4, 4]):
+            self.assertTrue(current / 2. <= interval <= current)
+
+    def test_reset(self):
+        backoff = polling.Backoff(min_interval=1, max_interval=30)
+        for _ in range(5):
+            backoff.next_interval()
+
+        backoff.reset()
+
+        self.assertLessEqual(backoff.next_interval(), 1)
+
+    def test_invalid_intervals(self):
+        self.assertRaises(
+            ValueError, polling.Backoff, min_interval=0)
+        self.assertRaises(
+            ValueError, polling.Backoff, min_interval=5, max_interval=1)
+
+
+class WaiterTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis polling waiter."""
+
+    def test_get_interval_final_status(self):
+        waiter = polling.Waiter(constants.FINALIZED_MIGRATION_STATUSES)
+
+        self.assertIsNone(waiter.get_interval(_migration("COMPLETED")))
+
+    def test_get_interval_deadlocked(self):
+        waiter = polling.Waiter(constants.FINALIZED_EXECUTION_STATUSES)
+
+        self.assertIsNone(waiter.get_interval(_migration("DEADLOCKED")))
+
+    def test_get_interval_progress_resets_backoff(self):
+        waiter = polling.Waiter(
+            constants.FINALIZED_MIGRATION_STATUSES,
+            get_progress=polling.get_tasks_progress,
+            min_interval=1, max_interval=64)
+
+        for _ in range(5):
+            waiter.get_interval(_migration("RUNNING"))
+        self.assertGreater(waiter.get_interval(_migration("RUNNING")), 1)
+        self.assertLessEqual(
+            waiter.get_interval(_migration("RUNNING", 1)), 1)
+
+    @mock.patch('time.monotonic')
+    def test_get_interval_timeout(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        waiter = polling.Waiter(
+            constants.FINALIZED_MIGRATION_STATUSES, timeout=10)
+
+        mock_monotonic.return_value = 105
+        self.assertLessEqual(waiter.get_interval(_migration("RUNNING")), 5)
+        mock_monotonic.return_value = 110
+        self.assertRaises(
+            exceptions.WaitTimeout, waiter.get_interval,
+            _migration("RUNNING"))
+
+
+class WaitForTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis waiting helpers."""
+
+    def setUp(self):
+        super(WaitForTestCase, self).setUp()
+        self.waiter = polling.Waiter(
+            constants.FINALIZED_MIGRATION_STATUSES, min_interval=0.001,
+            max_interval=0.001)
+
+    def test_wait_for(self):
+        get_func = mock.Mock(side_effect=[
+            _migration("RUNNING"), _migration("RUNNING"),
+            _migration("ERROR")])
+
+        result = polling.wait_for(get_func, self.waiter)
+
+        self.assertEqual("ERROR", result.status)
+        self.assertEqual(3, get_func.call_count)
+
+    def test_wait_for_bypasses_cache(self):
+        bypassed = []
+
+        def _get():
+            bypassed.append(cache.is_bypassed())
+            return _migration("COMPLETED")
+
+        polling.wait_for(_get, self.waiter)
+
+        self.assertEqual([True], bypassed)
+        self.assertFalse(cache.is_bypassed())
+
+    def test_wait_for_canceled(self):
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        self.assertRaises(
+            exceptions.WaitCanceled, polling.wait_for,
+            mock.Mock(return_value=_migration("RUNNING")), self.waiter,
+            cancel_event=cancel_event)
+
+    def test_wait_for_async(self):
+        get_func = mock.AsyncMock(side_effect=[
+            _migration("RUNNING"), _migration("CANCELED")])
+
+        result = asyncio.run(polling.wait_for_async(get_func, self.waiter))
+
+        self.assertEqual("CANCELED", result.status)
+
+    def test_wait_for_async_canceled(self):
+        async def _wait():
+            cancel_event = asyncio.Event()
+            cancel_event.set()
+            await polling.wait_for_async(
+                mock.AsyncMock(return_value=_migration("RUNNING")),
+                self.waiter, cancel_event=cancel_event)
+
+        self.assertRaises(exceptions.WaitCanceled, asyncio.run, _wait())
+
+
+class WatchTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis fleet watcher."""
+
+    def setUp(self):
+        super(WatchTestCase, self).setUp()
+        self.waiter = polling.Waiter(
+            constants.FINALIZED_MIGRATION_STATUSES, min_interval=0.001,
+            max_interval=0.001)
+
+    def _listing(self, **statuses):
+        return [migrations.Migration(
+            None, {"id": migration_id, "status": status}, loaded=True)
+            for migration_id, status in statuses.items()]
+
+    def test_watch(self):
+        list_func = mock.Mock(side_effect=[
+            self._listing(m1="RUNNING", m2="RUNNING", other="RUNNING"),
+            self._listing(m1="RUNNING", m2="RUNNING"),
+            self._listing(m1="COMPLETED", m2="RUNNING"),
+            self._listing(m2="ERROR")])
+
+        result = [
+            (c.id, c.previous_status, c.status, c.final)
+            for c in polling.watch(list_func, ["m1", "m2"], self.waiter)]
+
+        self.assertEqual([
+            ("m1", None, "RUNNING", False),
+            ("m2", None, "RUNNING", False),
+            ("m1", "RUNNING", "COMPLETED", True),
+            ("m2", "RUNNING", "ERROR", True)], result)
+        self.assertEqual(4, list_func.call_count)
+
+    def test_watch_bypasses_cache(self):
+        bypassed = []
+
+        def _list():
+            bypassed.append(cache.is_bypassed())
+            return self._listing(m1="COMPLETED")
+
+        for _ in polling.watch(_list, ["m1"], self.waiter):
+            self.assertFalse(cache.is_bypassed())
+
+        self.assertEqual([True], bypassed)
+
+    def test_watch_missing(self):
+        result = list(polling.watch(
+            mock.Mock(return_value=[]), ["m1"], self.waiter))
+
+        self.assertEqual(
+            [polling.StatusChange("m1", None, None, None, True)], result)
+
+    @mock.patch('time.monotonic')
+    def test_watch_timeout(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        waiter = polling.Waiter(
+            constants.FINALIZED_MIGRATION_STATUSES, timeout=10)
+        changes = polling.watch(
+            mock.Mock(return_value=self._listing(m1="RUNNING")), ["m1"],
+            waiter)
+
+        self.assertEqual("RUNNING", next(changes).status)
+        mock_monotonic.return_value = 110
+        self.assertRaises(exceptions.WaitTimeout, next, changes)
+
+    def test_watch_canceled(self):
+        cancel_event = threading.Event()
+        cancel_event.set()
+        changes = polling.watch(
+            mock.Mock(return_value=self._listing(m1="RUNNING")), ["m1"],
+            self.waiter, cancel_event=cancel_event)
+
+        next(changes)
+        self.assertRaises(exceptions.WaitCanceled, next, changes)
+
+    def test_watch_async(self):
+        list_func = mock.AsyncMock(side_effect=[
+            self._listing(m1="RUNNING"), self._listing(m1="COMPLETED")])
+
+        async def _watch():
+            return [c.status async for c in polling.watch_async(
+                list_func, ["m1"], self.waiter)]
+
+        self.assertEqual(["RUNNING", "COMPLETED"], asyncio.run(_watch()))
+
+
+class ManagerWaitForTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis managers' `wait_for()`."""
+
+    @mock.patch.object(polling, 'wait_for')
+    def test_migrations_wait_for(self, mock_wait_for):
+        manager = migrations.MigrationManager(mock.Mock())
+
+        result = manager.wait_for("m1", timeout=60)
+
+        self.assertEqual(mock_wait_for.return_value, result)
+        (get_func, waiter), kwargs = mock_wait_for.call_args
+        self.assertEqual(("m1",), get_func.args)
+        self.assertEqual(60, waiter.timeout)
+        self.assertIsNone(kwargs['cancel_event'])
+
+    @mock.patch.object(replica_executions.ReplicaExecutionManager, 'get')
+    def test_replica_executions_wait_for(self, mock_get):
+        mock_get.return_value = replica_executions.ReplicaExecution(
+            None, {"id": "e1", "status": "COMPLETED"}, loaded=True)
+        manager = replica_executions.ReplicaExecutionManager(mock.Mock())
+
+        result = manager.wait_for("r1", "e1")
+
+        self.assertEqual("e1", result.id)
+        mock_get.assert_called_once_with("r1", "e1")
+
+    @mock.patch.object(minion_pools.MinionPoolManager, 'get')
+    def test_minion_pools_wait_for(self, mock_get):
+        mock_get.return_value = minion_pools.MinionPool(
+            None, {"id": "p1", "status": "ALLOCATED"}, loaded=True)
+        manager = minion_pools.MinionPoolManager(mock.Mock())
+
+        result = manager.wait_for("p1")
+
+        self.assertEqual("ALLOCATED", result.status)
+
+    @mock.patch.object(replica_executions.ReplicaExecutionManager, 'list_all')
+    def test_replica_executions_watch(self, mock_list_all):
+        mock_list_all.return_value = [replica_executions.ReplicaExecution(
+            None, {"id": "e1", "status": "COMPLETED"}, loaded=True)]
+        manager = replica_executions.ReplicaExecutionManager(mock.Mock())
+
+        result = list(manager.watch(["e1"]))
+
+        self.assertEqual(["e1"], [c.id for c in result])
+        mock_list_all.assert_called_once_with()
+
+    def test_replica_executions_list_all(self):
+        client = mock.Mock(response_cache=None)
+        client.get.return_value.json.return_value = {"replicas": [
+            {"id": "r1", "executions": [{"id": "e1"}, {"id": "e2"}]},
+            {"id": "r2", "executions": None}]}
+        manager = replica_executions.ReplicaExecutionManager(client)
+
+        result = manager.list_all()
+
+        self.assertEqual(
+            [("e1", "r1"), ("e2", "r1")],
+            [(e.id, e.action_id) for e in result])
+        client.get.assert_called_once_with('/replicas/detail')
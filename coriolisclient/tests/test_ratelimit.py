@@ -0,0 +1,120 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient import ratelimit
+from coriolisclient.tests import test_base
+
+
+class TokenBucketTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis token bucket."""
+
+    def setUp(self):
+        super(TokenBucketTestCase, self).setUp()
+        patcher = mock.patch('time.monotonic', return_value=100.)
+        self.mock_monotonic = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.bucket = ratelimit.TokenBucket(2, capacity=2)
+
+    def test_try_acquire(self):
+        self.assertEqual(0, self.bucket.try_acquire())
+        self.assertEqual(0, self.bucket.try_acquire())
+        self.assertEqual(0.5, self.bucket.try_acquire())
+
+        self.mock_monotonic.return_value = 100.5
+        self.assertEqual(0, self.bucket.try_acquire())
+
+    def test_try_acquire_capacity(self):
+        self.mock_monotonic.return_value = 1000.
+        for _ in range(2):
+            self.assertEqual(0, self.bucket.try_acquire())
+        self.assertEqual(0.5, self.bucket.try_acquire())
+
+    @mock.patch('time.sleep')
+    def test_acquire(self, mock_sleep):
+        def _sleep(seconds):
+            self.mock_monotonic.return_value += seconds
+        mock_sleep.side_effect = _sleep
+
+        self.bucket.acquire(tokens=2)
+        result = self.bucket.acquire()
+
+        self.assertEqual(0.5, result)
+        mock_sleep.assert_called_once_with(0.5)
+
+    def test_invalid_rate(self):
+        self.assertRaises(ValueError, ratelimit.TokenBucket, 0)
+
+    def test_reserve(self):
+        self.assertEqual(0, self.bucket.reserve(tokens=2))
+        self.assertEqual(0.5, self.bucket.reserve())
+        # NOTE: later reservations queue up behind the earlier ones:
+        self.assertEqual(1, self.bucket.reserve())
+
+
+class QuotaTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis rate limiting quotas."""
+
+    def test_matches(self):
+        quota = ratelimit.Quota(
+            1, method="get", pattern="/endpoints/*/instances")
+
+        self.assertTrue(quota.matches("GET", "/endpoints/e1/instances"))
+        self.assertTrue(quota.matches("GET", "/endpoints/e1/instances/vm1"))
+        self.assertFalse(quota.matches("POST", "/endpoints/e1/instances"))
+        self.assertFalse(quota.matches("GET", "/endpoints/e1/networks"))
+        self.assertFalse(quota.matches("GET", "/endpoints/e1/x/instances"))
+
+    def test_matches_any(self):
+        quota = ratelimit.Quota(1)
+
+        self.assertTrue(quota.matches("DELETE", "/replicas/r1"))
+
+    def test_parse_quota(self):
+        quota = ratelimit.parse_quota("GET /endpoints/*/instances=0.5")
+
+        self.assertEqual("GET", quota.method)
+        self.assertEqual("/endpoints/*/instances", quota.pattern)
+        self.assertEqual(0.5, quota.bucket.rate)
+
+    def test_parse_quota_any_method(self):
+        quota = ratelimit.parse_quota("/replicas=2")
+
+        self.assertIsNone(quota.method)
+        self.assertEqual("/replicas", quota.pattern)
+
+    def test_parse_quota_invalid(self):
+        self.assertRaises(ValueError, ratelimit.parse_quota, "/replicas")
+        self.assertRaises(ValueError, ratelimit.parse_quota, "/replicas=x")
+
+
+class RateLimiterTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis client-wide rate limiter."""
+
+    def setUp(self):
+        super(RateLimiterTestCase, self).setUp()
+        patcher = mock.patch('time.monotonic', return_value=100.)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.limiter = ratelimit.RateLimiter(rate=10, quotas=[
+            ratelimit.Quota(
+                1, method="GET", pattern="/endpoints/*/instances")])
+
+    @mock.patch('time.sleep')
+    def test_acquire(self, mock_sleep):
+        self.assertEqual(0, self.limiter.acquire(
+            "GET", "/endpoints/e1/instances?marker=vm1"))
+        self.assertEqual(0, self.limiter.acquire("GET", "/replicas"))
+        self.assertEqual(1, self.limiter.acquire(
+            "GET", "/endpoints/e2/instances"))
+
+        mock_sleep.assert_called_once_with(1)
+
+    @mock.patch('time.sleep')
+    def test_acquire_unlimited(self, mock_sleep):
+        limiter = ratelimit.RateLimiter()
+
+        for _ in range(100):
+            self.assertEqual(0, limiter.acquire("GET", "/replicas"))
+        mock_sleep.assert_not_called()
@@ -0,0 +1,169 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import operator
+import pickle
+from unittest import mock
+
+from coriolisclient import base
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import endpoint_instances
+from coriolisclient.v1 import migrations
+from coriolisclient.v1 import replica_executions
+
+
+class ResourceTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis resources lazy loading."""
+
+    def setUp(self):
+        super(ResourceTestCase, self).setUp()
+        self.manager = mock.Mock()
+        base.reset_lazy_load_counts()
+        self.addCleanup(base.reset_lazy_load_counts)
+
+    def test_getid_does_not_lazy_load(self):
+        res = migrations.Migration(self.manager, {"id": "m1"})
+
+        self.assertEqual("m1", base.getid(res))
+        self.assertFalse(res.is_loaded())
+        self.manager.get.assert_not_called()
+
+    def test_getid_compact_resource(self):
+        res = base.compact_resource_class(migrations.Migration)(
+            self.manager, {"id": "m1"})
+
+        self.assertEqual("m1", base.getid(res))
+        self.manager.get.assert_not_called()
+
+    def test_getid_non_resource(self):
+        self.assertEqual("m1", base.getid("m1"))
+        self.assertEqual("m1", base.getid(mock.Mock(uuid="m1")))
+
+    def test_private_names_do_not_lazy_load(self):
+        res = migrations.Migration(self.manager, {"id": "m1"})
+
+        self.assertRaises(AttributeError, getattr, res, "__deepcopy__")
+        self.manager.get.assert_not_called()
+
+    def test_lazy_load_once(self):
+        self.manager.get.return_value = mock.Mock(_info={"status": "OK"})
+        res = migrations.Migration(self.manager, {"id": "m1"})
+
+        self.assertEqual("OK", res.status)
+        self.assertRaises(AttributeError, getattr, res, "missing")
+        self.assertRaises(AttributeError, getattr, res, "missing")
+        self.manager.get.assert_called_once_with("m1")
+        self.assertEqual({"Migration": 1}, base.get_lazy_load_counts())
+
+    def test_get_detail_fetches_once(self):
+        self.manager.get.return_value = mock.Mock(_info={"id": "m1"})
+        res = migrations.Migration(self.manager, {"id": "m1"}, loaded=True)
+
+        self.assertEqual([], res.tasks)
+        self.assertEqual([], res.tasks)
+        self.manager.get.assert_called_once_with("m1")
+
+    def test_replica_execution_tasks(self):
+        self.manager.get.return_value = mock.Mock(
+            _info={"tasks": [{"id": "t1"}]})
+        res = replica_executions.ReplicaExecution(
+            self.manager, {"id": "e1", "action_id": "r1"}, loaded=True)
+
+        self.assertEqual(["t1"], [t.id for t in res.tasks])
+        self.assertEqual(["t1"], [t.id for t in res.tasks])
+        self.manager.get.assert_called_once_with("r1", "e1")
+
+
+class CompactResourceTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis compact resources."""
+
+    def setUp(self):
+        super(CompactResourceTestCase, self).setUp()
+        self.manager = mock.Mock()
+        self.resource_class = base.compact_resource_class(
+            endpoint_instances.EndpointInstance)
+
+    def test_compact_resource_class(self):
+        self.assertTrue(
+            issubclass(self.resource_class, base.CompactResource))
+        self.assertEqual("EndpointInstance", self.resource_class.__name__)
+        self.assertIs(
+            self.resource_class,
+            base.compact_resource_class(endpoint_instances.EndpointInstance))
+        self.assertIs(
+            self.resource_class,
+            base.compact_resource_class(self.resource_class))
+
+    def test_attributes(self):
+        info = {"id": "i1", "flavor_name": "small"}
+        res = self.resource_class(self.manager, info, loaded=True)
+
+        self.assertFalse(hasattr(res, '__dict__'))
+        self.assertEqual("i1", res.id)
+        self.assertEqual("small", res.flavor_name)
+        self.assertRaises(AttributeError, getattr, res, "missing")
+        self.assertIs(info, res._info)
+
+    def test_lazy_load(self):
+        self.manager.get.return_value = mock.Mock(_info={"status": "OK"})
+        res = self.resource_class(self.manager, {"id": "i1"})
+
+        self.assertEqual("OK", res.status)
+        self.assertRaises(AttributeError, getattr, res, "missing")
+        self.manager.get.assert_called_once_with("i1")
+
+    def test_private_names_do_not_lazy_load(self):
+        res = self.resource_class(self.manager, {"id": "i1"})
+
+        self.assertRaises(AttributeError, getattr, res, "__deepcopy__")
+        self.manager.get.assert_not_called()
+
+    def test_to_dict(self):
+        res = self.resource_class(self.manager, {"id": "i1"}, loaded=True)
+
+        result = res.to_dict()
+
+        self.assertEqual({"id": "i1"}, dict(result))
+        self.assertRaises(TypeError, operator.setitem, result, "id", "i2")
+
+    def test_eq(self):
+        res = self.resource_class(self.manager, {"id": "i1"}, loaded=True)
+        other = self.resource_class(None, {"id": "i1"}, loaded=True)
+        migration = base.compact_resource_class(migrations.Migration)(
+            None, {"id": "i1"}, loaded=True)
+
+        self.assertEqual(res, other)
+        self.assertNotEqual(res, migration)
+
+    def test_nested_resources(self):
+        migration = base.compact_resource_class(migrations.Migration)(
+            None, {"id": "m1", "tasks": [
+                {"id": "t1", "progress_updates": [{"message": "done"}]}]},
+            loaded=True)
+
+        tasks = migration.tasks
+
+        self.assertEqual(["t1"], [t.id for t in tasks])
+        self.assertFalse(hasattr(tasks[0], '__dict__'))
+        self.assertIsInstance(tasks[0], base.CompactResource)
+        progress_updates = tasks[0].progress_updates
+        self.assertEqual("done", progress_updates[0].message)
+        self.assertFalse(hasattr(progress_updates[0], '__dict__'))
+
+    def test_pickle(self):
+        res = self.resource_class(None, {"id": "i1"}, loaded=True)
+
+        result = pickle.loads(pickle.dumps(res))
+
+        self.assertIs(self.resource_class, type(result))
+        self.assertEqual(res, result)
+
+    def test_manager_compact_resources(self):
+        client = mock.Mock(compact_resources=True)
+
+        manager = endpoint_instances.EndpointInstanceManager(client)
+
+        self.assertIs(self.resource_class, manager.resource_class)
+        self.assertIs(
+            endpoint_instances.EndpointInstance,
+            endpoint_instances.EndpointInstanceManager.resource_class)
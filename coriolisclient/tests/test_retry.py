@@ -0,0 +1,106 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient import exceptions
+from coriolisclient import retry
+from coriolisclient.tests import test_base
+
+
+class ParseRetryAfterTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for parsing Retry-After headers."""
+
+    def test_seconds(self):
+        self.assertEqual(7., retry.parse_retry_after("7"))
+
+    def test_http_date_in_the_past(self):
+        self.assertEqual(
+            0., retry.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"))
+
+    def test_invalid(self):
+        self.assertIsNone(retry.parse_retry_after(None))
+        self.assertIsNone(retry.parse_retry_after("soon"))
+
+
+class RetryPolicyTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the retry policy."""
+
+    def test_is_retryable(self):
+        policy = retry.RetryPolicy()
+
+        self.assertTrue(policy.is_retryable("get", 503))
+        self.assertTrue(policy.is_retryable("DELETE", None))
+        self.assertFalse(policy.is_retryable("POST", 503))
+        self.assertFalse(policy.is_retryable("GET", 500))
+
+    def test_get_delay_decorrelated_jitter(self):
+        policy = retry.RetryPolicy(base_delay=1, max_delay=10)
+
+        delay = None
+        for _ in range(20):
+            previous_delay = delay
+            delay = policy.get_delay(previous_delay)
+            self.assertGreaterEqual(delay, 1)
+            self.assertLessEqual(delay, min(10, max(1, 3 * (
+                previous_delay or 0))))
+
+    def test_get_delay_retry_after(self):
+        policy = retry.RetryPolicy(max_delay=10)
+
+        self.assertEqual(4, policy.get_delay(1, retry_after=4))
+        self.assertEqual(10, policy.get_delay(1, retry_after=60))
+
+    def test_invalid_delays(self):
+        self.assertRaises(
+            ValueError, retry.RetryPolicy, base_delay=2, max_delay=1)
+
+
+class CircuitBreakerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the circuit breaker."""
+
+    def setUp(self):
+        super(CircuitBreakerTestCase, self).setUp()
+        self.metrics = retry.RetryMetrics()
+        self.breaker = retry.CircuitBreaker(
+            "coriolis", failure_threshold=2, reset_timeout=30,
+            metrics=self.metrics)
+
+    def test_opens_after_threshold(self):
+        self.breaker.record_failure()
+        self.breaker.before_request()
+        self.breaker.record_failure()
+
+        self.assertTrue(self.breaker.is_open)
+        self.assertRaises(
+            exceptions.CircuitOpen, self.breaker.before_request)
+        self.assertEqual(1, self.metrics.snapshot()['circuit_opens'])
+        self.assertEqual(1, self.metrics.snapshot()['circuit_rejections'])
+
+    def test_success_resets_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+
+        self.assertFalse(self.breaker.is_open)
+
+    @mock.patch.object(retry.time, 'monotonic')
+    def test_trial_request(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+
+        mock_monotonic.return_value = 131
+        self.breaker.before_request()
+        # NOTE: only a single trial request goes through at once:
+        self.assertRaises(
+            exceptions.CircuitOpen, self.breaker.before_request)
+        self.breaker.record_failure()
+        self.assertRaises(
+            exceptions.CircuitOpen, self.breaker.before_request)
+
+        mock_monotonic.return_value = 162
+        self.breaker.before_request()
+        self.breaker.record_success()
+        self.assertFalse(self.breaker.is_open)
+        self.breaker.before_request()
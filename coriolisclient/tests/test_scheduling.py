@@ -0,0 +1,142 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import asyncio
+import threading
+from unittest import mock
+
+from coriolisclient import constants
+from coriolisclient import exceptions
+from coriolisclient import polling
+from coriolisclient import scheduling
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import replica_executions
+
+
+class _FakeOperations(object):
+    """Operations which finish after being listed as running once."""
+
+    def __init__(self, fail_items=()):
+        self.running = {}
+        self.max_running = 0
+        self.started = []
+        self._fail_items = fail_items
+
+    def start(self, item):
+        if item in self._fail_items:
+            raise exceptions.CoriolisException("failed to start")
+        self.started.append(item)
+        self.running[item] = "RUNNING"
+        self.max_running = max(self.max_running, len(self.running))
+        return self._execution(item, "RUNNING")
+
+    def list(self):
+        executions = [
+            self._execution(item, status)
+            for item, status in self.running.items()]
+        for item, status in list(self.running.items()):
+            if status == "RUNNING":
+                self.running[item] = "COMPLETED"
+            else:
+                del self.running[item]
+        return executions
+
+    @staticmethod
+    def _execution(item, status):
+        return replica_executions.ReplicaExecution(
+            None, {"id": "e-%s" % item, "status": status}, loaded=True)
+
+
+class SlidingWindowSchedulerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis sliding window scheduler."""
+
+    def setUp(self):
+        super(SlidingWindowSchedulerTestCase, self).setUp()
+        self.waiter = polling.Waiter(
+            constants.FINALIZED_EXECUTION_STATUSES, min_interval=0.001,
+            max_interval=0.001)
+
+    def _run(self, operations, items, **kwargs):
+        scheduler = scheduling.SlidingWindowScheduler(
+            operations.start, operations.list, self.waiter, **kwargs)
+        return list(scheduler.run(items))
+
+    def test_run_max_running(self):
+        operations = _FakeOperations()
+
+        result = self._run(operations, range(5), max_running=2)
+
+        self.assertEqual(list(range(5)), sorted(i for i, _ in result))
+        self.assertEqual(2, operations.max_running)
+        self.assertTrue(all(
+            r.result.status == "COMPLETED" for _, r in result))
+
+    def test_run_capacity(self):
+        operations = _FakeOperations()
+        groups = {"a1": "a", "a2": "a", "a3": "a", "b1": "b"}
+
+        result = self._run(
+            operations, ["a1", "a2", "a3", "b1"],
+            get_demands=lambda item: {groups[item]: 1},
+            get_capacity=lambda resource: 1)
+
+        self.assertEqual(4, len(result))
+        # NOTE: "b1" does not wait for the "a" items ahead of it:
+        self.assertEqual(["a1", "b1", "a2", "a3"], operations.started)
+        self.assertEqual(2, operations.max_running)
+
+    def test_run_demand_over_capacity(self):
+        operations = _FakeOperations()
+
+        result = self._run(
+            operations, ["big", "small"],
+            get_demands=lambda item: {"pool": 5 if item == "big" else 1},
+            get_capacity=lambda resource: 2)
+
+        self.assertEqual(2, len(result))
+        self.assertEqual(1, operations.max_running)
+
+    def test_run_start_failure(self):
+        operations = _FakeOperations(fail_items=["bad"])
+
+        result = dict(self._run(operations, ["good", "bad"]))
+
+        self.assertIsInstance(result[1].error, exceptions.CoriolisException)
+        self.assertEqual("COMPLETED", result[0].result.status)
+
+    def test_run_async(self):
+        operations = _FakeOperations(fail_items=[4])
+
+        async def _start(item):
+            return operations.start(item)
+
+        async def _list():
+            return operations.list()
+
+        async def _run():
+            scheduler = scheduling.SlidingWindowScheduler(
+                _start, _list, self.waiter, max_running=2)
+            return [index_result async for index_result in
+                    scheduler.run_async(range(5))]
+
+        result = dict(asyncio.run(_run()))
+
+        self.assertEqual(list(range(5)), sorted(result))
+        self.assertEqual(2, operations.max_running)
+        self.assertIsInstance(result[4].error, exceptions.CoriolisException)
+        self.assertEqual("COMPLETED", result[0].result.status)
+
+    def test_run_canceled(self):
+        cancel_event = threading.Event()
+        cancel_event.set()
+        scheduler = scheduling.SlidingWindowScheduler(
+            _FakeOperations().start, mock.Mock(), self.waiter)
+
+        self.assertRaises(
+            exceptions.WaitCanceled, list,
+            scheduler.run(["a"], cancel_event=cancel_event))
+
+    def test_invalid_max_running(self):
+        self.assertRaises(
+            ValueError, scheduling.SlidingWindowScheduler, mock.Mock(),
+            mock.Mock(), self.waiter, max_running=0)
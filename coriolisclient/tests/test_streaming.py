@@ -0,0 +1,132 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+import json
+from unittest import mock
+
+import ddt
+
+from coriolisclient import base
+from coriolisclient import exceptions
+from coriolisclient import streaming
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import replicas
+
+
+def _chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@ddt.ddt
+class IterJsonArrayTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis streaming JSON decoder."""
+
+    DOCUMENT = {
+        "other": {"nested": [1, 2, {"replicas": "decoy"}]},
+        "replicas": [
+            {"id": "r1", "name": "café \"quoted\" ]}", "size": 12345},
+            {"id": "r2", "tasks": [{"id": "t1"}, {"id": "t2"}]},
+            12345678,
+            None,
+        ],
+        "trailing": True,
+    }
+
+    @ddt.data(1, 3, 7, 64, 100000)
+    def test_iter_json_array(self, chunk_size):
+        data = json.dumps(self.DOCUMENT, indent=2).encode('utf-8')
+
+        result = list(streaming.iter_json_array(
+            _chunked(data, chunk_size), key="replicas"))
+
+        self.assertEqual(self.DOCUMENT["replicas"], result)
+
+    @ddt.data(
+        ('[0.1, 2]', None),
+        ('{"a": 0.1, "migrations": [1]}', "migrations"),
+        ('{"a": -1e5, "b": [2E-3], "migrations": [-0.5e+2, 10, true]}',
+         "migrations"),
+        ('[-12.5e10,1.25E-2 ,0, -0.0]', None),
+    )
+    @ddt.unpack
+    def test_iter_json_array_split_numbers(self, document, key):
+        expected = json.loads(document)
+        if key is not None:
+            expected = expected[key]
+
+        for chunk_size in range(1, len(document) + 1):
+            result = list(streaming.iter_json_array(
+                _chunked(document.encode('utf-8'), chunk_size), key=key))
+
+            self.assertEqual(expected, result, "chunk size %d" % chunk_size)
+
+    def test_iter_json_array_multibyte_split(self):
+        data = json.dumps(
+            {"replicas": [{"name": "éé"}]},
+            ensure_ascii=False).encode('utf-8')
+
+        result = list(streaming.iter_json_array(
+            _chunked(data, 1), key="replicas"))
+
+        self.assertEqual([{"name": "éé"}], result)
+
+    def test_iter_json_array_no_key(self):
+        result = list(streaming.iter_json_array(['[1, ', '2', ']']))
+
+        self.assertEqual([1, 2], result)
+
+    def test_iter_json_array_empty(self):
+        result = list(streaming.iter_json_array(
+            ['{"replicas": [ ]}'], key="replicas"))
+
+        self.assertEqual([], result)
+
+    def test_iter_json_array_missing_key(self):
+        self.assertRaises(
+            KeyError, list,
+            streaming.iter_json_array(['{"a": 1}'], key="replicas"))
+
+    def test_iter_json_array_truncated(self):
+        self.assertRaises(
+            ValueError, list,
+            streaming.iter_json_array(
+                ['{"replicas": [{"id": "r1"}, {"id"'], key="replicas"))
+
+    def test_iter_json_array_lazy(self):
+        def _chunks():
+            yield '{"replicas": [{"id": "r1"}, '
+            raise AssertionError("read too far")
+
+        result = streaming.iter_json_array(_chunks(), key="replicas")
+
+        self.assertEqual({"id": "r1"}, next(result))
+
+
+class ListIterTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis managers' streaming listings."""
+
+    def setUp(self):
+        super(ListIterTestCase, self).setUp()
+        self.client = mock.Mock()
+        self.manager = replicas.ReplicaManager(self.client)
+
+    def test_list_iter(self):
+        resp = self.client.get.return_value
+        resp.encoding = None
+        resp.iter_content.return_value = _chunked(
+            b'{"replicas": [{"id": "r1"}, {"id": "r2"}]}', 5)
+
+        result = list(self.manager.list_iter(detail=True))
+
+        self.assertEqual(["r1", "r2"], [r.id for r in result])
+        self.assertTrue(all(r.is_loaded() for r in result))
+        self.client.get.assert_called_once_with(
+            '/replicas/detail', stream=True)
+        resp.close.assert_called_once_with()
+
+    def test_list_iter_unauthorized(self):
+        self.client.get.side_effect = (
+            base.keystoneauth_exceptions.http.Unauthorized())
+
+        self.assertRaises(
+            exceptions.HTTPAuthError, list, self.manager.list_iter())
@@ -0,0 +1,56 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import endpoint_instances
+
+
+class EndpointInstanceManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Endpoint Instance Manager."""
+
+    def setUp(self):
+        super(EndpointInstanceManagerTestCase, self).setUp()
+        self.manager = endpoint_instances.EndpointInstanceManager(
+            mock.Mock())
+
+    def _instance(self, instance_id):
+        return endpoint_instances.EndpointInstance(
+            self.manager, {"id": instance_id}, loaded=True)
+
+    @mock.patch.object(endpoint_instances.EndpointInstanceManager, 'list')
+    def test_list_iter(self, mock_list):
+        pages = {
+            None: [self._instance("i1"), self._instance("i2")],
+            "i2": [self._instance("i3"), self._instance("i4")],
+            "i4": [self._instance("i5")]}
+        mock_list.side_effect = (
+            lambda endpoint, env, marker, limit, name: pages[marker])
+
+        result = list(self.manager.list_iter(
+            mock.sentinel.endpoint, env=mock.sentinel.env, limit=2,
+            name=mock.sentinel.name))
+
+        self.assertEqual(
+            ["i1", "i2", "i3", "i4", "i5"], [i.id for i in result])
+        mock_list.assert_has_calls([
+            mock.call(mock.sentinel.endpoint, mock.sentinel.env, marker, 2,
+                      mock.sentinel.name)
+            for marker in (None, "i2", "i4")])
+
+    @mock.patch.object(endpoint_instances.EndpointInstanceManager, 'list')
+    def test_list_iter_empty_last_page(self, mock_list):
+        mock_list.side_effect = [
+            [self._instance("i1"), self._instance("i2")], []]
+
+        result = list(self.manager.list_iter(
+            mock.sentinel.endpoint, marker="i0", limit=2))
+
+        self.assertEqual(["i1", "i2"], [i.id for i in result])
+        self.assertEqual(2, mock_list.call_count)
+
+    def test_list_iter_invalid_limit(self):
+        self.assertRaises(
+            ValueError, list,
+            self.manager.list_iter(mock.sentinel.endpoint, limit=0))
@@ -0,0 +1,77 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient import exceptions
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import endpoints
+
+
+class EndpointManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Endpoint Manager."""
+
+    def setUp(self):
+        super(EndpointManagerTestCase, self).setUp()
+        patcher = mock.patch.object(endpoints.EndpointManager, 'list')
+        self.mock_list = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = endpoints.EndpointManager(mock.Mock())
+        self.mock_list.return_value = [
+            self._endpoint("e1", "src"), self._endpoint("e2", "dst"),
+            self._endpoint("e3", "dup"), self._endpoint("e4", "dup")]
+
+    def _endpoint(self, endpoint_id, name):
+        return endpoints.Endpoint(
+            self.manager, {"id": endpoint_id, "name": name}, loaded=True)
+
+    def test_get_endpoint_id_for_name(self):
+        self.assertEqual(
+            "e1", self.manager.get_endpoint_id_for_name("src"))
+        self.assertEqual(
+            "e2", self.manager.get_endpoint_id_for_name("dst"))
+        self.mock_list.assert_called_once_with()
+
+    def test_get_endpoint_id_for_name_uuid(self):
+        endpoint_id = "9e3b9e0e-8a3c-4f3d-bb1f-4e0c5b4d4e11"
+
+        self.assertEqual(
+            endpoint_id, self.manager.get_endpoint_id_for_name(endpoint_id))
+        self.mock_list.assert_not_called()
+
+    def test_get_endpoint_id_for_name_errors(self):
+        self.assertRaises(
+            exceptions.NoUniqueEndpointNameMatch,
+            self.manager.get_endpoint_id_for_name, "dup")
+        self.assertRaises(
+            exceptions.EndpointIDNotFound,
+            self.manager.get_endpoint_id_for_name, "missing")
+
+    @mock.patch.object(endpoints.EndpointManager, '_post')
+    def test_create_invalidates_index(self, mock_post):
+        self.manager.get_endpoint_id_for_name("src")
+
+        self.manager.create("new", "openstack", {}, "", [])
+        self.manager.get_endpoint_id_for_name("src")
+
+        self.assertEqual(2, self.mock_list.call_count)
+
+    @mock.patch.object(endpoints.EndpointManager, '_post')
+    def test_create_failure_keeps_index(self, mock_post):
+        mock_post.side_effect = exceptions.CoriolisException()
+        self.manager.get_endpoint_id_for_name("src")
+
+        self.assertRaises(
+            exceptions.CoriolisException, self.manager.create,
+            "new", "openstack", {}, "", [])
+        self.manager.get_endpoint_id_for_name("src")
+
+        self.mock_list.assert_called_once_with()
+
+    def test_get_endpoint_id_for_name_new(self):
+        self.manager.get_endpoint_id_for_name("src")
+        self.mock_list.return_value = [self._endpoint("e5", "new")]
+
+        self.assertEqual(
+            "e5", self.manager.get_endpoint_id_for_name("new"))
+        self.assertEqual(2, self.mock_list.call_count)
@@ -0,0 +1,105 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+import requests
+
+from coriolisclient import exceptions
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import licensing
+
+
+class LicensingClientTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Licensing Client."""
+
+    def setUp(self):
+        super(LicensingClientTestCase, self).setUp()
+        self.cli = mock.Mock()
+        self.cli.get_endpoint.return_value = "http://licensing/"
+        self.licensing_cli = licensing.LicensingClient(
+            self.cli, pool_size=4, timeout=5)
+        self.session = mock.Mock()
+        self.licensing_cli._session = self.session
+
+    def test_get_session(self):
+        self.licensing_cli._session = None
+
+        session = self.licensing_cli._get_session()
+
+        self.assertIs(session, self.licensing_cli._get_session())
+        adapter = session.get_adapter("https://licensing")
+        self.assertEqual(4, adapter._pool_maxsize)
+
+    def test_do_req_reuses_session_and_endpoint(self):
+        self.session.request.return_value.json.return_value = {
+            "status": {"ok": True}}
+
+        for _ in range(3):
+            result = self.licensing_cli.get(
+                "/status", response_key="status")
+
+        self.assertEqual({"ok": True}, result)
+        self.cli.get_endpoint.assert_called_once_with(
+            service_type="coriolis-licensing")
+        self.session.request.assert_called_with(
+            "GET", "http://licensing/status", timeout=5)
+        self.assertEqual(3, self.session.request.call_count)
+
+    def test_do_req_body(self):
+        self.licensing_cli.post(
+            "/appliances", body={"a": 1}, raw_response=True)
+
+        self.session.request.assert_called_once_with(
+            "POST", "http://licensing/appliances", data='{"a": 1}',
+            timeout=5)
+
+    def test_do_req_rate_limited(self):
+        self.licensing_cli._rate_limiter = mock.Mock()
+
+        self.licensing_cli.delete("/appliances/a1", raw_response=True)
+
+        self.licensing_cli._rate_limiter.acquire.assert_called_once_with(
+            "DELETE", "/appliances/a1")
+
+    def test_do_req_recorded(self):
+        self.licensing_cli._instrumentation = mock.Mock()
+        self.session.request.side_effect = requests.exceptions.ReadTimeout
+
+        self.assertRaises(
+            requests.exceptions.ReadTimeout,
+            self.licensing_cli.get, "/appliances/a1")
+
+        self.licensing_cli._instrumentation.record.assert_called_once_with(
+            "licensing", "GET", "/appliances/a1", mock.ANY, mock.ANY,
+            resp=None, error=mock.ANY)
+
+    def test_do_req_invalid_method(self):
+        self.assertRaises(
+            ValueError, self.licensing_cli._do_req, "FETCH", "/status")
+
+    def test_do_req_connection_error_resets_endpoint(self):
+        self.session.request.side_effect = (
+            requests.exceptions.ConnectionError)
+
+        self.assertRaises(
+            requests.exceptions.ConnectionError,
+            self.licensing_cli.get, "/status")
+        self.assertRaises(
+            requests.exceptions.ConnectionError,
+            self.licensing_cli.get, "/status")
+
+        self.assertEqual(2, self.cli.get_endpoint.call_count)
+
+    def test_get_licensing_endpoint_url_not_found(self):
+        self.cli.get_endpoint.side_effect = Exception
+
+        self.assertRaises(
+            exceptions.LicensingEndpointNotFound,
+            self.licensing_cli._get_licensing_endpoint_url)
+
+    def test_close(self):
+        self.licensing_cli.close()
+
+        self.session.close.assert_called_once_with()
+        self.assertIsNone(self.licensing_cli._session)
@@ -0,0 +1,47 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+import requests
+
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import logging as coriolis_logging
+
+
+class LoggingClientTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Logging Client."""
+
+    def setUp(self):
+        super(LoggingClientTestCase, self).setUp()
+        self.cli = mock.Mock()
+        self.cli.get_endpoint.return_value = "http://logger/"
+        self.instrumentation = mock.Mock()
+        self.logging_cli = coriolis_logging.LoggingClient(
+            self.cli, instrumentation=self.instrumentation)
+
+    @mock.patch.object(requests, 'get')
+    def test_list_logs_recorded(self, mock_get):
+        mock_get.return_value.json.return_value = {"logs": ["a"]}
+
+        result = self.logging_cli.list_logs()
+
+        self.assertEqual(["a"], result)
+        self.instrumentation.record.assert_called_once_with(
+            "logging", "GET", "/logs/", mock.ANY, mock.ANY,
+            resp=mock_get.return_value, error=None, response_bytes=None)
+
+    @mock.patch.object(requests, 'get')
+    def test_download_logs_recorded(self, mock_get):
+        resp = mock_get.return_value.__enter__.return_value
+        resp.iter_content.return_value = [b"abc", b"", b"de"]
+        mock_open = mock.mock_open()
+
+        with mock.patch('builtins.open', mock_open):
+            self.logging_cli.download_logs("worker", "/tmp/worker.log")
+
+        mock_open.return_value.write.assert_has_calls(
+            [mock.call(b"abc"), mock.call(b"de")])
+        self.instrumentation.record.assert_called_once_with(
+            "logging", "GET", "/logs/{app}/", mock.ANY, mock.ANY, resp=resp,
+            error=None, response_bytes=5)
@@ -0,0 +1,85 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient import scheduling
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import migrations
+from coriolisclient.v1 import replicas
+
+
+class MigrationManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Migration Manager."""
+
+    def setUp(self):
+        super(MigrationManagerTestCase, self).setUp()
+        self.client = mock.Mock(response_cache=None)
+        self.manager = migrations.MigrationManager(self.client)
+
+    def _mock_listings(self, listings):
+        def _get(url, **kwargs):
+            response = mock.Mock()
+            response.json.return_value = listings[url]
+            return response
+        self.client.get.side_effect = _get
+
+    @mock.patch.object(scheduling, 'SlidingWindowScheduler')
+    def test_deploy_many(self, mock_scheduler_class):
+        replica = replicas.Replica(None, {
+            "id": "r1", "instances": ["vm1", "vm2", "vm3"],
+            "instance_osmorphing_minion_pool_mappings": {
+                "vm1": "p1", "vm2": "p1"}}, loaded=True)
+        self._mock_listings({
+            "/replicas": {"replicas": [
+                {"id": "r2", "instances": ["vm4"],
+                 "instance_osmorphing_minion_pool_mappings": {
+                     "vm4": "p1"}}]},
+            "/minion_pools": {"minion_pools": [
+                {"id": "p1", "maximum_minions": 4},
+                {"id": "p2", "maximum_minions": 1}]}})
+        mock_scheduler = mock_scheduler_class.return_value
+        mock_scheduler.run.return_value = iter(
+            [(1, mock.sentinel.result1), (0, mock.sentinel.result0)])
+
+        result = list(self.manager.deploy_many(
+            [replica, "r2"], max_running=5,
+            instance_osmorphing_minion_pool_mappings={"vm3": "p2"}))
+
+        self.assertEqual(
+            [mock.sentinel.result1, mock.sentinel.result0], result)
+        mock_scheduler.run.assert_called_once_with(
+            [replica, "r2"], cancel_event=None)
+        (start_func, list_func, waiter), kwargs = (
+            mock_scheduler_class.call_args)
+        self.assertEqual(self.manager.list, list_func)
+        self.assertEqual(5, kwargs['max_running'])
+        get_demands = kwargs['get_demands']
+        get_capacity = kwargs['get_capacity']
+        self.assertEqual({"p1": 2, "p2": 1}, get_demands(replica))
+        self.assertEqual({"p1": 1}, get_demands("r2"))
+        self.assertEqual(4, get_capacity("p1"))
+        self.assertEqual(1, get_capacity("p2"))
+
+        with mock.patch.object(
+                self.manager, 'create_from_replica') as mock_create:
+            start_func(replica)
+        mock_create.assert_called_once_with(
+            "r1", clone_disks=True, force=False, skip_os_morphing=False,
+            user_scripts=None,
+            instance_osmorphing_minion_pool_mappings={"vm3": "p2"})
+
+    @mock.patch.object(scheduling, 'SlidingWindowScheduler')
+    def test_deploy_many_skip_os_morphing(self, mock_scheduler_class):
+        self._mock_listings({
+            "/replicas": {"replicas": [
+                {"id": "r1", "instances": ["vm1"],
+                 "instance_osmorphing_minion_pool_mappings": {
+                     "vm1": "p1"}}]},
+            "/minion_pools": {"minion_pools": []}})
+        mock_scheduler_class.return_value.run.return_value = iter([])
+
+        list(self.manager.deploy_many(["r1"], skip_os_morphing=True))
+
+        get_demands = mock_scheduler_class.call_args[1]['get_demands']
+        self.assertEqual({}, get_demands("r1"))
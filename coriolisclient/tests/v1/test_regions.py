@@ -0,0 +1,78 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import regions
+
+
+class RegionManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Region Manager."""
+
+    def setUp(self):
+        super(RegionManagerTestCase, self).setUp()
+        patcher = mock.patch.object(regions.RegionManager, 'list')
+        self.mock_list = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = regions.RegionManager(mock.Mock())
+        self.regions = [
+            self._region("r1", "east"), self._region("r2", "west"),
+            self._region("r3", "dup"), self._region("r4", "dup"),
+            self._region("r5", "r1")]
+        self.mock_list.return_value = self.regions
+
+    def _region(self, region_id, name):
+        return regions.Region(
+            self.manager, {"id": region_id, "name": name}, loaded=True)
+
+    def test_get_region_by_name_or_id(self):
+        self.assertIs(
+            self.regions[0], self.manager.get_region_by_name_or_id("r1"))
+        self.assertIs(
+            self.regions[1], self.manager.get_region_by_name_or_id("west"))
+        self.mock_list.assert_called_once_with()
+
+    def test_get_region_by_name_or_id_cache(self):
+        result = self.manager.get_region_by_name_or_id(
+            "east", regions_cache=self.regions[:1])
+
+        self.assertIs(self.regions[0], result)
+        self.mock_list.assert_not_called()
+
+    def test_get_region_by_name_or_id_errors(self):
+        self.assertRaisesRegex(
+            ValueError, "multiple matches on name",
+            self.manager.get_region_by_name_or_id, "dup")
+        self.assertRaisesRegex(
+            ValueError, "Could not find region",
+            self.manager.get_region_by_name_or_id, "missing")
+        self.assertIsNone(self.manager.get_region_by_name_or_id(
+            "missing", raise_on_not_found=False))
+
+    @mock.patch.object(regions.RegionManager, '_delete')
+    def test_delete_invalidates_index(self, mock_delete):
+        self.manager.get_region_by_name_or_id("r1")
+
+        self.manager.delete("r1")
+        self.manager.get_region_by_name_or_id("r1")
+
+        self.assertEqual(2, self.mock_list.call_count)
+
+    @mock.patch.object(regions.RegionManager, '_delete')
+    def test_delete_failure_keeps_index(self, mock_delete):
+        mock_delete.side_effect = ValueError()
+        self.manager.get_region_by_name_or_id("r1")
+
+        self.assertRaises(ValueError, self.manager.delete, "r1")
+        self.manager.get_region_by_name_or_id("r1")
+
+        self.mock_list.assert_called_once_with()
+
+    def test_get_region_by_name_or_id_new(self):
+        self.manager.get_region_by_name_or_id("r1")
+        self.mock_list.return_value = [self._region("r6", "north")]
+
+        self.assertEqual(
+            "r6", self.manager.get_region_by_name_or_id("north").id)
+        self.assertEqual(2, self.mock_list.call_count)
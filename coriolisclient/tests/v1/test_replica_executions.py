@@ -0,0 +1,62 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient import scheduling
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import replica_executions
+from coriolisclient.v1 import replicas
+
+
+class ReplicaExecutionManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Replica Execution Manager."""
+
+    def setUp(self):
+        super(ReplicaExecutionManagerTestCase, self).setUp()
+        self.client = mock.Mock(response_cache=None)
+        self.manager = replica_executions.ReplicaExecutionManager(
+            self.client)
+
+    @mock.patch.object(scheduling, 'SlidingWindowScheduler')
+    def test_execute_many(self, mock_scheduler_class):
+        replica = replicas.Replica(None, {
+            "id": "r1", "origin_endpoint_id": "src",
+            "destination_endpoint_id": "dst",
+            "origin_minion_pool_id": "p1"}, loaded=True)
+        self.client.get.return_value.json.return_value = {"replicas": [
+            {"id": "r2", "origin_endpoint_id": "src",
+             "destination_endpoint_id": "dst"}]}
+        mock_scheduler = mock_scheduler_class.return_value
+        mock_scheduler.run.return_value = iter(
+            [(1, mock.sentinel.result1), (0, mock.sentinel.result0)])
+
+        result = list(self.manager.execute_many(
+            [replica, "r2"], max_running=5, max_per_origin_endpoint=2,
+            max_per_minion_pool=1, shutdown_instances=True))
+
+        self.assertEqual(
+            [mock.sentinel.result1, mock.sentinel.result0], result)
+        self.client.get.assert_called_once_with('/replicas')
+        mock_scheduler.run.assert_called_once_with(
+            [replica, "r2"], cancel_event=None)
+        (start_func, list_func, waiter), kwargs = (
+            mock_scheduler_class.call_args)
+        self.assertEqual(self.manager.list_all, list_func)
+        self.assertEqual(5, kwargs['max_running'])
+        get_demands = kwargs['get_demands']
+        get_capacity = kwargs['get_capacity']
+        self.assertEqual({
+            ('origin_endpoint', 'src'): 1,
+            ('destination_endpoint', 'dst'): 1,
+            ('minion_pool', 'p1'): 1}, get_demands(replica))
+        self.assertEqual({
+            ('origin_endpoint', 'src'): 1,
+            ('destination_endpoint', 'dst'): 1}, get_demands("r2"))
+        self.assertEqual(2, get_capacity(('origin_endpoint', 'src')))
+        self.assertIsNone(get_capacity(('destination_endpoint', 'dst')))
+        self.assertEqual(1, get_capacity(('minion_pool', 'p1')))
+
+        with mock.patch.object(self.manager, 'create') as mock_create:
+            start_func("r2")
+        mock_create.assert_called_once_with("r2", True)
@@ -0,0 +1,48 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient import exceptions
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import endpoints
+from coriolisclient.v1 import replicas
+
+
+class ReplicaManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Replica Manager."""
+
+    def setUp(self):
+        super(ReplicaManagerTestCase, self).setUp()
+        self.manager = replicas.ReplicaManager(mock.Mock())
+
+    @mock.patch.object(replicas.ReplicaManager, 'create')
+    @mock.patch.object(endpoints.EndpointManager, 'get_endpoint_id_for_name')
+    def test_create_many(self, mock_get_endpoint_id, mock_create):
+        endpoint_ids = {"src": "e1", "dst": "e2"}
+
+        def _get_endpoint_id(name):
+            if name not in endpoint_ids:
+                raise exceptions.EndpointIDNotFound(name)
+            return endpoint_ids[name]
+        mock_get_endpoint_id.side_effect = _get_endpoint_id
+        rows = [
+            {"origin_endpoint_id": "src", "destination_endpoint_id": "dst",
+             "instances": ["vm%d" % i]} for i in range(3)]
+        rows.append({
+            "origin_endpoint_id": "missing",
+            "destination_endpoint_id": "dst", "instances": ["vm3"]})
+
+        result = self.manager.create_many(
+            rows, max_workers=2, requests_per_second=1000)
+
+        self.assertEqual(
+            [mock_create.return_value] * 3, [r.result for r in result[:3]])
+        self.assertIsInstance(
+            result[3].error, exceptions.EndpointIDNotFound)
+        self.assertEqual(3, mock_get_endpoint_id.call_count)
+        mock_create.assert_any_call(
+            origin_endpoint_id="e1", destination_endpoint_id="e2",
+            instances=["vm0"])
+        self.assertEqual(3, mock_create.call_count)
+        self.assertEqual("src", rows[0]["origin_endpoint_id"])
@@ -0,0 +1,74 @@
+# Copyright 2024 Cloudbase Solutions Srl
+# All Rights Reserved.
+
+from unittest import mock
+
+from coriolisclient.tests import test_base
+from coriolisclient.v1 import services
+
+
+class ServiceManagerTestCase(test_base.CoriolisBaseTestCase):
+    """Test suite for the Coriolis Service Manager."""
+
+    def setUp(self):
+        super(ServiceManagerTestCase, self).setUp()
+        patcher = mock.patch.object(services.ServiceManager, 'list')
+        self.mock_list = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.manager = services.ServiceManager(mock.Mock())
+        self.services = [
+            self._service("s1", "host1", "worker"),
+            self._service("s2", "host1", "scheduler"),
+            self._service("s3", "host2", "worker"),
+            self._service("s4", "host2", "worker")]
+        self.mock_list.return_value = self.services
+
+    def _service(self, service_id, host, topic):
+        return services.Service(
+            self.manager, {"id": service_id, "host": host, "topic": topic},
+            loaded=True)
+
+    def test_find_service_by_host_and_topic(self):
+        self.assertIs(
+            self.services[0],
+            self.manager.find_service_by_host_and_topic("host1", "worker"))
+        self.assertIs(
+            self.services[1],
+            self.manager.find_service_by_host_and_topic(
+                "host1", "scheduler"))
+        self.mock_list.assert_called_once_with()
+
+    def test_find_service_by_host_and_topic_errors(self):
+        self.assertRaisesRegex(
+            ValueError, "Multiple services",
+            self.manager.find_service_by_host_and_topic, "host2", "worker")
+        self.assertRaisesRegex(
+            ValueError, "No Service",
+            self.manager.find_service_by_host_and_topic, "host3", "worker")
+
+    def test_find_service_by_host_and_topic_new(self):
+        self.manager.find_service_by_host_and_topic("host1", "worker")
+        self.mock_list.return_value = [
+            self._service("s5", "host3", "worker")]
+
+        self.assertEqual(
+            "s5",
+            self.manager.find_service_by_host_and_topic(
+                "host3", "worker").id)
+        self.assertEqual(2, self.mock_list.call_count)
+
+    @mock.patch.object(services.ServiceManager, '_post')
+    def test_create_invalidates_index_after_request(self, mock_post):
+        self.manager.find_service_by_host_and_topic("host1", "worker")
+
+        def _post(*args, **kwargs):
+            self.manager.find_service_by_host_and_topic("host1", "worker")
+            return mock.sentinel.service
+        mock_post.side_effect = _post
+
+        self.assertEqual(
+            mock.sentinel.service,
+            self.manager.create("host5", "binary", "worker", []))
+        self.manager.find_service_by_host_and_topic("host1", "worker")
+
+        self.assertEqual(2, self.mock_list.call_count)
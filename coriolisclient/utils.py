@@ -0,0 +1,37 @@
+# Copyright (c) 2024 Cloudbase Solutions Srl
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Helpers shared by the API client and the command-line interface.
+"""
+
+import uuid
+
+
+def validate_uuid_string(uuid_obj, uuid_version=4):
+    """ Checks whether the provided string is a valid UUID string
+
+        :param uuid_obj: A string or stringable object containing the UUID
+        :param uuid_version: The UUID version to be used
+    """
+    uuid_string = str(uuid_obj).lower()
+    try:
+        uuid.UUID(uuid_string, version=uuid_version)
+    except ValueError:
+        # If it's a value error, then the string
+        # is not a valid hex code for a UUID.
+        return False
+
+    return True
@@ -29,7 +29,7 @@ class Task(base.Resource):
     def progress_updates(self):
         if not self._loaded or self._info.get('progress_updates') is None:
             self.get()
-        return [ProgressUpdate(None, d, loaded=True) for d in
+        return [self._nested_resource(ProgressUpdate, d) for d in
                 self._info.get('progress_updates', [])]
 
 
@@ -22,6 +22,8 @@ class Diagnostics(base.Resource):
 
 class DiagnosticsManager(base.BaseManager):
     resource_class = Diagnostics
+    # NOTE: get() lists the diagnostics of all the services:
+    _get_bulk_item = None
 
     def __init__(self, api):
         super(DiagnosticsManager, self).__init__(api)
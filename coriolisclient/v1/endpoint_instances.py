@@ -13,11 +13,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent import futures
+
 from six.moves.urllib import parse as urlparse
 
 from coriolisclient import base
 from coriolisclient.v1 import common
 
+DEFAULT_PAGE_SIZE = 100
+
 
 class EndpointInstance(base.Resource):
     @property
@@ -53,6 +57,34 @@ class EndpointInstanceManager(base.BaseManager):
 
         return self._list(url, 'instances')
 
+    def list_iter(
+            self, endpoint, env=None, marker=None,
+            limit=DEFAULT_PAGE_SIZE, name=None):
+        """Yields all the instances of the endpoint, page by page.
+
+        Pages of `limit` instances are requested by following the marker of
+        the last instance of the previous page. The next page is fetched in
+        the background while the current one is being consumed, so at most
+        two pages are held in memory at any time.
+        """
+        if not limit or limit < 1:
+            raise ValueError("'limit' must be a positive page size")
+
+        executor = futures.ThreadPoolExecutor(max_workers=1)
+        try:
+            next_page = executor.submit(
+                self.list, endpoint, env, marker, limit, name)
+            while next_page is not None:
+                page = next_page.result()
+                next_page = None
+                if len(page) >= limit:
+                    next_page = executor.submit(
+                        self.list, endpoint, env, page[-1].id, limit, name)
+                for instance in page:
+                    yield instance
+        finally:
+            executor.shutdown(wait=False)
+
     def get(self, endpoint, instance_id, env=None):
         encoded_instance = common.encode_base64_param(instance_id)
         url = '/endpoints/%s/instances/%s' % (
@@ -66,3 +98,8 @@ class EndpointInstanceManager(base.BaseManager):
             url = "%s?env=%s" % (url, encoded_env)
 
         return self._get(url, 'instance')
+
+    def _get_bulk_item(self, item):
+        # NOTE: items of `get_many()` are (endpoint, instance_id) pairs:
+        endpoint, instance_id = item
+        return self.get(endpoint, instance_id)
@@ -14,8 +14,9 @@
 # limitations under the License.
 
 from coriolisclient import base
-from coriolisclient.cli import utils
+from coriolisclient import cache
 from coriolisclient import exceptions
+from coriolisclient import utils
 
 
 class ConnectionInfo(base.Resource):
@@ -25,8 +26,8 @@ class ConnectionInfo(base.Resource):
 class Endpoint(base.Resource):
     @property
     def connection_info(self):
-        return ConnectionInfo(
-            None, self._info.get("connection_info"), loaded=True)
+        return self._nested_resource(
+            ConnectionInfo, self._info.get("connection_info"))
 
 
 class EndpointManager(base.BaseManager):
@@ -34,6 +35,9 @@ class EndpointManager(base.BaseManager):
 
     def __init__(self, api):
         super(EndpointManager, self).__init__(api)
+        self._name_index = cache.ListingIndex(
+            self.list,
+            {'name': lambda endpoint: getattr(endpoint, 'name', None)})
 
     def list(self):
         return self._list('/endpoints', 'endpoints')
@@ -52,17 +56,23 @@ class EndpointManager(base.BaseManager):
                 "connection_info": connection_info,
                 "mapped_regions": regions}}
 
-        return self._post('/endpoints', data, 'endpoint')
+        endpoint = self._post('/endpoints', data, 'endpoint')
+        self._name_index.invalidate()
+        return endpoint
 
     def update(self, endpoint, updated_values):
         data = {
             "endpoint": updated_values
         }
-        return self._put(
+        endpoint = self._put(
             '/endpoints/%s' % base.getid(endpoint), data, 'endpoint')
+        self._name_index.invalidate()
+        return endpoint
 
     def delete(self, endpoint):
-        return self._delete('/endpoints/%s' % base.getid(endpoint))
+        resp = self._delete('/endpoints/%s' % base.getid(endpoint))
+        self._name_index.invalidate()
+        return resp
 
     def validate_connection(self, endpoint):
         data = self.client.post(
@@ -79,7 +89,13 @@ class EndpointManager(base.BaseManager):
             return self._get_endpoint_id_for_name(endpoint)
 
     def _get_endpoint_id_for_name(self, endpoint_name):
-        obj_list = self.list()
+        # NOTE: the listing is indexed and reused for a few seconds, so
+        # that resolving many names only lists the endpoints once:
+        return self._match_endpoint_id_for_name(
+            self._name_index.lookup('name', endpoint_name), endpoint_name)
+
+    @staticmethod
+    def _match_endpoint_id_for_name(obj_list, endpoint_name):
         id_matches = [n.id for n in obj_list if n.name == endpoint_name]
         matches = len(id_matches)
         if matches == 1:
@@ -15,14 +15,18 @@
 
 import json
 import logging
+import time
 
 import requests
 
 from coriolisclient import base
 from coriolisclient import exceptions
+from coriolisclient import instrumentation
 
 LOG = logging.getLogger(__name__)
 _LICENSING_ENDPOINT_NAME = "coriolis-licensing"
+_DEFAULT_POOL_SIZE = 10
+_HTTP_METHODS = ('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD')
 
 
 class Licence(base.Resource):
@@ -30,14 +34,38 @@ class Licence(base.Resource):
 
 
 class LicensingClient(object):
-
-    def __init__(self, client, endpoint_name_override=None):
+    """HTTP client for the Coriolis licensing server.
+
+    All requests go through one keep-alive `requests.Session`, and the
+    licensing endpoint is looked up in the service catalog only once.
+
+    :param pool_size: maximum number of connections kept alive
+    :param timeout: timeout in seconds passed to every request, either as
+        a single value or as a (connect, read) tuple
+    :param rate_limiter: optional `ratelimit.RateLimiter` every request
+        goes through
+    :param instrumentation: optional `instrumentation.Instrumentation`
+        recording every request
+    """
+
+    def __init__(self, client, endpoint_name_override=None,
+                 pool_size=_DEFAULT_POOL_SIZE, timeout=None,
+                 rate_limiter=None, instrumentation=None):
         self._cli = client
         self._endpoint_name = _LICENSING_ENDPOINT_NAME
         if endpoint_name_override:
             self._endpoint_name = endpoint_name_override
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._rate_limiter = rate_limiter
+        self._instrumentation = instrumentation
+        self._endpoint_url = None
+        self._session = None
 
     def _get_licensing_endpoint_url(self):
+        if self._endpoint_url is not None:
+            return self._endpoint_url
+
         endpoint_url = None
         try:
             endpoint_url = self._cli.get_endpoint(
@@ -45,12 +73,37 @@ class LicensingClient(object):
         except Exception as ex:
             LOG.warning("Unable to determine licensing endpoint: %s", str(ex))
             raise exceptions.LicensingEndpointNotFound(self._endpoint_name)
-        return endpoint_url.rstrip('/')
+        self._endpoint_url = endpoint_url.rstrip('/')
+        return self._endpoint_url
+
+    def _get_session(self):
+        if self._session is None:
+            session = requests.Session()
+            http_adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self._pool_size,
+                pool_maxsize=self._pool_size)
+            session.mount('http://', http_adapter)
+            session.mount('https://', http_adapter)
+            self._session = session
+        return self._session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _record(self, method_name, resource, started_at, start, resp=None,
+                error=None):
+        if self._instrumentation is not None:
+            self._instrumentation.record(
+                instrumentation.SERVICE_LICENSING, method_name, resource,
+                started_at, time.perf_counter() - start, resp=resp,
+                error=error)
 
     def _do_req(self, method_name, resource, body=None, response_key=None,
                 raw_response=False):
-        method = getattr(requests, method_name.lower(), None)
-        if not method:
+        method_name = method_name.upper()
+        if method_name not in _HTTP_METHODS:
             raise ValueError("No such HTTP method '%s'" % method_name)
 
         endpoint_url = self._get_licensing_endpoint_url()
@@ -61,8 +114,26 @@ class LicensingClient(object):
             if not isinstance(body, (str, bytes)):
                 body = json.dumps(body)
             kwargs["data"] = body
-
-        resp = method(url, **kwargs)
+        if self._timeout is not None:
+            kwargs["timeout"] = self._timeout
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(method_name, resource)
+        started_at = time.time()
+        start = time.perf_counter()
+        resp = None
+        try:
+            resp = self._get_session().request(method_name, url, **kwargs)
+        except requests.exceptions.ConnectionError as ex:
+            # NOTE: the endpoint may have moved, so look it up again
+            # on the next request:
+            self._endpoint_url = None
+            self._record(method_name, resource, started_at, start, error=ex)
+            raise
+        except requests.exceptions.RequestException as ex:
+            self._record(method_name, resource, started_at, start, error=ex)
+            raise
+        self._record(method_name, resource, started_at, start, resp=resp)
 
         if not resp.ok:
             # try to extract error from licensing server:
@@ -114,9 +185,9 @@ class LicensingClient(object):
 class LicensingManager(base.BaseManager):
     resource_class = Licence
 
-    def __init__(self, api):
+    def __init__(self, api, licensing_client=None):
         super(LicensingManager, self).__init__(api)
-        self._licensing_cli = LicensingClient(api)
+        self._licensing_cli = licensing_client or LicensingClient(api)
 
     def status(self, appliance_id):
         url = '/appliances/%s/status' % appliance_id
@@ -24,9 +24,10 @@ class Appliance(base.Resource):
 class LicensingAppliancesManager(base.BaseManager):
     resource_class = Appliance
 
-    def __init__(self, api):
+    def __init__(self, api, licensing_client=None):
         super().__init__(api)
-        self._licensing_cli = licensing.LicensingClient(api)
+        self._licensing_cli = (
+            licensing_client or licensing.LicensingClient(api))
 
     def list(self):
         url = '/appliances'
@@ -24,9 +24,10 @@ class Reservation(base.Resource):
 class LicensingReservationsManager(base.BaseManager):
     resource_class = Reservation
 
-    def __init__(self, api):
+    def __init__(self, api, licensing_client=None):
         super().__init__(api)
-        self._licensing_cli = licensing.LicensingClient(api)
+        self._licensing_cli = (
+            licensing_client or licensing.LicensingClient(api))
 
     def list(self, appliance_id):
         url = '/appliances/%s/reservations' % appliance_id
@@ -13,14 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import datetime
 import json
 import logging
+import time
 import traceback
 
 import requests
-import websockets
 
 from keystoneauth1.exceptions import catalog
 from keystoneauth1.exceptions import http
@@ -28,6 +27,7 @@ from six.moves.urllib import parse as urlparse
 
 from coriolisclient import base
 from coriolisclient import exceptions
+from coriolisclient import instrumentation
 
 
 LOG = logging.getLogger(__name__)
@@ -36,15 +36,14 @@ _LOGGING_ENDPOINT_NAME = "coriolis-logger"
 
 class LoggingClient(object):
 
-    def __init__(self, client, endpoint_name_override=None):
+    def __init__(self, client, endpoint_name_override=None,
+                 instrumentation=None):
         self._cli = client
+        self._instrumentation = instrumentation
         self._ep_name = endpoint_name_override or _LOGGING_ENDPOINT_NAME
+        # NOTE: the endpoint gets looked up on first use, see
+        # `_construct_url`:
         self._ep_url = None
-        try:
-            self._ep_url = self._get_endpoint_url(self._ep_name)
-        except Exception as ex:
-            LOG.warning(
-                "Unable to determine logging endpoint: %s", str(ex))
 
     @property
     def _token(self):
@@ -93,6 +92,14 @@ class LoggingClient(object):
             url = newURL.geturl()
         return url
 
+    def _record(self, method, resource, started_at, start, resp=None,
+                error=None, response_bytes=None):
+        if self._instrumentation is not None:
+            self._instrumentation.record(
+                instrumentation.SERVICE_LOGGING, method, resource,
+                started_at, time.perf_counter() - start, resp=resp,
+                error=error, response_bytes=response_bytes)
+
     def stream_logs(self, app_name=None, severity=None):
         headers = self._auth_headers
         args = {
@@ -101,6 +108,10 @@ class LoggingClient(object):
         }
         url = self._construct_url("ws", args, is_websocket=True)
 
+        # NOTE: only log streaming needs these, which take a while to import:
+        import asyncio
+        import websockets
+
         async def nested():
             async with websockets.connect(url, extra_headers=headers) as ws:
                 while True:
@@ -162,17 +173,37 @@ class LoggingClient(object):
         }
         resource = "logs/%s/" % app
         url = self._construct_url(resource, args)
-        with requests.get(url, headers=headers, stream=True) as r:
-            r.raise_for_status()
-            with open(to, 'wb') as fd:
-                for chunk in r.iter_content(chunk_size=8192):
-                    if chunk:
-                        fd.write(chunk)
+        started_at = time.time()
+        start = time.perf_counter()
+        r = None
+        size = 0
+        try:
+            with requests.get(url, headers=headers, stream=True) as r:
+                r.raise_for_status()
+                with open(to, 'wb') as fd:
+                    for chunk in r.iter_content(chunk_size=8192):
+                        if chunk:
+                            fd.write(chunk)
+                            size += len(chunk)
+        except Exception as ex:
+            self._record(
+                "GET", "/logs/{app}/", started_at, start, resp=r, error=ex)
+            raise
+        self._record(
+            "GET", "/logs/{app}/", started_at, start, resp=r,
+            response_bytes=size)
 
     def list_logs(self):
         headers = self._auth_headers
         url = self._construct_url("logs/")
-        req = requests.get(url, headers=headers)
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            req = requests.get(url, headers=headers)
+        except Exception as ex:
+            self._record("GET", "/logs/", started_at, start, error=ex)
+            raise
+        self._record("GET", "/logs/", started_at, start, resp=req)
         req.raise_for_status()
         ret = req.json()
         return ret.get("logs", [])
@@ -184,10 +215,13 @@ class CoriolisLogger(base.Resource):
 
 class CoriolisLogDownloadManager(base.BaseManager):
     resource_class = CoriolisLogger
+    # NOTE: get() downloads logs:
+    _get_bulk_item = None
 
     def __init__(self, api):
         super(CoriolisLogDownloadManager, self).__init__(api)
-        self._coriolis_cli = LoggingClient(api)
+        self._coriolis_cli = LoggingClient(
+            api, instrumentation=getattr(api, 'instrumentation', None))
 
     def list(self):
         logs = self._coriolis_cli.list_logs()
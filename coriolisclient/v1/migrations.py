@@ -13,7 +13,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import functools
+
 from coriolisclient import base
+from coriolisclient import constants
+from coriolisclient import polling
+from coriolisclient import scheduling
 from coriolisclient.v1 import common
 
 
@@ -24,26 +30,26 @@ class Migration(base.Resource):
     def source_environment(self):
         source_env = self._info.get("source_environment")
         if source_env is not None:
-            return common.SourceEnvironment(None, source_env, loaded=True)
+            return self._nested_resource(
+                common.SourceEnvironment, source_env)
 
     @property
     def destination_environment(self):
         dest_env = self._info.get("destination_environment")
         if dest_env is not None:
-            return common.DestinationEnvironment(None, dest_env, loaded=True)
+            return self._nested_resource(
+                common.DestinationEnvironment, dest_env)
 
     @property
     def transfer_result(self):
         res = self._info.get("transfer_result")
         if res is not None:
-            return common.TransferResult(None, res, loaded=True)
+            return self._nested_resource(common.TransferResult, res)
 
     @property
     def tasks(self):
-        if self._info.get('tasks') is None:
-            self.get()
-        return [common.Task(None, d, loaded=True) for d in
-                self._info.get('tasks', [])]
+        return [self._nested_resource(common.Task, d) for d in
+                self._get_detail('tasks') or []]
 
 
 class MigrationManager(base.BaseManager):
@@ -58,9 +64,65 @@ class MigrationManager(base.BaseManager):
             path = "%s/detail" % path
         return self._list(path, 'migrations')
 
+    def list_iter(self, detail=False):
+        """Yields the migrations one by one as they are being received.
+
+        Unlike `list()`, the response is decoded incrementally so memory
+        use stays flat no matter how many migrations there are.
+        """
+        path = "/migrations"
+        if detail:
+            path = "%s/detail" % path
+        return self._list_iter(path, 'migrations')
+
     def get(self, migration):
         return self._get('/migrations/%s' % base.getid(migration), 'migration')
 
+    def wait_for(self, migration, timeout=None, cancel_event=None,
+                 min_interval=polling.DEFAULT_MIN_INTERVAL,
+                 max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Waits for the migration to reach a final status.
+
+        The polling interval backs off exponentially while none of the
+        migration's tasks change status or report progress.
+
+        :param timeout: seconds after which to give up, or None
+        :param cancel_event: `threading.Event` which aborts waiting when set
+        :returns: the migration in its final status
+        :raises: exceptions.WaitTimeout, exceptions.WaitCanceled
+        """
+        return polling.wait_for(
+            functools.partial(self.get, migration),
+            self.get_waiter(timeout, min_interval, max_interval),
+            cancel_event=cancel_event)
+
+    def watch(self, migrations, timeout=None, cancel_event=None,
+              min_interval=polling.DEFAULT_MIN_INTERVAL,
+              max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Yields the status changes of many migrations as they happen.
+
+        All the migrations are polled at once by listing them, instead of
+        getting each one of them.
+
+        :param migrations: migrations or migration IDs to watch
+        :returns: generator of `polling.StatusChange`, ending once all the
+            migrations finished
+        """
+        return polling.watch(
+            self.list, [base.getid(m) for m in migrations],
+            self.get_waiter(timeout, min_interval, max_interval),
+            cancel_event=cancel_event)
+
+    def get_waiter(self, timeout=None,
+                   min_interval=polling.DEFAULT_MIN_INTERVAL,
+                   max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Returns a `polling.Waiter` suited for migrations."""
+        return polling.Waiter(
+            constants.FINALIZED_MIGRATION_STATUSES, timeout=timeout,
+            get_progress=polling.get_tasks_progress,
+            get_status=polling.get_migration_status,
+            min_interval=min_interval, max_interval=max_interval)
+
     def create(self, origin_endpoint_id, destination_endpoint_id,
                source_environment, destination_environment, instances,
                network_map=None, notes=None, storage_mappings=None,
@@ -116,6 +178,76 @@ class MigrationManager(base.BaseManager):
                 instance_osmorphing_minion_pool_mappings)
         return self._post('/migrations', data, 'migration')
 
+    def deploy_many(self, replicas, clone_disks=True, force=False,
+                    skip_os_morphing=False, user_scripts=None,
+                    instance_osmorphing_minion_pool_mappings=None,
+                    max_running=None, timeout=None, cancel_event=None,
+                    min_interval=polling.DEFAULT_MIN_INTERVAL,
+                    max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Deploys migrations from many replicas, throttled by minion pools.
+
+        Each instance being OSMorphed holds a minion of the minion pool it
+        is mapped to, so migrations are only started for as long as the
+        OSMorphing minion pools have enough minions left (as per their
+        `maximum_minions`). A new migration is started whenever a running
+        one finishes, all of them being polled with a single listing per
+        cycle.
+
+        :param replicas: replicas or replica IDs to deploy
+        :param instance_osmorphing_minion_pool_mappings: OSMorphing minion
+            pools by instance, overriding the ones of the replicas
+        :param max_running: maximum number of running migrations overall
+        :param timeout: seconds after which to stop waiting, or None
+        :param cancel_event: `threading.Event` which stops starting and
+            waiting for migrations when set
+        :returns: generator of `bulk.BulkResult` in order of completion,
+            whose result is the finished migration. Migrations are only
+            started as the generator is iterated.
+        :raises: exceptions.FleetWaitTimeout, exceptions.WaitCanceled
+        """
+        replicas = list(replicas)
+        scheduler = self._get_scheduler(
+            self._get_infos_by_id(replicas, '/replicas', 'replicas'),
+            self._get_json('/minion_pools'), clone_disks, force,
+            skip_os_morphing, user_scripts,
+            instance_osmorphing_minion_pool_mappings, max_running,
+            self.get_waiter(timeout, min_interval, max_interval))
+        for _, result in scheduler.run(replicas, cancel_event=cancel_event):
+            yield result
+
+    def _get_scheduler(self, replica_infos, minion_pools_body, clone_disks,
+                       force, skip_os_morphing, user_scripts,
+                       instance_osmorphing_minion_pool_mappings,
+                       max_running, waiter):
+        """Returns the scheduler of the migrations of `deploy_many()`."""
+        pool_sizes = {
+            pool.get('id'): pool.get('maximum_minions')
+            for pool in minion_pools_body.get('minion_pools', [])}
+
+        def _get_demands(replica):
+            if skip_os_morphing:
+                return {}
+            info = replica_infos.get(base.getid(replica)) or {}
+            pool_mappings = dict(
+                info.get('instance_osmorphing_minion_pool_mappings') or {})
+            pool_mappings.update(
+                instance_osmorphing_minion_pool_mappings or {})
+            return collections.Counter(
+                pool_mappings[instance]
+                for instance in info.get('instances') or []
+                if pool_mappings.get(instance))
+
+        def _deploy(replica):
+            return self.create_from_replica(
+                base.getid(replica), clone_disks=clone_disks, force=force,
+                skip_os_morphing=skip_os_morphing, user_scripts=user_scripts,
+                instance_osmorphing_minion_pool_mappings=(
+                    instance_osmorphing_minion_pool_mappings))
+
+        return scheduling.SlidingWindowScheduler(
+            _deploy, self.list, waiter, get_demands=_get_demands,
+            get_capacity=pool_sizes.get, max_running=max_running)
+
     def delete(self, migration):
         return self._delete('/migrations/%s' % base.getid(migration))
 
@@ -13,7 +13,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+
 from coriolisclient import base
+from coriolisclient import constants
+from coriolisclient import polling
 
 
 class MinionPool(base.Resource):
@@ -34,6 +38,47 @@ class MinionPoolManager(base.BaseManager):
             '/minion_pools/%s' % base.getid(minion_pool),
             response_key='minion_pool')
 
+    def wait_for(self, minion_pool, timeout=None, cancel_event=None,
+                 min_interval=polling.DEFAULT_MIN_INTERVAL,
+                 max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Waits for the minion pool to reach a final status.
+
+        Useful after allocating or deallocating the pool. Polling gets
+        less frequent over time, until new pool events are reported.
+
+        :param timeout: seconds after which to give up, or None
+        :param cancel_event: `threading.Event` which aborts waiting when set
+        :returns: the minion pool in its final status
+        :raises: exceptions.WaitTimeout, exceptions.WaitCanceled
+        """
+        return polling.wait_for(
+            functools.partial(self.get, minion_pool),
+            self.get_waiter(timeout, min_interval, max_interval),
+            cancel_event=cancel_event)
+
+    def watch(self, minion_pools, timeout=None, cancel_event=None,
+              min_interval=polling.DEFAULT_MIN_INTERVAL,
+              max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Yields the status changes of many minion pools as they happen.
+
+        :param minion_pools: minion pools or minion pool IDs to watch
+        :returns: generator of `polling.StatusChange`, ending once all the
+            minion pools reached a final status
+        """
+        return polling.watch(
+            self.list, [base.getid(p) for p in minion_pools],
+            self.get_waiter(timeout, min_interval, max_interval),
+            cancel_event=cancel_event)
+
+    def get_waiter(self, timeout=None,
+                   min_interval=polling.DEFAULT_MIN_INTERVAL,
+                   max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Returns a `polling.Waiter` suited for minion pools."""
+        return polling.Waiter(
+            constants.FINALIZED_MINION_POOL_STATUSES, timeout=timeout,
+            get_progress=polling.get_events_progress,
+            min_interval=min_interval, max_interval=max_interval)
+
     def create(
             self, name, endpoint, platform, os_type,
             environment_options,
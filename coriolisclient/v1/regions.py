@@ -14,6 +14,12 @@
 # limitations under the License.
 
 from coriolisclient import base
+from coriolisclient import cache
+
+
+_REGION_KEY_FUNCS = {
+    'id': lambda region: getattr(region, 'id', None),
+    'name': lambda region: getattr(region, 'name', None)}
 
 
 class Region(base.Resource):
@@ -25,6 +31,7 @@ class RegionManager(base.BaseManager):
 
     def __init__(self, api):
         super(RegionManager, self).__init__(api)
+        self._index = cache.ListingIndex(self.list, _REGION_KEY_FUNCS)
 
     def list(self):
         return self._list('/regions', 'regions')
@@ -39,27 +46,52 @@ class RegionManager(base.BaseManager):
         if enabled is not None:
             data['enabled'] = enabled
 
-        return self._post('/regions', {'region': data}, 'region')
+        region = self._post('/regions', {'region': data}, 'region')
+        self._index.invalidate()
+        return region
 
     def update(self, region, updated_values):
         data = {
             "region": updated_values
         }
-        return self._put(
+        region = self._put(
             '/regions/%s' % base.getid(region), data, 'region')
+        self._index.invalidate()
+        return region
 
     def delete(self, region):
-        return self._delete('/regions/%s' % base.getid(region))
+        resp = self._delete('/regions/%s' % base.getid(region))
+        self._index.invalidate()
+        return resp
 
     def get_region_by_name_or_id(
             self, region_name_or_id, regions_cache=None,
             raise_on_not_found=True):
 
         if not regions_cache:
-            regions_cache = self.list()
-        id_matches = [
-            region for region in regions_cache
-            if region.id == region_name_or_id]
+            # NOTE: the indexed listing is reused across lookups, so that
+            # resolving many regions only lists them once:
+            return self._lookup_region_by_name_or_id(
+                self._index.get_tables(lookup_keys=[
+                    ('id', region_name_or_id),
+                    ('name', region_name_or_id)]),
+                region_name_or_id,
+                raise_on_not_found=raise_on_not_found)
+        return self._match_region_by_name_or_id(
+            regions_cache, region_name_or_id,
+            raise_on_not_found=raise_on_not_found)
+
+    @classmethod
+    def _match_region_by_name_or_id(
+            cls, regions_cache, region_name_or_id, raise_on_not_found=True):
+        return cls._lookup_region_by_name_or_id(
+            cache.build_lookup_tables(regions_cache, _REGION_KEY_FUNCS),
+            region_name_or_id, raise_on_not_found=raise_on_not_found)
+
+    @staticmethod
+    def _lookup_region_by_name_or_id(
+            tables, region_name_or_id, raise_on_not_found=True):
+        id_matches = tables['id'].get(region_name_or_id, [])
         if id_matches:
             if len(id_matches) > 1:
                 raise ValueError(
@@ -67,9 +99,7 @@ class RegionManager(base.BaseManager):
                         region_name_or_id, id_matches))
             return id_matches[0]
 
-        name_matches = [
-            region for region in regions_cache
-            if region.name == region_name_or_id]
+        name_matches = tables['name'].get(region_name_or_id, [])
         if name_matches:
             if len(name_matches) > 1:
                 raise ValueError(
@@ -13,7 +13,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+
 from coriolisclient import base
+from coriolisclient import constants
+from coriolisclient import polling
+from coriolisclient import scheduling
 from coriolisclient.v1 import common
 
 
@@ -22,10 +27,11 @@ class ReplicaExecution(base.Resource):
 
     @property
     def tasks(self):
-        if self._info.get('tasks') is None:
-            self.manager.get(self._info.get("action_id"), self.id)
-        return [common.Task(None, d, loaded=True) for d in
-                self._info.get('tasks', [])]
+        return [self._nested_resource(common.Task, d) for d in
+                self._get_detail('tasks') or []]
+
+    def _fetch(self):
+        return self.manager.get(self._info.get("action_id"), self.id)
 
 
 class ReplicaExecutionManager(base.BaseManager):
@@ -45,11 +51,140 @@ class ReplicaExecutionManager(base.BaseManager):
              "execution_id": base.getid(execution)},
             'execution')
 
+    def _get_bulk_item(self, item):
+        # NOTE: items of `get_many()` are (replica, execution) pairs:
+        replica, execution = item
+        return self.get(replica, execution)
+
+    def wait_for(self, replica, execution, timeout=None, cancel_event=None,
+                 min_interval=polling.DEFAULT_MIN_INTERVAL,
+                 max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Waits for the execution to reach a final status.
+
+        Polls with an exponentially growing interval, which drops back to
+        `min_interval` whenever the execution makes progress.
+
+        :param timeout: seconds after which to give up, or None
+        :param cancel_event: `threading.Event` which aborts waiting when set
+        :returns: the execution in its final status
+        :raises: exceptions.WaitTimeout, exceptions.WaitCanceled
+        """
+        return polling.wait_for(
+            functools.partial(self.get, replica, execution),
+            self.get_waiter(timeout, min_interval, max_interval),
+            cancel_event=cancel_event)
+
+    def list_all(self):
+        """Lists the executions of all the replicas at once."""
+        return self._list_all_from_body(self._get_json('/replicas/detail'))
+
+    def _list_all_from_body(self, body):
+        executions = []
+        for replica in body.get('replicas', []):
+            for execution in replica.get('executions') or []:
+                info = dict(execution)
+                info.setdefault('action_id', replica.get('id'))
+                executions.append(
+                    self.resource_class(self, info, loaded=True))
+        return executions
+
+    def watch(self, executions, timeout=None, cancel_event=None,
+              min_interval=polling.DEFAULT_MIN_INTERVAL,
+              max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Yields the status changes of many executions as they happen.
+
+        Executions of any replica can be watched together, as a single
+        detailed replicas listing is issued per polling cycle.
+
+        :param executions: executions or execution IDs to watch
+        :returns: generator of `polling.StatusChange`, ending once all the
+            executions finished
+        """
+        return polling.watch(
+            self.list_all, [base.getid(e) for e in executions],
+            self.get_waiter(timeout, min_interval, max_interval),
+            cancel_event=cancel_event)
+
+    def get_waiter(self, timeout=None,
+                   min_interval=polling.DEFAULT_MIN_INTERVAL,
+                   max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Returns a `polling.Waiter` suited for executions."""
+        return polling.Waiter(
+            constants.FINALIZED_EXECUTION_STATUSES, timeout=timeout,
+            get_progress=polling.get_tasks_progress,
+            min_interval=min_interval, max_interval=max_interval)
+
     def create(self, replica, shutdown_instances=False):
         data = {"execution": {"shutdown_instances": shutdown_instances}}
         return self._post(
             '/replicas/%s/executions' % base.getid(replica), data, 'execution')
 
+    def execute_many(self, replicas, max_running=None,
+                     max_per_origin_endpoint=None,
+                     max_per_destination_endpoint=None,
+                     max_per_minion_pool=None, shutdown_instances=False,
+                     timeout=None, cancel_event=None,
+                     min_interval=polling.DEFAULT_MIN_INTERVAL,
+                     max_interval=polling.DEFAULT_MAX_INTERVAL):
+        """Executes many replicas, in waves bounded by concurrency caps.
+
+        Executions are started in order for as long as the caps allow, and
+        a new one is started whenever a running one finishes. All running
+        executions are polled with a single replicas listing per cycle.
+
+        :param replicas: replicas or replica IDs to execute
+        :param max_running: maximum number of running executions overall
+        :param max_per_origin_endpoint: maximum number of running executions
+            per origin endpoint
+        :param max_per_destination_endpoint: maximum number of running
+            executions per destination endpoint
+        :param max_per_minion_pool: maximum number of running executions
+            using the same origin or destination minion pool
+        :param timeout: seconds after which to stop waiting, or None
+        :param cancel_event: `threading.Event` which stops starting and
+            waiting for executions when set
+        :returns: generator of `bulk.BulkResult` in order of completion,
+            whose result is the finished execution. Executions are only
+            started as the generator is iterated.
+        :raises: exceptions.FleetWaitTimeout, exceptions.WaitCanceled
+        """
+        replicas = list(replicas)
+        scheduler = self._get_scheduler(
+            self._get_infos_by_id(replicas, '/replicas', 'replicas'),
+            max_running, max_per_origin_endpoint,
+            max_per_destination_endpoint, max_per_minion_pool,
+            shutdown_instances,
+            self.get_waiter(timeout, min_interval, max_interval))
+        for _, result in scheduler.run(replicas, cancel_event=cancel_event):
+            yield result
+
+    def _get_scheduler(self, replica_infos, max_running,
+                       max_per_origin_endpoint, max_per_destination_endpoint,
+                       max_per_minion_pool, shutdown_instances, waiter):
+        """Returns the scheduler of the executions of `execute_many()`."""
+        capacities = {
+            'origin_endpoint': max_per_origin_endpoint,
+            'destination_endpoint': max_per_destination_endpoint,
+            'minion_pool': max_per_minion_pool}
+
+        def _get_demands(replica):
+            info = replica_infos.get(base.getid(replica)) or {}
+            demands = {}
+            for resource_type, key in [
+                    ('origin_endpoint', 'origin_endpoint_id'),
+                    ('destination_endpoint', 'destination_endpoint_id'),
+                    ('minion_pool', 'origin_minion_pool_id'),
+                    ('minion_pool', 'destination_minion_pool_id')]:
+                if info.get(key):
+                    demands[(resource_type, info[key])] = 1
+            return demands
+
+        return scheduling.SlidingWindowScheduler(
+            lambda replica: self.create(replica, shutdown_instances),
+            self.list_all, waiter, get_demands=_get_demands,
+            get_capacity=lambda resource: capacities[resource[0]],
+            max_running=max_running)
+
     def delete(self, replica, execution):
         return self._delete(
             '/replicas/%(replica_id)s/executions/%(execution_id)s' %
@@ -45,6 +45,11 @@ class ReplicaScheduleManager(base.BaseManager):
              "schedule_id": base.getid(schedule)},
             'schedule')
 
+    def _get_bulk_item(self, item):
+        # NOTE: items of `get_many()` are (replica, schedule) pairs:
+        replica, schedule = item
+        return self.get(replica, schedule)
+
     def create(self, replica, schedule, enabled, expiration_date,
                shutdown_instance):
         data = {
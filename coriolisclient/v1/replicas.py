@@ -14,7 +14,10 @@
 # limitations under the License.
 
 from coriolisclient import base
+from coriolisclient import bulk
+from coriolisclient import ratelimit
 from coriolisclient.v1 import common
+from coriolisclient.v1 import endpoints
 from coriolisclient.v1 import replica_executions
 
 
@@ -25,27 +28,29 @@ class Replica(base.Resource):
     def source_environment(self):
         source_env = self._info.get("source_environment")
         if source_env is not None:
-            return common.SourceEnvironment(None, source_env, loaded=True)
+            return self._nested_resource(
+                common.SourceEnvironment, source_env)
 
     @property
     def destination_environment(self):
         dest_env = self._info.get("destination_environment")
         if dest_env is not None:
-            return common.DestinationEnvironment(None, dest_env, loaded=True)
+            return self._nested_resource(
+                common.DestinationEnvironment, dest_env)
 
     @property
     def executions(self):
-        if self._info.get('executions') is None:
-            self.get()
-        return [common.TasksExecution(None, d, loaded=True) for d in
-                self._info.get('executions', [])]
+        return [self._nested_resource(common.TasksExecution, d) for d in
+                self._get_detail('executions') or []]
 
 
 class ReplicaManager(base.BaseManager):
     resource_class = Replica
 
-    def __init__(self, api):
+    def __init__(self, api, endpoint_manager=None):
         super(ReplicaManager, self).__init__(api)
+        self._endpoint_manager = (
+            endpoint_manager or endpoints.EndpointManager(api))
 
     def list(self, detail=False):
         path = "/replicas"
@@ -53,6 +58,17 @@ class ReplicaManager(base.BaseManager):
             path = "%s/detail" % path
         return self._list(path, 'replicas')
 
+    def list_iter(self, detail=False):
+        """Yields the replicas one by one as they are being received.
+
+        Unlike `list()`, the response is decoded incrementally so memory
+        use stays flat no matter how many replicas there are.
+        """
+        path = "/replicas"
+        if detail:
+            path = "%s/detail" % path
+        return self._list_iter(path, 'replicas')
+
     def get(self, replica):
         return self._get('/replicas/%s' % base.getid(replica), 'replica')
 
@@ -92,6 +108,70 @@ class ReplicaManager(base.BaseManager):
 
         return self._post('/replicas', data, 'replica')
 
+    def create_many(self, replicas, max_workers=bulk.DEFAULT_MAX_WORKERS,
+                    requests_per_second=None):
+        """Creates many replicas concurrently.
+
+        The origin and destination endpoints may be given by name, each
+        distinct name being resolved only once.
+
+        :param replicas: list of dicts of `create()` arguments, one per
+            replica
+        :param max_workers: maximum number of concurrent requests
+        :param requests_per_second: maximum rate of creation requests, or
+            None for no limit
+        :returns: list of `bulk.BulkResult`, in the same order as `replicas`
+        """
+        endpoint_ids = self._resolve_endpoint_names(replicas)
+        bucket = None
+        if requests_per_second:
+            bucket = ratelimit.TokenBucket(requests_per_second)
+
+        def _create(kwargs):
+            kwargs = self._get_create_kwargs(kwargs, endpoint_ids)
+            if bucket is not None:
+                bucket.acquire()
+            return self.create(**kwargs)
+
+        return bulk.run_bulk(_create, replicas, max_workers=max_workers)
+
+    @staticmethod
+    def _get_endpoint_names(replicas):
+        """Returns the distinct endpoint names or IDs of the replicas."""
+        names = {}
+        for kwargs in replicas:
+            for key in ('origin_endpoint_id', 'destination_endpoint_id'):
+                if kwargs.get(key) is not None:
+                    names.setdefault(kwargs[key])
+        return list(names)
+
+    @staticmethod
+    def _get_create_kwargs(kwargs, endpoint_ids):
+        """Returns the `create()` arguments with the endpoint IDs resolved.
+
+        :raises: the error of the endpoint lookups which failed
+        """
+        kwargs = dict(kwargs)
+        for key in ('origin_endpoint_id', 'destination_endpoint_id'):
+            if kwargs.get(key) is None:
+                continue
+            endpoint_id = endpoint_ids[kwargs[key]]
+            if isinstance(endpoint_id, Exception):
+                raise endpoint_id
+            kwargs[key] = endpoint_id
+        return kwargs
+
+    def _resolve_endpoint_names(self, replicas):
+        """Maps each endpoint name or ID to its ID, or to the lookup error."""
+        endpoint_ids = {}
+        for endpoint in self._get_endpoint_names(replicas):
+            try:
+                endpoint_ids[endpoint] = (
+                    self._endpoint_manager.get_endpoint_id_for_name(endpoint))
+            except Exception as ex:
+                endpoint_ids[endpoint] = ex
+        return endpoint_ids
+
     def delete(self, replica):
         return self._delete('/replicas/%s' % base.getid(replica))
 
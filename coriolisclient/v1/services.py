@@ -14,6 +14,12 @@
 # limitations under the License.
 
 from coriolisclient import base
+from coriolisclient import cache
+
+
+_SERVICE_KEY_FUNCS = {
+    'host_topic': lambda service: (
+        getattr(service, 'host', None), getattr(service, 'topic', None))}
 
 
 class Service(base.Resource):
@@ -25,6 +31,7 @@ class ServiceManager(base.BaseManager):
 
     def __init__(self, api):
         super(ServiceManager, self).__init__(api)
+        self._index = cache.ListingIndex(self.list, _SERVICE_KEY_FUNCS)
 
     def list(self):
         return self._list('/services', 'services')
@@ -41,23 +48,39 @@ class ServiceManager(base.BaseManager):
         if enabled is not None:
             data['enabled'] = enabled
 
-        return self._post('/services', {'service': data}, 'service')
+        service = self._post('/services', {'service': data}, 'service')
+        self._index.invalidate()
+        return service
 
     def update(self, service, updated_values):
         data = {
             "service": updated_values
         }
-        return self._put(
+        service = self._put(
             '/services/%s' % base.getid(service), data, 'service')
+        self._index.invalidate()
+        return service
 
     def delete(self, service):
-        return self._delete('/services/%s' % base.getid(service))
+        resp = self._delete('/services/%s' % base.getid(service))
+        self._index.invalidate()
+        return resp
 
     def find_service_by_host_and_topic(self, host, topic):
-        services = self.list()
-        matches = [
-            svc for svc in services
-            if svc.host == host and svc.topic == topic]
+        return self._lookup_service_by_host_and_topic(
+            self._index.get_tables(
+                lookup_keys=[('host_topic', (host, topic))]),
+            host, topic)
+
+    @classmethod
+    def _match_service_by_host_and_topic(cls, services, host, topic):
+        return cls._lookup_service_by_host_and_topic(
+            cache.build_lookup_tables(services, _SERVICE_KEY_FUNCS),
+            host, topic)
+
+    @staticmethod
+    def _lookup_service_by_host_and_topic(tables, host, topic):
+        matches = tables['host_topic'].get((host, topic), [])
         if not matches:
             raise ValueError(
                 "No Service with the host/topic %s/%s was found." % (
@@ -1,7 +1,6 @@
 """ Module showcasing various operations relating to Coriolis Replicas. """
 
 import json
-import time
 
 from keystoneauth1.identity import v3
 from keystoneauth1 import session as ksession
@@ -152,28 +151,14 @@ def get_errord_replicas(coriolis):
     return errord
 
 
-def wait_for_replica_execution(coriolis, replica, execution,
-                               max_tries=600, retry_period=5):
+def wait_for_replica_execution(coriolis, replica, execution, timeout=3000):
     """ Waits for a maximum amount of time for a given execution to finish.
 
     :param execution: Replica Execution object
-    :param max_tries: maximum number of state queries before giving up
-    :param retry_period: time to wait between retries
+    :param timeout: maximum number of seconds to wait for
     """
-    tries = 0
-
-    execution = coriolis.replica_executions.get(
-        replica, execution)
-    while tries < max_tries and execution.status == "RUNNING":
-        print("Waiting on execution %s (currently %s)" % (
-            execution.id, execution.status))
-        time.sleep(retry_period)
-        execution = coriolis.replica_executions.get(
-            replica, execution)
-
-        if execution.status == "ERROR":
-            break
-        tries = tries + 1
+    execution = coriolis.replica_executions.wait_for(
+        replica, execution, timeout=timeout)
 
     if execution.status != "COMPLETED":
         raise Exception(
@@ -183,26 +168,13 @@ def wait_for_replica_execution(coriolis, replica, execution,
     return execution
 
 
-def wait_for_replica_migration(coriolis, migration, max_tries=600,
-                               retry_period=5):
+def wait_for_replica_migration(coriolis, migration, timeout=3000):
     """ Waits for a maximum amount of time for a given Migration to finish.
 
     :param migration_id: Migration object/ID
-    :param max_tries: maximum number of state queries before giving up
-    :param retry_period: time to wait between retries
+    :param timeout: maximum number of seconds to wait for
     """
-    tries = 0
-
-    migration = coriolis.migrations.get(migration)
-    while tries < max_tries and migration.status == "RUNNING":
-        print("Waiting on migration %s (currently %s)" % (
-            migration.id, migration.status))
-        time.sleep(retry_period)
-        migration = coriolis.migrations.get(migration)
-
-        if migration.status == "ERROR":
-            break
-        tries = tries + 1
+    migration = coriolis.migrations.wait_for(migration, timeout=timeout)
 
     if migration.status != "COMPLETED":
         raise Exception(